@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from app.domain.entities.order import Order
+
+
+class OrderAnalytics(ABC):
+    @abstractmethod
+    def add_orders(self, orders: Iterable[Order]) -> None:
+        pass
+
+    @abstractmethod
+    def remove_orders(self, order_ids: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,80 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class BaseCache(ABC):
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.version = 0
+        self.__in_flight: Dict[Tuple[int, str], asyncio.Future] = {}
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+    async def invalidate(self) -> None:
+        self.version += 1
+        await self.clear()
+
+    async def get_or_set(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        value = await self.get(key)
+
+        if value is not None:
+            self.hits += 1
+            return value
+
+        version = self.version
+        in_flight = self.__in_flight.get((version, key))
+
+        if in_flight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(in_flight)
+
+        self.misses += 1
+
+        future = asyncio.get_running_loop().create_future()
+        self.__in_flight[(version, key)] = future
+
+        try:
+            value = await factory()
+
+            if version == self.version:
+                await self.set(key, value)
+        except Exception as exception:
+            future.set_exception(exception)
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            del self.__in_flight[(version, key)]
+
+        return value
+
+    async def close(self) -> None:
+        pass
+
+    def get_stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,6 @@
+from . import BaseCache
+
+
+class CategoryIdsCache(BaseCache):
+    def get_key(self) -> str:
+        return "category_ids"
@@ -0,0 +1,16 @@
+from datetime import date
+from typing import Any
+
+from . import BaseCache
+
+
+class DashboardMetricsCache(BaseCache):
+    def get_key(self, *parts: Any) -> str:
+        return ":".join(
+            (
+                ""
+                if part is None
+                else part.isoformat() if isinstance(part, date) else str(part)
+            )
+            for part in parts
+        )
@@ -0,0 +1,45 @@
+from typing import Awaitable, Callable, Dict, List
+
+from app.domain.entities.order_item import OrderItem
+from . import BaseCache
+
+
+class ProductItemsCache(BaseCache):
+    async def get_many(
+        self,
+        product_ids: List[str],
+        loader: Callable[[List[str]], Awaitable[List[OrderItem]]],
+    ) -> Dict[str, OrderItem]:
+        items = {}
+        missing_product_ids = []
+
+        for product_id in set(product_ids):
+            item = await self.get(product_id)
+
+            if item is None:
+                missing_product_ids.append(product_id)
+            else:
+                items[product_id] = item
+
+        self.hits += len(items)
+        self.misses += len(missing_product_ids)
+
+        if len(missing_product_ids) > 0:
+            version = self.version
+            loaded_items = await loader(missing_product_ids)
+
+            for item in loaded_items:
+                if version == self.version:
+                    await self.set(item.product_id, item)
+
+                items[item.product_id] = item
+
+        return items
+
+    async def update(self, item: OrderItem) -> None:
+        self.version += 1
+        await self.set(item.product_id, item)
+
+    async def remove(self, product_id: str) -> None:
+        self.version += 1
+        await self.delete(product_id)
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+
+@dataclass
+class ChangeEvent:
+    collection: Optional[str]
+    operation: str
+    document_id: Optional[Any] = None
+    document: Optional[dict] = None
+
+
+class ChangeEventConsumer(ABC):
+    @abstractmethod
+    async def handle(self, events: List[ChangeEvent]) -> None:
+        pass
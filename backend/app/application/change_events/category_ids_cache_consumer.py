@@ -0,0 +1,13 @@
+from typing import List
+
+from app.application.cache.category_ids_cache import CategoryIdsCache
+from . import ChangeEvent, ChangeEventConsumer
+
+
+class CategoryIdsCacheChangeConsumer(ChangeEventConsumer):
+    def __init__(self, category_ids_cache: CategoryIdsCache):
+        self.category_ids_cache = category_ids_cache
+
+    async def handle(self, events: List[ChangeEvent]) -> None:
+        if any(event.collection != "orders" for event in events):
+            await self.category_ids_cache.invalidate()
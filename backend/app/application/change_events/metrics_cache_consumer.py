@@ -0,0 +1,13 @@
+from typing import List
+
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from . import ChangeEvent, ChangeEventConsumer
+
+
+class MetricsCacheChangeConsumer(ChangeEventConsumer):
+    def __init__(self, metrics_cache: DashboardMetricsCache):
+        self.metrics_cache = metrics_cache
+
+    async def handle(self, events: List[ChangeEvent]) -> None:
+        if len(events) > 0:
+            await self.metrics_cache.invalidate()
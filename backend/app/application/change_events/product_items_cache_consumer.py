@@ -0,0 +1,19 @@
+from typing import List
+
+from app.application.cache.product_items_cache import ProductItemsCache
+from . import ChangeEvent, ChangeEventConsumer
+
+
+class ProductItemsCacheChangeConsumer(ChangeEventConsumer):
+    def __init__(self, product_items_cache: ProductItemsCache):
+        self.product_items_cache = product_items_cache
+
+    async def handle(self, events: List[ChangeEvent]) -> None:
+        for event in events:
+            if event.collection != "products":
+                continue
+
+            if event.document_id is None:
+                await self.product_items_cache.invalidate()
+            else:
+                await self.product_items_cache.remove(event.document_id)
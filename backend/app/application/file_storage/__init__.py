@@ -8,6 +8,13 @@ class BaseFileStorage(ABC):
     async def put(self, key: str, file: File) -> str:
         pass
 
+    @abstractmethod
+    async def get(self, key: str) -> bytes:
+        pass
+
     @abstractmethod
     async def delete(self, key: str):
         pass
+
+    def close(self) -> None:
+        pass
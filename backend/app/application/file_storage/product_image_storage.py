@@ -2,4 +2,8 @@ from . import BaseFileStorage
 
 
 class ProductImageFileStorage(BaseFileStorage):
-    pass
+    def get_variant_key(self, product_id: str, image_version: str, variant: str) -> str:
+        if not image_version:
+            return f"{product_id}/{variant}"
+
+        return f"{product_id}/{image_version}/{variant}"
@@ -0,0 +1,6 @@
+from . import BaseFileStorage
+
+
+class ReportFileStorage(BaseFileStorage):
+    def get_report_key(self, report: str, partition: str) -> str:
+        return f"sales/{report}/{partition}.csv.gz"
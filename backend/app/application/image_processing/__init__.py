@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import Dict
+
+from app.application.schemas.image_file import File
+
+
+class ImageProcessor(ABC):
+    @abstractmethod
+    async def create_variants(self, content: bytes) -> Dict[str, File]:
+        pass
+
+    def close(self) -> None:
+        pass
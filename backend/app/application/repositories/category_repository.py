@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set
 
+from app.application.schemas.page import PageSchema
 from app.domain.entities.category import Category
 
 
@@ -17,6 +18,15 @@ class CategoryRepository(ABC):
     async def get_all(self) -> List[Category]:
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[str],
+        fields: Optional[List[str]],
+    ) -> PageSchema:
+        pass
+
     @abstractmethod
     async def update(self, category: Category) -> Category:
         pass
@@ -26,5 +36,5 @@ class CategoryRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_existing_ids(self, category_ids: List[str]) -> List[str]:
+    async def get_existing_ids(self, category_ids: List[str]) -> Set[str]:
         pass
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+
+from app.domain.entities.order import Order
+from app.domain.entities.product import Product
+
+
+class DailySalesRepository(ABC):
+    @abstractmethod
+    async def add_order(self, order: Order) -> None:
+        pass
+
+    @abstractmethod
+    async def add_orders(self, orders: List[Order]) -> None:
+        pass
+
+    @abstractmethod
+    async def remove_order(self, order: Order) -> None:
+        pass
+
+    @abstractmethod
+    async def remove_product(self, product: Product) -> None:
+        pass
+
+    @abstractmethod
+    async def rebuild(
+        self, start_date: Optional[date], end_date: Optional[date]
+    ) -> int:
+        pass
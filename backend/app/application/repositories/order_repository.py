@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
-from app.application.schemas.dashboard import DashboardMetricsSchema
+from app.application.schemas.dashboard import DashboardMetricsSchema, Granularity
+from app.application.schemas.page import PageSchema
 from app.domain.entities.order import Order
 
 
@@ -11,6 +12,10 @@ class OrderRepository(ABC):
     async def create(self, order: Order) -> Order:
         pass
 
+    @abstractmethod
+    async def bulk_create(self, orders: List[Order]) -> Dict[str, str]:
+        pass
+
     @abstractmethod
     async def get_by_id(self, order_id: str) -> Optional[Order]:
         pass
@@ -19,6 +24,16 @@ class OrderRepository(ABC):
     async def get_all(self) -> List[Order]:
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[str],
+        fields: Optional[List[str]],
+        sort_by: str,
+    ) -> PageSchema:
+        pass
+
     @abstractmethod
     async def update(self, order: Order) -> Order:
         pass
@@ -31,12 +46,27 @@ class OrderRepository(ABC):
     async def delete(self, order_id: str) -> None:
         pass
 
+    @abstractmethod
+    async def remove_product(self, product_id: str, price: float) -> int:
+        pass
+
     @abstractmethod
     async def get_by_product(self, product_id: str) -> List[Order]:
         pass
 
     @abstractmethod
-    async def get_metrics(
+    def stream(
         self, start_date: Optional[date], end_date: Optional[date]
+    ) -> AsyncIterator[Order]:
+        pass
+
+    @abstractmethod
+    async def get_metrics(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        top_products_limit: int,
+        granularity: Granularity,
+        time_zone: str,
     ) -> DashboardMetricsSchema:
         pass
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional
 
+from app.application.schemas.page import PageSchema
+from app.domain.entities.order_item import OrderItem
 from app.domain.entities.product import Product
 
 
@@ -9,6 +11,10 @@ class ProductRepository(ABC):
     async def create(self, product: Product) -> Product:
         pass
 
+    @abstractmethod
+    async def bulk_create(self, products: List[Product]) -> Dict[str, str]:
+        pass
+
     @abstractmethod
     async def get_by_id(self, product_id: str) -> Optional[Product]:
         pass
@@ -17,10 +23,25 @@ class ProductRepository(ABC):
     async def get_all(self) -> List[Product]:
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[str],
+        fields: Optional[List[str]],
+    ) -> PageSchema:
+        pass
+
     @abstractmethod
     async def update(self, product: Product) -> Product:
         pass
 
+    @abstractmethod
+    async def update_image_variants(
+        self, product_id: str, image_version: str, image_variants: Dict[str, str]
+    ) -> bool:
+        pass
+
     @abstractmethod
     async def bulk_update(self, products: List[Product]) -> List[Product]:
         pass
@@ -29,10 +50,14 @@ class ProductRepository(ABC):
     async def delete(self, product_id: str) -> None:
         pass
 
+    @abstractmethod
+    async def remove_category(self, category_id: str) -> int:
+        pass
+
     @abstractmethod
     async def get_by_category(self, category_id: str) -> List[Product]:
         pass
 
     @abstractmethod
-    async def get_prices(self, product_ids: List[str]) -> List[Tuple[str, float]]:
+    async def get_order_items(self, product_ids: List[str]) -> List[OrderItem]:
         pass
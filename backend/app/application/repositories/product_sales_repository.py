@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+
+from app.domain.entities.order import Order
+
+
+class ProductSalesRepository(ABC):
+    @abstractmethod
+    async def add_order(self, order: Order) -> None:
+        pass
+
+    @abstractmethod
+    async def add_orders(self, orders: List[Order]) -> None:
+        pass
+
+    @abstractmethod
+    async def remove_order(self, order: Order) -> None:
+        pass
+
+    @abstractmethod
+    async def rename_product(self, product_id: str, product_name: str) -> None:
+        pass
+
+    @abstractmethod
+    async def remove_product(self, product_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def rebuild(
+        self, start_date: Optional[date], end_date: Optional[date]
+    ) -> int:
+        pass
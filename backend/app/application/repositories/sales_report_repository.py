@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, List
+
+from app.application.schemas.sales_report import SalesSummarySchema
+
+
+class SalesReportRepository(ABC):
+    @abstractmethod
+    async def get_daily_summaries(
+        self, start_date: date, end_date: date
+    ) -> List[SalesSummarySchema]:
+        pass
+
+    @abstractmethod
+    async def get_completed_partitions(
+        self, partition_ids: List[str]
+    ) -> Dict[str, List[SalesSummarySchema]]:
+        pass
+
+    @abstractmethod
+    async def complete_partition(
+        self, partition_id: str, summaries: List[SalesSummarySchema]
+    ) -> None:
+        pass
@@ -1,12 +1,22 @@
-from typing import List
+from typing import List, Literal
 
 from pydantic import BaseModel
 
+Granularity = Literal["hour", "day", "week", "month"]
+
+PERIOD_FORMATS = {
+    "hour": "%Y-%m-%dT%H:00",
+    "day": "%Y-%m-%d",
+    "week": "%Y-%m-%d",
+    "month": "%Y-%m",
+}
+
 
 class DashboardMetricsSchema(BaseModel):
     total_orders: int
     average_order_value: float
     total_revenue: float
+    granularity: Granularity = "day"
     orders_by_period: dict
     top_products: List[dict]
     revenue_by_category: List[dict]
@@ -1,7 +1,14 @@
-from typing import Optional
+import io
+from typing import BinaryIO, Optional, Union
 
 
 class File:
-    def __init__(self, content: bytes, content_type: Optional[str]):
+    def __init__(self, content: Union[bytes, BinaryIO], content_type: Optional[str]):
         self.content = content
         self.content_type = content_type
+
+    def open(self) -> BinaryIO:
+        if isinstance(self.content, bytes):
+            return io.BytesIO(self.content)
+
+        return self.content
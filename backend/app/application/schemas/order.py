@@ -2,6 +2,8 @@ from typing import List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from app.domain.entities.order import Order
+
 
 class OrderBaseSchema(BaseModel):
     product_ids: List[str] = Field(...)
@@ -15,3 +17,10 @@ class OrderCreateSchema(OrderBaseSchema):
 class OrderUpdateSchema(BaseModel):
     product_ids: Optional[List[str]] = None
     date: Optional[datetime] = None
+
+
+class OrderBatchItemResultSchema(BaseModel):
+    index: int
+    success: bool
+    order: Optional[Order] = None
+    error: Optional[str] = None
@@ -0,0 +1,8 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class PageSchema(BaseModel):
+    items: List[dict]
+    next_cursor: Optional[str]
@@ -2,6 +2,7 @@ from typing import List, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.application.schemas.image_file import File
+from app.domain.entities.product import Product
 
 
 class ProductBaseSchema(BaseModel):
@@ -17,6 +18,17 @@ class ProductCreateSchema(ProductBaseSchema):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+class ProductImportRowSchema(ProductBaseSchema):
+    image: str = Field(..., min_length=1)
+
+
+class ProductImportItemResultSchema(BaseModel):
+    index: int
+    success: bool
+    product: Optional[Product] = None
+    error: Optional[str] = None
+
+
 class ProductUpdateWithoutImageSchema(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = Field(None, min_length=1)
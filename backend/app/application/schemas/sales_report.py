@@ -0,0 +1,9 @@
+from datetime import date
+from pydantic import BaseModel
+
+
+class SalesSummarySchema(BaseModel):
+    period: date
+    order_count: int
+    units_sold: int
+    revenue: float
@@ -12,12 +12,6 @@ class DeleteCategoryUseCase:
         self.product_repository = product_repository
 
     async def execute(self, category_id: str) -> None:
-        category_products = await self.product_repository.get_by_category(category_id)
-
-        if len(category_products) > 0:
-            for product in category_products:
-                product.category_ids.remove(category_id)
-
-            await self.product_repository.bulk_update(category_products)
+        await self.product_repository.remove_category(category_id)
 
         await self.category_repository.delete(category_id)
@@ -0,0 +1,20 @@
+from typing import List, Optional
+from app.application.schemas.page import PageSchema
+from app.application.repositories.category_repository import CategoryRepository
+
+
+class GetCategoriesPageUseCase:
+    def __init__(self, category_repository: CategoryRepository):
+        self.category_repository = category_repository
+
+    async def execute(
+        self,
+        limit: int,
+        after: Optional[str],
+        fields: Optional[List[str]],
+    ) -> PageSchema:
+        return await self.category_repository.get_page(
+            limit=limit,
+            after=after,
+            fields=fields,
+        )
@@ -1,19 +1,165 @@
-from datetime import date
-from typing import Optional
+from datetime import date, datetime, time, timedelta
+from typing import Literal, Optional
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
 from app.application.repositories.order_repository import OrderRepository
-from app.application.schemas.dashboard import DashboardMetricsSchema
+from app.application.schemas.dashboard import (
+    PERIOD_FORMATS,
+    DashboardMetricsSchema,
+    Granularity,
+)
 
 
 class GetMetricsUseCase:
-    def __init__(self, order_repository: OrderRepository):
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        metrics_cache: DashboardMetricsCache,
+    ):
         self.order_repository = order_repository
+        self.metrics_cache = metrics_cache
 
     async def execute(
         self,
         start_date: Optional[date],
         end_date: Optional[date],
+        top_products_limit: int,
+        granularity: Literal[Granularity, "auto"] = "day",
+        time_zone: str = "UTC",
+        period_format: Literal["object", "columnar"] = "object",
+    ) -> DashboardMetricsSchema:
+        granularity = self.__resolve_granularity(granularity, start_date, end_date)
+
+        return await self.metrics_cache.get_or_set(
+            self.metrics_cache.get_key(
+                start_date,
+                end_date,
+                top_products_limit,
+                granularity,
+                time_zone,
+                period_format,
+            ),
+            lambda: self.__get_metrics(
+                start_date,
+                end_date,
+                top_products_limit,
+                granularity,
+                time_zone,
+                period_format,
+            ),
+        )
+
+    async def __get_metrics(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        top_products_limit: int,
+        granularity: Granularity,
+        time_zone: str,
+        period_format: Literal["object", "columnar"],
     ) -> DashboardMetricsSchema:
-        return await self.order_repository.get_metrics(
+        metrics = await self.order_repository.get_metrics(
             start_date=start_date,
             end_date=end_date,
+            top_products_limit=top_products_limit,
+            granularity=granularity,
+            time_zone=time_zone,
+        )
+
+        orders_by_period = self.__fill_periods(
+            metrics.orders_by_period, granularity, start_date, end_date
         )
+
+        if period_format == "columnar":
+            orders_by_period = {
+                "periods": list(orders_by_period),
+                "count": [period["count"] for period in orders_by_period.values()],
+                "revenue": [period["revenue"] for period in orders_by_period.values()],
+            }
+
+        return metrics.model_copy(update={"orders_by_period": orders_by_period})
+
+    def __resolve_granularity(
+        self,
+        granularity: Literal[Granularity, "auto"],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> Granularity:
+        if granularity != "auto":
+            return granularity
+
+        if start_date is None or end_date is None:
+            return "month"
+
+        days = (end_date - start_date).days + 1
+
+        if days <= 2:
+            return "hour"
+        elif days <= 92:
+            return "day"
+        elif days <= 731:
+            return "week"
+
+        return "month"
+
+    def __fill_periods(
+        self,
+        orders_by_period: dict,
+        granularity: Granularity,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> dict:
+        period_format = PERIOD_FORMATS[granularity]
+        keys = sorted(orders_by_period)
+
+        first_period = (
+            self.__truncate(datetime.combine(start_date, time.min), granularity)
+            if start_date
+            else datetime.strptime(keys[0], period_format) if keys else None
+        )
+        last_period = (
+            self.__truncate(datetime.combine(end_date, time(23)), granularity)
+            if end_date
+            else datetime.strptime(keys[-1], period_format) if keys else None
+        )
+
+        if first_period is None or last_period is None:
+            return orders_by_period
+
+        filled_periods = {}
+        period = first_period
+
+        while period <= last_period:
+            key = period.strftime(period_format)
+            filled_periods[key] = orders_by_period.get(key, {"count": 0, "revenue": 0})
+
+            if period == last_period:
+                break
+
+            period = self.__next_period(period, granularity)
+
+        return filled_periods
+
+    def __truncate(self, value: datetime, granularity: Granularity) -> datetime:
+        if granularity == "hour":
+            return value.replace(minute=0, second=0, microsecond=0)
+
+        day_start = datetime.combine(value.date(), time.min)
+
+        if granularity == "week":
+            return day_start - timedelta(days=day_start.weekday())
+        elif granularity == "month":
+            return day_start.replace(day=1)
+
+        return day_start
+
+    def __next_period(self, value: datetime, granularity: Granularity) -> datetime:
+        if granularity == "hour":
+            return value + timedelta(hours=1)
+        elif granularity == "week":
+            return value + timedelta(days=7)
+        elif granularity == "month":
+            return value.replace(
+                year=value.year + value.month // 12, month=value.month % 12 + 1
+            )
+
+        return value + timedelta(days=1)
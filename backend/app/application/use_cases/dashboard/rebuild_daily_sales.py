@@ -0,0 +1,31 @@
+from datetime import date
+from typing import Optional
+from app.application.repositories.daily_sales_repository import DailySalesRepository
+from app.application.repositories.product_sales_repository import (
+    ProductSalesRepository,
+)
+
+
+class RebuildDailySalesUseCase:
+    def __init__(
+        self,
+        daily_sales_repository: DailySalesRepository,
+        product_sales_repository: ProductSalesRepository,
+    ):
+        self.daily_sales_repository = daily_sales_repository
+        self.product_sales_repository = product_sales_repository
+
+    async def execute(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> int:
+        await self.product_sales_repository.rebuild(
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        return await self.daily_sales_repository.rebuild(
+            start_date=start_date,
+            end_date=end_date,
+        )
@@ -0,0 +1,54 @@
+from typing import List
+from app.domain.entities.order import Order
+from app.application.repositories.order_repository import OrderRepository
+from app.application.repositories.product_repository import ProductRepository
+
+
+class BackfillOrderItemsUseCase:
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        product_repository: ProductRepository,
+        batch_size: int = 1000,
+    ):
+        self.order_repository = order_repository
+        self.product_repository = product_repository
+        self.batch_size = batch_size
+
+    async def execute(self) -> int:
+        backfilled_orders = 0
+        orders = []
+
+        async for order in self.order_repository.stream(None, None):
+            if order.items:
+                continue
+
+            orders.append(order)
+
+            if len(orders) == self.batch_size:
+                backfilled_orders += await self.__backfill(orders)
+                orders = []
+
+        if len(orders) > 0:
+            backfilled_orders += await self.__backfill(orders)
+
+        return backfilled_orders
+
+    async def __backfill(self, orders: List[Order]) -> int:
+        products_items = {
+            item.product_id: item
+            for item in await self.product_repository.get_order_items(
+                list({id for order in orders for id in order.product_ids})
+            )
+        }
+
+        for order in orders:
+            order.items = [
+                products_items[product_id]
+                for product_id in order.product_ids
+                if product_id in products_items
+            ]
+
+        await self.order_repository.bulk_update(orders)
+
+        return len(orders)
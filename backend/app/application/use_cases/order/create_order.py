@@ -2,44 +2,70 @@ from typing import List
 from uuid import uuid4
 from app.application.schemas.order import OrderCreateSchema
 from app.domain.entities.order import Order
+from app.domain.entities.order_item import OrderItem
 from app.domain.exceptions.not_found_exception import NotFoundException
 from app.application.repositories.order_repository import OrderRepository
 from app.application.repositories.product_repository import ProductRepository
+from app.application.repositories.daily_sales_repository import DailySalesRepository
+from app.application.repositories.product_sales_repository import (
+    ProductSalesRepository,
+)
+from app.application.analytics import OrderAnalytics
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from app.application.cache.product_items_cache import ProductItemsCache
 
 
 class CreateOrderUseCase:
     def __init__(
-        self, order_repository: OrderRepository, product_repository: ProductRepository
+        self,
+        order_repository: OrderRepository,
+        product_repository: ProductRepository,
+        daily_sales_repository: DailySalesRepository,
+        product_sales_repository: ProductSalesRepository,
+        metrics_cache: DashboardMetricsCache,
+        product_items_cache: ProductItemsCache,
+        analytics: OrderAnalytics,
     ):
         self.order_repository = order_repository
         self.product_repository = product_repository
+        self.daily_sales_repository = daily_sales_repository
+        self.product_sales_repository = product_sales_repository
+        self.metrics_cache = metrics_cache
+        self.product_items_cache = product_items_cache
+        self.analytics = analytics
 
     async def execute(self, order_input: OrderCreateSchema) -> Order:
-        total = await self.__get_total(order_input.product_ids)
+        items = await self.__get_items(order_input.product_ids)
 
         order = Order(
             id=str(uuid4()),
             date=order_input.date,
             product_ids=order_input.product_ids,
-            total=total,
+            total=round(sum(item.price for item in items), 2),
+            items=items,
         )
 
-        return await self.order_repository.create(order)
+        order = await self.order_repository.create(order)
 
-    async def __get_total(self, product_ids: List) -> float:
-        products_len = len(product_ids)
+        await self.daily_sales_repository.add_order(order)
+        await self.product_sales_repository.add_order(order)
+        await self.metrics_cache.invalidate()
+        self.analytics.add_orders([order])
 
-        products_prices = await self.product_repository.get_prices(product_ids)
-        existing_products = [id for id, _ in products_prices]
+        return order
 
-        if products_len != len(products_prices):
-            products_not_found = [
-                product_id
-                for product_id in product_ids
-                if product_id not in existing_products
-            ]
+    async def __get_items(self, product_ids: List[str]) -> List[OrderItem]:
+        products_items = await self.product_items_cache.get_many(
+            product_ids, self.product_repository.get_order_items
+        )
+
+        products_not_found = [
+            product_id for product_id in product_ids if product_id not in products_items
+        ]
+
+        if len(products_not_found) > 0:
             raise NotFoundException(
                 f"Products with ids {products_not_found} does not exist"
             )
 
-        return round(sum([price for _, price in products_prices]), 2)
+        return [products_items[product_id] for product_id in product_ids]
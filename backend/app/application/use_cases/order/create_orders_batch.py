@@ -0,0 +1,116 @@
+from typing import Dict, List
+from uuid import uuid4
+from app.application.schemas.order import (
+    OrderBatchItemResultSchema,
+    OrderCreateSchema,
+)
+from app.domain.entities.order import Order
+from app.domain.entities.order_item import OrderItem
+from app.application.repositories.order_repository import OrderRepository
+from app.application.repositories.product_repository import ProductRepository
+from app.application.repositories.daily_sales_repository import DailySalesRepository
+from app.application.repositories.product_sales_repository import (
+    ProductSalesRepository,
+)
+from app.application.analytics import OrderAnalytics
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from app.application.cache.product_items_cache import ProductItemsCache
+
+
+class CreateOrdersBatchUseCase:
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        product_repository: ProductRepository,
+        daily_sales_repository: DailySalesRepository,
+        product_sales_repository: ProductSalesRepository,
+        metrics_cache: DashboardMetricsCache,
+        product_items_cache: ProductItemsCache,
+        analytics: OrderAnalytics,
+    ):
+        self.order_repository = order_repository
+        self.product_repository = product_repository
+        self.daily_sales_repository = daily_sales_repository
+        self.product_sales_repository = product_sales_repository
+        self.metrics_cache = metrics_cache
+        self.product_items_cache = product_items_cache
+        self.analytics = analytics
+
+    async def execute(
+        self, orders_input: List[OrderCreateSchema]
+    ) -> List[OrderBatchItemResultSchema]:
+        products_items = await self.__get_items(orders_input)
+
+        results = []
+        orders = []
+
+        for index, order_input in enumerate(orders_input):
+            products_not_found = [
+                product_id
+                for product_id in order_input.product_ids
+                if product_id not in products_items
+            ]
+
+            if len(products_not_found) > 0:
+                results.append(
+                    OrderBatchItemResultSchema(
+                        index=index,
+                        success=False,
+                        error=f"Products with ids {products_not_found} does not exist",
+                    )
+                )
+                continue
+
+            items = [
+                products_items[product_id] for product_id in order_input.product_ids
+            ]
+
+            order = Order(
+                id=str(uuid4()),
+                date=order_input.date,
+                product_ids=order_input.product_ids,
+                total=round(sum(item.price for item in items), 2),
+                items=items,
+            )
+            orders.append(order)
+            results.append(
+                OrderBatchItemResultSchema(index=index, success=True, order=order)
+            )
+
+        if len(orders) == 0:
+            return results
+
+        errors = await self.order_repository.bulk_create(orders)
+
+        for result in results:
+            if result.order is not None and result.order.id in errors:
+                result.success = False
+                result.error = errors[result.order.id]
+                result.order = None
+
+        created_orders = [order for order in orders if order.id not in errors]
+
+        await self.daily_sales_repository.add_orders(created_orders)
+        await self.product_sales_repository.add_orders(created_orders)
+        await self.metrics_cache.invalidate()
+        self.analytics.add_orders(created_orders)
+
+        return results
+
+    async def __get_items(
+        self, orders_input: List[OrderCreateSchema]
+    ) -> Dict[str, OrderItem]:
+        product_ids = list(
+            {
+                product_id
+                for order_input in orders_input
+                for product_id in order_input.product_ids
+            }
+        )
+
+        if len(product_ids) == 0:
+            return {}
+
+        return await self.product_items_cache.get_many(
+            product_ids, self.product_repository.get_order_items
+        )
@@ -1,9 +1,34 @@
 from app.application.repositories.order_repository import OrderRepository
+from app.application.repositories.daily_sales_repository import DailySalesRepository
+from app.application.repositories.product_sales_repository import (
+    ProductSalesRepository,
+)
+from app.application.analytics import OrderAnalytics
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
 
 
 class DeleteOrderUseCase:
-    def __init__(self, order_repository: OrderRepository):
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        daily_sales_repository: DailySalesRepository,
+        product_sales_repository: ProductSalesRepository,
+        metrics_cache: DashboardMetricsCache,
+        analytics: OrderAnalytics,
+    ):
         self.order_repository = order_repository
+        self.daily_sales_repository = daily_sales_repository
+        self.product_sales_repository = product_sales_repository
+        self.metrics_cache = metrics_cache
+        self.analytics = analytics
 
     async def execute(self, order_id: str) -> None:
+        order = await self.order_repository.get_by_id(order_id)
+
         await self.order_repository.delete(order_id)
+
+        if order is not None:
+            await self.daily_sales_repository.remove_order(order)
+            await self.product_sales_repository.remove_order(order)
+            await self.metrics_cache.invalidate()
+            self.analytics.remove_orders([order_id])
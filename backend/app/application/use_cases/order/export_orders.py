@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import AsyncIterator, Literal, Optional
+from app.domain.entities.order import Order
+from app.application.repositories.order_repository import OrderRepository
+
+
+class ExportOrdersUseCase:
+    def __init__(self, order_repository: OrderRepository, batch_size: int = 1000):
+        self.order_repository = order_repository
+        self.batch_size = batch_size
+
+    async def execute(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        export_format: Literal["ndjson", "csv"],
+    ) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffered_orders = 0
+
+        if export_format == "csv":
+            writer.writerow(["id", "date", "total", "product_ids"])
+
+        async for order in self.order_repository.stream(start_date, end_date):
+            if export_format == "csv":
+                self.__write_csv_row(writer, order)
+            else:
+                self.__write_ndjson_line(buffer, order)
+
+            buffered_orders += 1
+
+            if buffered_orders == self.batch_size:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                buffered_orders = 0
+
+        if buffer.tell() > 0:
+            yield buffer.getvalue()
+
+    def __write_csv_row(self, writer, order: Order) -> None:
+        writer.writerow(
+            [order.id, order.date.isoformat(), order.total, "|".join(order.product_ids)]
+        )
+
+    def __write_ndjson_line(self, buffer: io.StringIO, order: Order) -> None:
+        buffer.write(
+            json.dumps(
+                {
+                    "id": order.id,
+                    "date": order.date.isoformat(),
+                    "total": order.total,
+                    "product_ids": order.product_ids,
+                    "items": [
+                        {
+                            "product_id": item.product_id,
+                            "price": item.price,
+                            "category_ids": item.category_ids,
+                        }
+                        for item in order.items
+                    ],
+                }
+            )
+        )
+        buffer.write("\n")
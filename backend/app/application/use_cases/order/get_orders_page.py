@@ -0,0 +1,22 @@
+from typing import List, Optional
+from app.application.schemas.page import PageSchema
+from app.application.repositories.order_repository import OrderRepository
+
+
+class GetOrdersPageUseCase:
+    def __init__(self, order_repository: OrderRepository):
+        self.order_repository = order_repository
+
+    async def execute(
+        self,
+        limit: int,
+        after: Optional[str],
+        fields: Optional[List[str]],
+        sort_by: str,
+    ) -> PageSchema:
+        return await self.order_repository.get_page(
+            limit=limit,
+            after=after,
+            fields=fields,
+            sort_by=sort_by,
+        )
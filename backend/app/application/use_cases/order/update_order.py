@@ -1,17 +1,38 @@
+from dataclasses import replace
 from typing import List
 from app.application.schemas.order import OrderUpdateSchema
 from app.domain.entities.order import Order
+from app.domain.entities.order_item import OrderItem
 from app.domain.exceptions.not_found_exception import NotFoundException
 from app.application.repositories.order_repository import OrderRepository
 from app.application.repositories.product_repository import ProductRepository
+from app.application.repositories.daily_sales_repository import DailySalesRepository
+from app.application.repositories.product_sales_repository import (
+    ProductSalesRepository,
+)
+from app.application.analytics import OrderAnalytics
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from app.application.cache.product_items_cache import ProductItemsCache
 
 
 class UpdateOrderUseCase:
     def __init__(
-        self, order_repository: OrderRepository, product_repository: ProductRepository
+        self,
+        order_repository: OrderRepository,
+        product_repository: ProductRepository,
+        daily_sales_repository: DailySalesRepository,
+        product_sales_repository: ProductSalesRepository,
+        metrics_cache: DashboardMetricsCache,
+        product_items_cache: ProductItemsCache,
+        analytics: OrderAnalytics,
     ):
         self.order_repository = order_repository
         self.product_repository = product_repository
+        self.daily_sales_repository = daily_sales_repository
+        self.product_sales_repository = product_sales_repository
+        self.metrics_cache = metrics_cache
+        self.product_items_cache = product_items_cache
+        self.analytics = analytics
 
     async def execute(self, order_id: str, order_input: OrderUpdateSchema) -> Order:
         order = await self.order_repository.get_by_id(order_id)
@@ -19,9 +40,20 @@ class UpdateOrderUseCase:
         if order is None:
             raise NotFoundException(f"Order with id {order_id} does not exist")
 
+        previous_order = replace(order)
+
         await self.__update_fields(order, order_input)
 
-        return await self.order_repository.update(order)
+        order = await self.order_repository.update(order)
+
+        await self.daily_sales_repository.remove_order(previous_order)
+        await self.daily_sales_repository.add_order(order)
+        await self.product_sales_repository.remove_order(previous_order)
+        await self.product_sales_repository.add_order(order)
+        await self.metrics_cache.invalidate()
+        self.analytics.add_orders([order])
+
+        return order
 
     async def __update_fields(
         self, order: Order, order_input: OrderUpdateSchema
@@ -30,26 +62,25 @@ class UpdateOrderUseCase:
             order.date = order_input.date
 
         if order_input.product_ids:
-            total = await self.__get_total(order_input.product_ids)
+            items = await self.__get_items(order_input.product_ids)
             order.product_ids = order_input.product_ids
-            order.total = total
+            order.total = round(sum(item.price for item in items), 2)
+            order.items = items
 
         return order
 
-    async def __get_total(self, product_ids: List) -> float:
-        products_len = len(product_ids)
+    async def __get_items(self, product_ids: List[str]) -> List[OrderItem]:
+        products_items = await self.product_items_cache.get_many(
+            product_ids, self.product_repository.get_order_items
+        )
 
-        products_prices = await self.product_repository.get_prices(product_ids)
-        existing_products = [id for id, _ in products_prices]
+        products_not_found = [
+            product_id for product_id in product_ids if product_id not in products_items
+        ]
 
-        if products_len != len(products_prices):
-            products_not_found = [
-                product_id
-                for product_id in product_ids
-                if product_id not in existing_products
-            ]
+        if len(products_not_found) > 0:
             raise NotFoundException(
                 f"Products with ids {products_not_found} does not exist"
             )
 
-        return round(sum([price for _, price in products_prices]), 2)
+        return [products_items[product_id] for product_id in product_ids]
@@ -35,6 +35,7 @@ class CreateProductUseCase:
             price=product_input.price,
             category_ids=product_input.category_ids,
             image_url=image_url,
+            image_version=str(uuid4()),
         )
 
         return await self.product_repository.create(product)
@@ -48,12 +49,13 @@ class CreateProductUseCase:
             category_ids
         )
 
-        if category_ids_len != len(existing_categories):
-            categories_not_found = [
-                category_id
-                for category_id in category_ids
-                if category_id not in existing_categories
-            ]
+        categories_not_found = [
+            category_id
+            for category_id in category_ids
+            if category_id not in existing_categories
+        ]
+
+        if len(categories_not_found) > 0:
             raise NotFoundException(
                 f"Categories with ids {categories_not_found} does not exist"
             )
@@ -1,6 +1,13 @@
+from app.application.analytics import OrderAnalytics
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from app.application.cache.product_items_cache import ProductItemsCache
 from app.application.file_storage.product_image_storage import ProductImageFileStorage
+from app.application.repositories.daily_sales_repository import DailySalesRepository
 from app.application.repositories.order_repository import OrderRepository
 from app.application.repositories.product_repository import ProductRepository
+from app.application.repositories.product_sales_repository import (
+    ProductSalesRepository,
+)
 from app.domain.exceptions.not_found_exception import NotFoundException
 
 
@@ -9,11 +16,21 @@ class DeleteProductUseCase:
         self,
         product_repository: ProductRepository,
         order_repository: OrderRepository,
+        daily_sales_repository: DailySalesRepository,
+        product_sales_repository: ProductSalesRepository,
         product_image_storage: ProductImageFileStorage,
+        metrics_cache: DashboardMetricsCache,
+        product_items_cache: ProductItemsCache,
+        analytics: OrderAnalytics,
     ):
         self.product_repository = product_repository
         self.order_repository = order_repository
+        self.daily_sales_repository = daily_sales_repository
+        self.product_sales_repository = product_sales_repository
         self.product_image_storage = product_image_storage
+        self.metrics_cache = metrics_cache
+        self.product_items_cache = product_items_cache
+        self.analytics = analytics
 
     async def execute(self, product_id: str) -> None:
         product = await self.product_repository.get_by_id(product_id)
@@ -21,14 +38,20 @@ class DeleteProductUseCase:
         if product is None:
             raise NotFoundException(f"Product with id {product_id} does not exist")
 
-        product_orders = await self.order_repository.get_by_product(product_id)
-
-        if len(product_orders) > 0:
-            for order in product_orders:
-                order.product_ids.remove(product_id)
-
-            await self.order_repository.bulk_update(product_orders)
+        await self.daily_sales_repository.remove_product(product)
+        await self.order_repository.remove_product(product.id, product.price)
+        await self.product_sales_repository.remove_product(product.id)
+        await self.metrics_cache.invalidate()
+        self.analytics.invalidate()
 
         await self.product_image_storage.delete(product_id)
 
+        for variant in product.image_variants:
+            await self.product_image_storage.delete(
+                self.product_image_storage.get_variant_key(
+                    product_id, product.image_version, variant
+                )
+            )
+
         await self.product_repository.delete(product_id)
+        await self.product_items_cache.remove(product_id)
@@ -0,0 +1,54 @@
+import asyncio
+import logging
+
+from app.application.file_storage.product_image_storage import ProductImageFileStorage
+from app.application.image_processing import ImageProcessor
+from app.application.repositories.product_repository import ProductRepository
+from app.domain.exceptions.invalid_image_exception import InvalidImageException
+
+logger = logging.getLogger(__name__)
+
+
+class GenerateProductImageVariantsUseCase:
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        product_image_storage: ProductImageFileStorage,
+        image_processor: ImageProcessor,
+    ):
+        self.product_repository = product_repository
+        self.product_image_storage = product_image_storage
+        self.image_processor = image_processor
+
+    async def execute(self, product_id: str, image_version: str) -> None:
+        content = await self.product_image_storage.get(product_id)
+
+        try:
+            variants = await self.image_processor.create_variants(content)
+        except InvalidImageException as error:
+            logger.warning(
+                "Skipping image variants for product %s: %s", product_id, error
+            )
+            return
+
+        names = list(variants.keys())
+        keys = [
+            self.product_image_storage.get_variant_key(product_id, image_version, name)
+            for name in names
+        ]
+
+        urls = await asyncio.gather(
+            *(
+                self.product_image_storage.put(key, variants[name])
+                for key, name in zip(keys, names)
+            )
+        )
+
+        updated = await self.product_repository.update_image_variants(
+            product_id, image_version, dict(zip(names, urls))
+        )
+
+        if not updated:
+            await asyncio.gather(
+                *(self.product_image_storage.delete(key) for key in keys)
+            )
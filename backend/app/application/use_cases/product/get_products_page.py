@@ -0,0 +1,20 @@
+from typing import List, Optional
+from app.application.schemas.page import PageSchema
+from app.application.repositories.product_repository import ProductRepository
+
+
+class GetProductsPageUseCase:
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(
+        self,
+        limit: int,
+        after: Optional[str],
+        fields: Optional[List[str]],
+    ) -> PageSchema:
+        return await self.product_repository.get_page(
+            limit=limit,
+            after=after,
+            fields=fields,
+        )
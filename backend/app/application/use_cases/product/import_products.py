@@ -0,0 +1,327 @@
+import asyncio
+import csv
+import io
+import mimetypes
+import posixpath
+import tarfile
+import zipfile
+from typing import BinaryIO, Dict, Iterator, List, Literal, Optional, Set, Tuple
+from uuid import uuid4
+from pydantic import ValidationError
+
+from app.application.file_storage.product_image_storage import ProductImageFileStorage
+from app.application.repositories.category_repository import CategoryRepository
+from app.application.repositories.product_repository import ProductRepository
+from app.application.schemas.image_file import File
+from app.application.schemas.product import (
+    ProductImportItemResultSchema,
+    ProductImportRowSchema,
+)
+from app.domain.entities.product import Product
+
+
+class ImportProductsUseCase:
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        category_repository: CategoryRepository,
+        product_image_storage: ProductImageFileStorage,
+        concurrency: int,
+        max_image_size: int,
+    ):
+        self.product_repository = product_repository
+        self.category_repository = category_repository
+        self.product_image_storage = product_image_storage
+        self.concurrency = concurrency
+        self.max_image_size = max_image_size
+
+    async def execute(
+        self,
+        manifest: File,
+        manifest_format: Literal["ndjson", "csv"],
+        archive: File,
+    ) -> List[ProductImportItemResultSchema]:
+        results: Dict[int, ProductImportItemResultSchema] = {}
+        rows = self.__parse_manifest(manifest, manifest_format, results)
+
+        await self.__check_categories_existence(rows, results)
+
+        products = {
+            index: Product(
+                id=str(uuid4()),
+                name=row.name,
+                description=row.description,
+                price=row.price,
+                category_ids=row.category_ids,
+                image_url="",
+                image_version=str(uuid4()),
+            )
+            for index, row in rows.items()
+            if index not in results
+        }
+
+        images = {}
+
+        for index in products:
+            images.setdefault(self.__normalize_name(rows[index].image), []).append(
+                index
+            )
+
+        archive_error = await self.__upload_images(archive, images, products, results)
+
+        for index, product in products.items():
+            if index not in results and not product.image_url:
+                self.__fail(
+                    results,
+                    index,
+                    archive_error or f"Image {rows[index].image} not found in archive",
+                )
+
+        created_products = [
+            product for index, product in products.items() if index not in results
+        ]
+
+        errors = (
+            await self.product_repository.bulk_create(created_products)
+            if len(created_products) > 0
+            else {}
+        )
+
+        await asyncio.gather(
+            *(self.product_image_storage.delete(product_id) for product_id in errors)
+        )
+
+        for index, product in products.items():
+            if index in results:
+                continue
+
+            if product.id in errors:
+                self.__fail(results, index, errors[product.id])
+            else:
+                results[index] = ProductImportItemResultSchema(
+                    index=index, success=True, product=product
+                )
+
+        return [results[index] for index in sorted(results)]
+
+    def __parse_manifest(
+        self,
+        manifest: File,
+        manifest_format: Literal["ndjson", "csv"],
+        results: Dict[int, ProductImportItemResultSchema],
+    ) -> Dict[int, ProductImportRowSchema]:
+        rows = {}
+        content = io.TextIOWrapper(manifest.open(), encoding="utf-8-sig", newline="")
+
+        if manifest_format == "csv":
+            lines = (
+                {
+                    **row,
+                    "category_ids": [
+                        category_id
+                        for category_id in (row.get("category_ids") or "").split("|")
+                        if category_id
+                    ],
+                }
+                for row in csv.DictReader(content)
+            )
+        else:
+            lines = (line for line in content if line.strip())
+
+        for index, line in enumerate(lines):
+            try:
+                rows[index] = (
+                    ProductImportRowSchema.model_validate(line)
+                    if manifest_format == "csv"
+                    else ProductImportRowSchema.model_validate_json(line)
+                )
+            except ValidationError as error:
+                self.__fail(
+                    results,
+                    index,
+                    "; ".join(
+                        f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: "
+                        f"{detail['msg']}"
+                        for detail in error.errors()
+                    ),
+                )
+
+        return rows
+
+    async def __check_categories_existence(
+        self,
+        rows: Dict[int, ProductImportRowSchema],
+        results: Dict[int, ProductImportItemResultSchema],
+    ) -> None:
+        category_ids = list(
+            {category_id for row in rows.values() for category_id in row.category_ids}
+        )
+
+        if len(category_ids) == 0:
+            return
+
+        existing_categories = await self.category_repository.get_existing_ids(
+            category_ids
+        )
+
+        for index, row in rows.items():
+            categories_not_found = [
+                category_id
+                for category_id in row.category_ids
+                if category_id not in existing_categories
+            ]
+
+            if len(categories_not_found) > 0:
+                self.__fail(
+                    results,
+                    index,
+                    f"Categories with ids {categories_not_found} does not exist",
+                )
+
+    async def __upload_images(
+        self,
+        archive: File,
+        images: Dict[str, List[int]],
+        products: Dict[int, Product],
+        results: Dict[int, ProductImportItemResultSchema],
+    ) -> Optional[str]:
+        if len(images) == 0:
+            return
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        uploads = []
+        archive_images = self.__read_images(archive.open(), set(images))
+
+        try:
+            while True:
+                await semaphore.acquire()
+                image = await asyncio.to_thread(next, archive_images, None)
+
+                if image is None:
+                    semaphore.release()
+                    break
+
+                name, content, error = image
+
+                if error is not None:
+                    for index in images[name]:
+                        if index not in results:
+                            self.__fail(results, index, error)
+
+                    semaphore.release()
+                    continue
+
+                uploads.append(
+                    asyncio.create_task(
+                        self.__upload_image(
+                            File(
+                                content=content,
+                                content_type=mimetypes.guess_type(name)[0],
+                            ),
+                            [(index, products[index]) for index in images[name]],
+                            results,
+                            semaphore,
+                        )
+                    )
+                )
+        except (
+            tarfile.TarError,
+            zipfile.BadZipFile,
+            OSError,
+            RuntimeError,
+            NotImplementedError,
+        ) as error:
+            semaphore.release()
+
+            return f"Image archive could not be read: {error}"
+        finally:
+            await asyncio.gather(*uploads)
+
+    async def __upload_image(
+        self,
+        image: File,
+        products: List[Tuple[int, Product]],
+        results: Dict[int, ProductImportItemResultSchema],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        try:
+            for index, product in products:
+                if index in results:
+                    continue
+
+                try:
+                    product.image_url = await self.product_image_storage.put(
+                        product.id, image
+                    )
+                except Exception as error:
+                    self.__fail(results, index, f"Image upload failed: {error}")
+        finally:
+            semaphore.release()
+
+    def __read_images(
+        self, archive: BinaryIO, names: Set[str]
+    ) -> Iterator[Tuple[str, Optional[bytes], Optional[str]]]:
+        if zipfile.is_zipfile(archive):
+            archive.seek(0)
+
+            with zipfile.ZipFile(archive) as zip_archive:
+                for info in zip_archive.infolist():
+                    name = self.__normalize_name(info.filename)
+
+                    if info.is_dir() or name not in names:
+                        continue
+
+                    if info.file_size > self.max_image_size:
+                        yield name, None, self.__get_size_error(info.filename)
+                        continue
+
+                    try:
+                        with zip_archive.open(info) as image:
+                            yield name, *self.__read_image(image, info.filename)
+                    except (RuntimeError, NotImplementedError) as error:
+                        yield name, None, f"Image {info.filename} could not be read: {error}"
+
+            return
+
+        archive.seek(0)
+
+        with tarfile.open(fileobj=archive, mode="r|*") as tar_archive:
+            for member in tar_archive:
+                name = self.__normalize_name(member.name)
+
+                if not member.isfile() or name not in names:
+                    continue
+
+                if member.size > self.max_image_size:
+                    yield name, None, self.__get_size_error(member.name)
+                    continue
+
+                yield name, *self.__read_image(
+                    tar_archive.extractfile(member), member.name
+                )
+
+    def __read_image(
+        self, image: BinaryIO, name: str
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        content = image.read(self.max_image_size + 1)
+
+        if len(content) > self.max_image_size:
+            return None, self.__get_size_error(name)
+
+        return content, None
+
+    def __get_size_error(self, name: str) -> str:
+        return f"Image {name} is larger than {self.max_image_size} bytes"
+
+    def __normalize_name(self, name: str) -> str:
+        return posixpath.normpath(name.replace("\\", "/")).lstrip("/")
+
+    def __fail(
+        self,
+        results: Dict[int, ProductImportItemResultSchema],
+        index: int,
+        error: str,
+    ) -> None:
+        results[index] = ProductImportItemResultSchema(
+            index=index, success=False, error=error
+        )
@@ -1,10 +1,18 @@
+import asyncio
 from typing import List
+from uuid import uuid4
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from app.application.cache.product_items_cache import ProductItemsCache
 from app.application.file_storage.product_image_storage import ProductImageFileStorage
 from app.application.schemas.product import ProductUpdateSchema
+from app.domain.entities.order_item import OrderItem
 from app.domain.entities.product import Product
 from app.domain.exceptions.not_found_exception import NotFoundException
 from app.application.repositories.product_repository import ProductRepository
 from app.application.repositories.category_repository import CategoryRepository
+from app.application.repositories.product_sales_repository import (
+    ProductSalesRepository,
+)
 
 
 class UpdateProductUseCase:
@@ -13,10 +21,16 @@ class UpdateProductUseCase:
         product_repository: ProductRepository,
         category_repository: CategoryRepository,
         product_image_storage: ProductImageFileStorage,
+        product_sales_repository: ProductSalesRepository,
+        metrics_cache: DashboardMetricsCache,
+        product_items_cache: ProductItemsCache,
     ):
         self.product_repository = product_repository
         self.category_repository = category_repository
         self.product_image_storage = product_image_storage
+        self.product_sales_repository = product_sales_repository
+        self.metrics_cache = metrics_cache
+        self.product_items_cache = product_items_cache
 
     async def execute(
         self, product_id: str, product_input: ProductUpdateSchema
@@ -26,9 +40,39 @@ class UpdateProductUseCase:
         if product is None:
             raise NotFoundException(f"Product with id {product_id} does not exist")
 
+        previous_name = product.name
+        previous_image_version = product.image_version
+        previous_image_variants = list(product.image_variants)
+
         await self.__update_fields(product, product_input)
 
-        return await self.product_repository.update(product)
+        product = await self.product_repository.update(product)
+
+        if product.image_version != previous_image_version:
+            await asyncio.gather(
+                *(
+                    self.product_image_storage.delete(
+                        self.product_image_storage.get_variant_key(
+                            product.id, previous_image_version, variant
+                        )
+                    )
+                    for variant in previous_image_variants
+                )
+            )
+
+        await self.product_items_cache.update(
+            OrderItem(
+                product_id=product.id,
+                price=product.price,
+                category_ids=product.category_ids,
+            )
+        )
+
+        if product.name != previous_name:
+            await self.product_sales_repository.rename_product(product.id, product.name)
+            await self.metrics_cache.invalidate()
+
+        return product
 
     async def __update_fields(
         self, product: Product, product_input: ProductUpdateSchema
@@ -50,6 +94,8 @@ class UpdateProductUseCase:
             product.image_url = await self.product_image_storage.put(
                 product.id, product_input.image
             )
+            product.image_variants = {}
+            product.image_version = str(uuid4())
 
     async def __check_categories_existence(self, category_ids: List[str]) -> None:
         category_ids_len = len(category_ids)
@@ -60,12 +106,13 @@ class UpdateProductUseCase:
             category_ids
         )
 
-        if category_ids_len != len(existing_categories):
-            categories_not_found = [
-                category_id
-                for category_id in category_ids
-                if category_id not in existing_categories
-            ]
+        categories_not_found = [
+            category_id
+            for category_id in category_ids
+            if category_id not in existing_categories
+        ]
+
+        if len(categories_not_found) > 0:
             raise NotFoundException(
                 f"Categories with ids {categories_not_found} does not exist"
             )
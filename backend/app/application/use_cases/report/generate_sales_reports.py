@@ -0,0 +1,261 @@
+import asyncio
+import csv
+import gzip
+import io
+from datetime import date, datetime, timedelta, timezone
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+from app.application.file_storage.report_file_storage import ReportFileStorage
+from app.application.repositories.sales_report_repository import (
+    SalesReportRepository,
+)
+from app.application.schemas.image_file import File
+from app.application.schemas.sales_report import SalesSummarySchema
+
+REPORT_COLUMNS = [
+    "period",
+    "order_count",
+    "units_sold",
+    "revenue",
+    "average_order_value",
+]
+
+
+class GenerateSalesReportsUseCase:
+    def __init__(
+        self,
+        sales_report_repository: SalesReportRepository,
+        report_storage: ReportFileStorage,
+        concurrency: int,
+    ):
+        self.sales_report_repository = sales_report_repository
+        self.report_storage = report_storage
+        self.concurrency = concurrency
+        self.stage_seconds: Dict[str, float] = {}
+
+    async def execute(
+        self, start_date: date, end_date: date, force: bool = False
+    ) -> dict:
+        self.stage_seconds = {"aggregate": 0.0, "encode": 0.0, "upload": 0.0}
+        started_at = perf_counter()
+
+        last_date = datetime.now(timezone.utc).date() - timedelta(days=1)
+        end_date = min(end_date, last_date)
+        partitions = self.__get_partitions(
+            start_date, min(self.__get_month_end(end_date), last_date)
+        )
+
+        if len(partitions) == 0:
+            return {"partitions": {}, "summaries": [], "stages": {}}
+
+        requested_partition_ids = {partition_id for partition_id, _, _ in partitions}
+        partitions = (
+            self.__get_partitions(
+                self.__get_year_start(start_date),
+                start_date.replace(day=1) - timedelta(days=1),
+            )
+            + partitions
+            + self.__get_partitions(
+                self.__get_month_end(end_date) + timedelta(days=1),
+                min(self.__get_month_end(self.__get_year_end(end_date)), last_date),
+            )
+        )
+
+        completed_partitions = {
+            partition_id: summaries
+            for partition_id, summaries in (
+                await self.sales_report_repository.get_completed_partitions(
+                    [partition_id for partition_id, _, _ in partitions]
+                )
+            ).items()
+            if not force or partition_id not in requested_partition_ids
+        }
+
+        self.stage_seconds["plan"] = perf_counter() - started_at
+        partitions_started_at = perf_counter()
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(
+            *(
+                self.__process_partition(
+                    partition,
+                    (
+                        completed_partitions.get(partition[0])
+                        if self.__is_whole_month(partition[2])
+                        else None
+                    ),
+                    semaphore,
+                )
+                for partition in partitions
+            )
+        )
+
+        self.stage_seconds["partitions"] = perf_counter() - partitions_started_at
+        summaries_started_at = perf_counter()
+
+        daily_summaries = [summary for _, summaries in results for summary in summaries]
+        summary_keys = []
+
+        for year in range(
+            start_date.isocalendar().year, end_date.isocalendar().year + 1
+        ):
+            weekly_key = self.report_storage.get_report_key("weekly", str(year))
+            await self.__write(
+                weekly_key,
+                self.__group(
+                    [
+                        summary
+                        for summary in daily_summaries
+                        if summary.period.isocalendar().year == year
+                    ],
+                    lambda period: period - timedelta(days=period.weekday()),
+                ),
+            )
+            summary_keys.append(weekly_key)
+
+        for year in range(start_date.year, end_date.year + 1):
+            monthly_key = self.report_storage.get_report_key("monthly", str(year))
+            await self.__write(
+                monthly_key,
+                self.__group(
+                    [
+                        summary
+                        for summary in daily_summaries
+                        if summary.period.year == year
+                    ],
+                    lambda period: period.replace(day=1),
+                ),
+            )
+            summary_keys.append(monthly_key)
+
+        self.stage_seconds["summaries"] = perf_counter() - summaries_started_at
+        self.stage_seconds["total"] = perf_counter() - started_at
+
+        return {
+            "partitions": {
+                partition_id: status
+                for (partition_id, _, _), (status, _) in zip(partitions, results)
+            },
+            "summaries": summary_keys,
+            "stages": {
+                stage: round(seconds, 3)
+                for stage, seconds in self.stage_seconds.items()
+            },
+        }
+
+    async def __process_partition(
+        self,
+        partition: Tuple[str, date, date],
+        completed_summaries: Optional[List[SalesSummarySchema]],
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[str, List[SalesSummarySchema]]:
+        partition_id, partition_start, partition_end = partition
+
+        if completed_summaries is not None:
+            return "skipped", completed_summaries
+
+        async with semaphore:
+            aggregate_started_at = perf_counter()
+            summaries = await self.sales_report_repository.get_daily_summaries(
+                partition_start, partition_end
+            )
+            self.stage_seconds["aggregate"] += perf_counter() - aggregate_started_at
+
+            await self.__write(partition_id, summaries)
+
+            if self.__is_whole_month(partition_end):
+                await self.sales_report_repository.complete_partition(
+                    partition_id, summaries
+                )
+
+        return "generated", summaries
+
+    async def __write(self, key: str, summaries: List[SalesSummarySchema]) -> None:
+        encode_started_at = perf_counter()
+        content = self.__encode(summaries)
+        self.stage_seconds["encode"] += perf_counter() - encode_started_at
+
+        upload_started_at = perf_counter()
+        await self.report_storage.put(key, File(content, "application/gzip"))
+        self.stage_seconds["upload"] += perf_counter() - upload_started_at
+
+    def __encode(self, summaries: List[SalesSummarySchema]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(REPORT_COLUMNS)
+
+        for summary in summaries:
+            writer.writerow(
+                [
+                    summary.period.isoformat(),
+                    summary.order_count,
+                    summary.units_sold,
+                    f"{summary.revenue:.2f}",
+                    f"{summary.revenue / summary.order_count if summary.order_count else 0:.2f}",
+                ]
+            )
+
+        return gzip.compress(buffer.getvalue().encode(), mtime=0)
+
+    def __group(
+        self,
+        summaries: List[SalesSummarySchema],
+        get_period: Callable[[date], date],
+    ) -> List[SalesSummarySchema]:
+        grouped_summaries: Dict[date, SalesSummarySchema] = {}
+
+        for summary in summaries:
+            period = get_period(summary.period)
+            grouped_summary = grouped_summaries.setdefault(
+                period,
+                SalesSummarySchema(
+                    period=period, order_count=0, units_sold=0, revenue=0
+                ),
+            )
+            grouped_summary.order_count += summary.order_count
+            grouped_summary.units_sold += summary.units_sold
+            grouped_summary.revenue += summary.revenue
+
+        return list(grouped_summaries.values())
+
+    def __get_partitions(
+        self, start_date: date, end_date: date
+    ) -> List[Tuple[str, date, date]]:
+        partitions = []
+        month_start = start_date.replace(day=1)
+
+        while month_start <= end_date:
+            next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+            partitions.append(
+                (
+                    self.report_storage.get_report_key(
+                        "daily", month_start.strftime("%Y-%m")
+                    ),
+                    month_start,
+                    min(next_month_start - timedelta(days=1), end_date),
+                )
+            )
+            month_start = next_month_start
+
+        return partitions
+
+    def __get_year_start(self, start_date: date) -> date:
+        return min(
+            start_date.replace(month=1, day=1),
+            date.fromisocalendar(start_date.isocalendar().year, 1, 1),
+        )
+
+    def __get_year_end(self, end_date: date) -> date:
+        return max(
+            end_date.replace(month=12, day=31),
+            date.fromisocalendar(end_date.isocalendar().year + 1, 1, 1)
+            - timedelta(days=1),
+        )
+
+    def __get_month_end(self, value: date) -> date:
+        return (value.replace(day=1) + timedelta(days=32)).replace(day=1) - timedelta(
+            days=1
+        )
+
+    def __is_whole_month(self, partition_end: date) -> bool:
+        return (partition_end + timedelta(days=1)).day == 1
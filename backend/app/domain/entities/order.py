@@ -1,11 +1,14 @@
 from typing import List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
+from app.domain.entities.order_item import OrderItem
 
-@dataclass
+
+@dataclass(slots=True)
 class Order:
     id: str
     product_ids: List[str]
     total: float
     date: datetime
+    items: List[OrderItem] = field(default_factory=list)
@@ -0,0 +1,9 @@
+from typing import List
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class OrderItem:
+    product_id: str
+    price: float
+    category_ids: List[str]
@@ -1,8 +1,8 @@
-from typing import List
-from dataclasses import dataclass
+from typing import Dict, List
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     id: str
     name: str
@@ -10,3 +10,5 @@ class Product:
     price: float
     category_ids: List[str]
     image_url: str
+    image_variants: Dict[str, str] = field(default_factory=dict)
+    image_version: str = ""
@@ -0,0 +1,3 @@
+class InvalidCursorException(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
@@ -0,0 +1,17 @@
+from typing import List
+
+from app.application.change_events import ChangeEvent, ChangeEventConsumer
+from app.infrastructure.repositories.mongodb.mappers import to_order
+from .numpy_order_analytics import NumpyOrderAnalytics
+
+
+class AnalyticsChangeConsumer(ChangeEventConsumer):
+    def __init__(self, analytics: NumpyOrderAnalytics):
+        self.analytics = analytics
+
+    async def handle(self, events: List[ChangeEvent]) -> None:
+        for event in events:
+            if event.collection == "orders" and event.operation == "delete":
+                self.analytics.remove_orders([event.document_id])
+            elif event.collection == "orders" and event.document is not None:
+                self.analytics.add_orders([to_order(event.document)])
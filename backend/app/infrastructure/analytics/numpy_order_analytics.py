@@ -0,0 +1,576 @@
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+from typing import Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+import numpy as np
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.application.analytics import OrderAnalytics
+from app.application.schemas.dashboard import (
+    PERIOD_FORMATS,
+    DashboardMetricsSchema,
+    Granularity,
+)
+from app.domain.entities.order import Order
+from app.infrastructure.environment_configs import EnvironmentConfigs
+
+env = EnvironmentConfigs()
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+HOUR_US = 3_600_000_000
+DAY_US = 24 * HOUR_US
+OFFSET_SLOT_US = 15 * 60_000_000
+
+
+@dataclass
+class OrderColumns:
+    order_ids: np.ndarray
+    dates: np.ndarray
+    totals: np.ndarray
+    item_offsets: np.ndarray
+    item_products: np.ndarray
+    item_prices: np.ndarray
+    item_category_sets: np.ndarray
+
+    def find_row(self, order_id: str, date: int) -> Optional[int]:
+        start = np.searchsorted(self.dates, date, "left")
+        end = np.searchsorted(self.dates, date, "right")
+
+        for row in range(start, end):
+            if self.order_ids[row] == order_id:
+                return row
+
+    def remove(self, rows: List[int]) -> "OrderColumns":
+        if len(rows) == 0:
+            return self
+
+        keep = np.ones(len(self.dates), dtype=bool)
+        keep[rows] = False
+
+        item_keep = np.repeat(keep, np.diff(self.item_offsets))
+        item_counts = np.diff(self.item_offsets)[keep]
+
+        return OrderColumns(
+            order_ids=self.order_ids[keep],
+            dates=self.dates[keep],
+            totals=self.totals[keep],
+            item_offsets=np.concatenate(([0], np.cumsum(item_counts))),
+            item_products=self.item_products[item_keep],
+            item_prices=self.item_prices[item_keep],
+            item_category_sets=self.item_category_sets[item_keep],
+        )
+
+    def insert(self, other: "OrderColumns") -> "OrderColumns":
+        if len(other.dates) == 0:
+            return self
+
+        positions = np.searchsorted(self.dates, other.dates, "right")
+        other_item_counts = np.diff(other.item_offsets)
+        item_positions = np.repeat(self.item_offsets[positions], other_item_counts)
+        item_counts = np.insert(
+            np.diff(self.item_offsets), positions, other_item_counts
+        )
+
+        return OrderColumns(
+            order_ids=np.insert(self.order_ids, positions, other.order_ids),
+            dates=np.insert(self.dates, positions, other.dates),
+            totals=np.insert(self.totals, positions, other.totals),
+            item_offsets=np.concatenate(([0], np.cumsum(item_counts))),
+            item_products=np.insert(
+                self.item_products, item_positions, other.item_products
+            ),
+            item_prices=np.insert(self.item_prices, item_positions, other.item_prices),
+            item_category_sets=np.insert(
+                self.item_category_sets, item_positions, other.item_category_sets
+            ),
+        )
+
+
+class OrderColumnsBuilder:
+    def __init__(self):
+        self.order_ids = []
+        self.dates = []
+        self.totals = []
+        self.item_counts = []
+        self.item_products = []
+        self.item_prices = []
+        self.item_category_sets = []
+
+    def append(
+        self,
+        order_id: str,
+        date: int,
+        total: float,
+        items: List[Tuple[int, float, int]],
+    ) -> None:
+        self.order_ids.append(order_id)
+        self.dates.append(date)
+        self.totals.append(total)
+        self.item_counts.append(len(items))
+
+        for product, price, category_set in items:
+            self.item_products.append(product)
+            self.item_prices.append(price)
+            self.item_category_sets.append(category_set)
+
+    def build(self) -> OrderColumns:
+        dates = np.array(self.dates, dtype=np.int64)
+        item_counts = np.array(self.item_counts, dtype=np.int64)
+
+        order_permutation = np.argsort(dates, kind="stable")
+        order_ranks = np.empty_like(order_permutation)
+        order_ranks[order_permutation] = np.arange(len(dates))
+        item_permutation = np.argsort(
+            np.repeat(order_ranks, item_counts), kind="stable"
+        )
+
+        return OrderColumns(
+            order_ids=np.array(self.order_ids, dtype=object)[order_permutation],
+            dates=dates[order_permutation],
+            totals=np.array(self.totals, dtype=np.float64)[order_permutation],
+            item_offsets=np.concatenate(
+                ([0], np.cumsum(item_counts[order_permutation]))
+            ),
+            item_products=np.array(self.item_products, dtype=np.int32)[
+                item_permutation
+            ],
+            item_prices=np.array(self.item_prices, dtype=np.float64)[item_permutation],
+            item_category_sets=np.array(self.item_category_sets, dtype=np.int32)[
+                item_permutation
+            ],
+        )
+
+
+class NumpyOrderAnalytics(OrderAnalytics):
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(NumpyOrderAnalytics, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            self.columns: Optional[OrderColumns] = None
+            self.loaded_at = 0.0
+            self.stale = False
+            self.loading = False
+            self.load_lock = asyncio.Lock()
+            self.reload_task: Optional[asyncio.Task] = None
+            self.pending_orders: Dict[str, Optional[Order]] = {}
+            self.order_dates: Dict[str, int] = {}
+            self.products: Dict[str, Tuple[float, int]] = {}
+            self.product_codes: Dict[str, int] = {}
+            self.product_ids: List[str] = []
+            self.category_codes: Dict[str, int] = {}
+            self.category_ids: List[str] = []
+            self.category_set_codes: Dict[Tuple[int, ...], int] = {}
+            self.category_sets: List[Tuple[int, ...]] = []
+            self._initialized = True
+
+    def add_orders(self, orders: Iterable[Order]) -> None:
+        if self.columns is None and not self.loading:
+            return
+
+        for order in orders:
+            self.pending_orders[order.id] = order
+
+    def remove_orders(self, order_ids: Iterable[str]) -> None:
+        if self.columns is None and not self.loading:
+            return
+
+        for order_id in order_ids:
+            self.pending_orders[order_id] = None
+
+    def invalidate(self) -> None:
+        self.stale = True
+
+    async def close(self) -> None:
+        if self.reload_task is None:
+            return
+
+        self.reload_task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self.reload_task
+
+        self.reload_task = None
+
+    async def load(self, db: AsyncDatabase) -> None:
+        async with self.load_lock:
+            await self.__load(db)
+
+    async def __load(self, db: AsyncDatabase) -> None:
+        self.loading = True
+        self.pending_orders = {}
+
+        try:
+            products = {}
+
+            async for db_product in db["products"].find(
+                {}, {"price": 1, "category_ids": 1}
+            ):
+                products[db_product["_id"]] = (
+                    db_product["price"],
+                    self.__get_category_set_code(db_product["category_ids"]),
+                )
+
+            self.products = products
+            builder = OrderColumnsBuilder()
+
+            async for db_order in db["orders"].find(
+                {},
+                {"date": 1, "total": 1, "product_ids": 1, "items": 1},
+                batch_size=env.analytics_load_batch_size,
+            ):
+                builder.append(
+                    db_order["_id"],
+                    self.__to_timestamp(db_order["date"]),
+                    db_order["total"],
+                    (
+                        [
+                            (
+                                self.__get_product_code(item["product_id"]),
+                                item["price"],
+                                self.__get_category_set_code(item["category_ids"]),
+                            )
+                            for item in db_order["items"]
+                        ]
+                        if db_order.get("items")
+                        else self.__get_fallback_items(db_order["product_ids"])
+                    ),
+                )
+
+            self.order_dates = dict(zip(builder.order_ids, builder.dates))
+            self.columns = builder.build()
+            self.loaded_at = monotonic()
+            self.stale = False
+        finally:
+            self.loading = False
+
+    async def get_metrics(
+        self,
+        db: AsyncDatabase,
+        start_datetime: Optional[datetime],
+        end_datetime: Optional[datetime],
+        top_products_limit: int,
+        granularity: Granularity,
+        time_zone: str,
+    ) -> DashboardMetricsSchema:
+        if self.columns is None:
+            async with self.load_lock:
+                if self.columns is None:
+                    await self.__load(db)
+        elif self.stale or monotonic() - self.loaded_at > env.analytics_refresh_seconds:
+            self.__schedule_reload(db)
+
+        columns = self.__apply_pending_orders()
+
+        start = (
+            np.searchsorted(columns.dates, self.__to_timestamp(start_datetime), "left")
+            if start_datetime
+            else 0
+        )
+        end = (
+            np.searchsorted(columns.dates, self.__to_timestamp(end_datetime), "right")
+            if end_datetime
+            else len(columns.dates)
+        )
+
+        dates = columns.dates[start:end]
+        totals = columns.totals[start:end]
+        item_start = columns.item_offsets[start]
+        item_end = columns.item_offsets[end]
+        item_products = columns.item_products[item_start:item_end]
+        item_prices = columns.item_prices[item_start:item_end]
+        item_category_sets = columns.item_category_sets[item_start:item_end]
+
+        total_orders = len(dates)
+        total_revenue = float(totals.sum())
+
+        product_counts = np.bincount(item_products, minlength=len(self.product_ids))
+        category_revenue, category_counts = self.__get_category_revenue(
+            item_category_sets, item_prices
+        )
+
+        return DashboardMetricsSchema(
+            total_orders=total_orders,
+            average_order_value=total_revenue / total_orders if total_orders else 0,
+            total_revenue=total_revenue,
+            granularity=granularity,
+            orders_by_period=self.__get_orders_by_period(
+                dates, totals, granularity, time_zone
+            ),
+            top_products=await self.__get_top_products(
+                db, product_counts, top_products_limit
+            ),
+            revenue_by_category=await self.__get_revenue_by_category(
+                db, category_revenue, category_counts
+            ),
+        )
+
+    def __schedule_reload(self, db: AsyncDatabase) -> None:
+        if self.reload_task is None or self.reload_task.done():
+            self.reload_task = asyncio.create_task(self.load(db))
+
+    def __apply_pending_orders(self) -> OrderColumns:
+        if self.loading or not self.pending_orders:
+            return self.columns
+
+        pending_orders, self.pending_orders = self.pending_orders, {}
+
+        removed_rows = []
+
+        for order_id in pending_orders:
+            date = self.order_dates.pop(order_id, None)
+
+            if date is not None:
+                row = self.columns.find_row(order_id, date)
+
+                if row is not None:
+                    removed_rows.append(row)
+
+        builder = OrderColumnsBuilder()
+
+        for order in pending_orders.values():
+            if order is not None:
+                date = self.order_dates[order.id] = self.__to_timestamp(order.date)
+                builder.append(
+                    order.id,
+                    date,
+                    order.total,
+                    (
+                        [
+                            (
+                                self.__get_product_code(item.product_id),
+                                item.price,
+                                self.__get_category_set_code(item.category_ids),
+                            )
+                            for item in order.items
+                        ]
+                        if order.items
+                        else self.__get_fallback_items(order.product_ids)
+                    ),
+                )
+
+        self.columns = self.columns.remove(removed_rows).insert(builder.build())
+
+        return self.columns
+
+    def __get_orders_by_period(
+        self,
+        dates: np.ndarray,
+        totals: np.ndarray,
+        granularity: Granularity,
+        time_zone: str,
+    ) -> dict:
+        if len(dates) == 0:
+            return {}
+
+        if time_zone != "UTC":
+            dates = dates + self.__get_utc_offsets(dates, ZoneInfo(time_zone))
+
+        if granularity == "hour":
+            periods = dates // HOUR_US * HOUR_US
+        elif granularity == "week":
+            days = dates // DAY_US
+            periods = (days - (days + 3) % 7) * DAY_US
+        elif granularity == "month":
+            periods = (
+                dates.astype("datetime64[us]")
+                .astype("datetime64[M]")
+                .astype("datetime64[us]")
+                .astype(np.int64)
+            )
+        else:
+            periods = dates // DAY_US * DAY_US
+
+        period_starts, period_indexes = np.unique(periods, return_inverse=True)
+        counts = np.bincount(period_indexes)
+        revenue = np.bincount(period_indexes, weights=totals)
+        period_format = PERIOD_FORMATS[granularity]
+
+        return {
+            (EPOCH + int(period_start) * MICROSECOND).strftime(period_format): {
+                "count": int(count),
+                "revenue": float(period_revenue),
+            }
+            for period_start, count, period_revenue in zip(
+                period_starts, counts, revenue
+            )
+        }
+
+    def __get_utc_offsets(self, dates: np.ndarray, zone: ZoneInfo) -> np.ndarray:
+        slots, slot_indexes = np.unique(dates // OFFSET_SLOT_US, return_inverse=True)
+        slot_offsets = np.array(
+            [
+                datetime.fromtimestamp(
+                    int(slot) * OFFSET_SLOT_US // 1_000_000, tz=zone
+                ).utcoffset()
+                // MICROSECOND
+                for slot in slots
+            ],
+            dtype=np.int64,
+        )
+
+        return slot_offsets[slot_indexes]
+
+    def __get_category_revenue(
+        self, item_category_sets: np.ndarray, item_prices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if len(self.category_sets) == 0:
+            return (
+                np.zeros(len(self.category_ids)),
+                np.zeros(len(self.category_ids), dtype=np.int64),
+            )
+
+        set_lengths = np.array(
+            [len(categories) for categories in self.category_sets], dtype=np.int64
+        )
+        set_categories = np.array(
+            [category for categories in self.category_sets for category in categories],
+            dtype=np.int64,
+        )
+
+        set_revenue = np.bincount(
+            item_category_sets, weights=item_prices, minlength=len(self.category_sets)
+        )
+        set_counts = np.bincount(item_category_sets, minlength=len(self.category_sets))
+
+        return (
+            np.bincount(
+                set_categories,
+                weights=np.repeat(set_revenue, set_lengths),
+                minlength=len(self.category_ids),
+            ),
+            np.bincount(
+                set_categories,
+                weights=np.repeat(set_counts, set_lengths),
+                minlength=len(self.category_ids),
+            ),
+        )
+
+    async def __get_top_products(
+        self, db: AsyncDatabase, product_counts: np.ndarray, limit: int
+    ) -> List[dict]:
+        product_ids = np.array(self.product_ids, dtype=object)
+        by_id = np.argsort(product_ids, kind="stable")
+        candidates = by_id[np.argsort(-product_counts[by_id], kind="stable")]
+        candidates = candidates[product_counts[candidates] > 0]
+
+        top_products = []
+
+        for chunk_start in range(0, len(candidates), limit):
+            chunk = candidates[chunk_start : chunk_start + limit]
+            product_names = await self.__get_names(
+                db, "products", list(product_ids[chunk])
+            )
+
+            for code in chunk:
+                product_id = self.product_ids[code]
+
+                if product_id in product_names:
+                    top_products.append(
+                        {
+                            "_id": product_id,
+                            "product_id": product_id,
+                            "product_name": product_names[product_id],
+                            "count": int(product_counts[code]),
+                        }
+                    )
+
+                if len(top_products) == limit:
+                    return top_products
+
+        return top_products
+
+    async def __get_revenue_by_category(
+        self,
+        db: AsyncDatabase,
+        category_revenue: np.ndarray,
+        category_counts: np.ndarray,
+    ) -> List[dict]:
+        codes = np.flatnonzero(category_counts)
+        codes = codes[np.argsort(-category_revenue[codes], kind="stable")]
+        category_names = await self.__get_names(
+            db, "categories", [self.category_ids[code] for code in codes]
+        )
+
+        return [
+            {
+                "_id": self.category_ids[code],
+                "category_id": self.category_ids[code],
+                "category_name": category_names[self.category_ids[code]],
+                "revenue": float(category_revenue[code]),
+            }
+            for code in codes
+            if self.category_ids[code] in category_names
+        ]
+
+    async def __get_names(
+        self, db: AsyncDatabase, collection_name: str, ids: List[str]
+    ) -> Dict[str, str]:
+        if len(ids) == 0:
+            return {}
+
+        db_documents = db[collection_name].find({"_id": {"$in": ids}}, {"name": 1})
+
+        return {
+            db_document["_id"]: db_document["name"]
+            async for db_document in db_documents
+        }
+
+    def __get_fallback_items(
+        self, product_ids: List[str]
+    ) -> List[Tuple[int, float, int]]:
+        return [
+            (
+                self.__get_product_code(product_id),
+                *self.products[product_id],
+            )
+            for product_id in product_ids
+            if product_id in self.products
+        ]
+
+    def __get_product_code(self, product_id: str) -> int:
+        code = self.product_codes.get(product_id)
+
+        if code is None:
+            code = self.product_codes[product_id] = len(self.product_ids)
+            self.product_ids.append(product_id)
+
+        return code
+
+    def __get_category_set_code(self, category_ids: List[str]) -> int:
+        category_set = tuple(
+            sorted(
+                {self.__get_category_code(category_id) for category_id in category_ids}
+            )
+        )
+        code = self.category_set_codes.get(category_set)
+
+        if code is None:
+            code = self.category_set_codes[category_set] = len(self.category_sets)
+            self.category_sets.append(category_set)
+
+        return code
+
+    def __get_category_code(self, category_id: str) -> int:
+        code = self.category_codes.get(category_id)
+
+        if code is None:
+            code = self.category_codes[category_id] = len(self.category_ids)
+            self.category_ids.append(category_id)
+
+        return code
+
+    def __to_timestamp(self, value: datetime) -> int:
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return (value - EPOCH) // MICROSECOND
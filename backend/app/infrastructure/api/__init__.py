@@ -1,29 +1,69 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from pymongo.errors import PyMongoError
 
+from app.domain.exceptions.invalid_cursor_exception import InvalidCursorException
+from app.infrastructure.database.mongodb_indexes import create_indexes
+from .container import Container
 from .routes import (
     category_router,
     dashboard_router,
     health_router,
+    metrics_router,
     order_router,
     product_router,
 )
+from .timing_middleware import TimingMiddleware
+
+logger = logging.getLogger(__name__)
 
 
 class Api:
     def __init__(self):
-        self.app = FastAPI()
+        self.app = FastAPI(lifespan=self.__lifespan)
 
         self.__apply_middlewares()
         self.__append_routes()
+        self.__add_exception_handlers()
+
+    @asynccontextmanager
+    async def __lifespan(self, app: FastAPI):
+        container = Container()
+        app.state.container = container
+
+        try:
+            await create_indexes(container.mongo_database.get_database())
+        except PyMongoError as error:
+            logger.warning("Could not create MongoDB indexes: %s", error)
+
+        container.change_watcher.start()
+
+        try:
+            yield
+        finally:
+            await container.close()
 
     def __append_routes(self):
         self.app.include_router(category_router)
         self.app.include_router(dashboard_router)
         self.app.include_router(health_router)
+        self.app.include_router(metrics_router)
         self.app.include_router(order_router)
         self.app.include_router(product_router)
 
+    def __add_exception_handlers(self):
+        @self.app.exception_handler(InvalidCursorException)
+        async def invalid_cursor_handler(
+            request: Request, error: InvalidCursorException
+        ):
+            return JSONResponse(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                content={"detail": str(error)},
+            )
+
     def __apply_middlewares(self):
         self.app.add_middleware(
             CORSMiddleware,
@@ -32,4 +72,5 @@ class Api:
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        self.app.add_middleware(TimingMiddleware)
         pass
@@ -0,0 +1,122 @@
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from app.application.change_events.category_ids_cache_consumer import (
+    CategoryIdsCacheChangeConsumer,
+)
+from app.application.change_events.metrics_cache_consumer import (
+    MetricsCacheChangeConsumer,
+)
+from app.application.change_events.product_items_cache_consumer import (
+    ProductItemsCacheChangeConsumer,
+)
+from app.application.file_storage.product_image_storage import ProductImageFileStorage
+from app.infrastructure.analytics.analytics_change_consumer import (
+    AnalyticsChangeConsumer,
+)
+from app.infrastructure.analytics.numpy_order_analytics import NumpyOrderAnalytics
+from app.infrastructure.cache.memory.memory_category_ids_cache import (
+    MemoryCategoryIdsCache,
+)
+from app.infrastructure.cache.memory.memory_dashboard_metrics_cache import (
+    MemoryDashboardMetricsCache,
+)
+from app.infrastructure.cache.memory.memory_product_items_cache import (
+    MemoryProductItemsCache,
+)
+from app.infrastructure.cache.redis.redis_dashboard_metrics_cache import (
+    RedisDashboardMetricsCache,
+)
+from app.infrastructure.change_streams.mongo_change_watcher import (
+    MongoChangeWatcher,
+)
+from app.infrastructure.database.mongodb import MongoDatabase
+from app.infrastructure.environment_configs import EnvironmentConfigs
+from app.infrastructure.file_storage.memory.memory_product_image_storage import (
+    MemoryProductImageFileStorage,
+)
+from app.infrastructure.file_storage.s3.s3_product_image_storage import (
+    S3ProductImageFileStorage,
+)
+from app.infrastructure.image_processing.pillow_image_processor import (
+    PillowImageProcessor,
+)
+from app.infrastructure.repositories.mongodb.mongodb_category_repository import (
+    MongodbCategoryRepository,
+)
+from app.infrastructure.repositories.mongodb.mongodb_daily_sales_repository import (
+    MongodbDailySalesRepository,
+)
+from app.infrastructure.repositories.mongodb.mongodb_order_repository import (
+    MongodbOrderRepository,
+)
+from app.infrastructure.repositories.mongodb.mongodb_product_repository import (
+    MongodbProductRepository,
+)
+from app.infrastructure.repositories.mongodb.mongodb_product_sales_repository import (
+    MongodbProductSalesRepository,
+)
+
+env = EnvironmentConfigs()
+
+
+class Container:
+    def __init__(self):
+        self.mongo_database = MongoDatabase()
+
+        db = self.mongo_database.get_database()
+
+        self.category_ids_cache = MemoryCategoryIdsCache()
+
+        self.category_repository = MongodbCategoryRepository(
+            db, self.category_ids_cache
+        )
+        self.product_repository = MongodbProductRepository(db)
+        self.order_repository = MongodbOrderRepository(db)
+        self.daily_sales_repository = MongodbDailySalesRepository(db)
+        self.product_sales_repository = MongodbProductSalesRepository(db)
+
+        self.product_image_storage = self.__create_product_image_storage()
+        self.image_processor = PillowImageProcessor()
+        self.metrics_cache = self.__create_metrics_cache()
+        self.product_items_cache = MemoryProductItemsCache()
+        self.analytics = NumpyOrderAnalytics()
+
+        self.change_watcher = MongoChangeWatcher(db)
+        self.change_watcher.register(MetricsCacheChangeConsumer(self.metrics_cache))
+        self.change_watcher.register(
+            CategoryIdsCacheChangeConsumer(self.category_ids_cache)
+        )
+        self.change_watcher.register(
+            ProductItemsCacheChangeConsumer(self.product_items_cache)
+        )
+        self.change_watcher.register(AnalyticsChangeConsumer(self.analytics))
+
+    def __create_product_image_storage(self) -> ProductImageFileStorage:
+        if env.file_storage_backend == "memory":
+            return MemoryProductImageFileStorage()
+
+        return S3ProductImageFileStorage()
+
+    def __create_metrics_cache(self) -> DashboardMetricsCache:
+        if env.dashboard_metrics_cache_backend == "redis":
+            return RedisDashboardMetricsCache()
+
+        return MemoryDashboardMetricsCache()
+
+    async def close(self) -> None:
+        await self.change_watcher.stop()
+        await self.analytics.close()
+        await self.metrics_cache.close()
+        self.image_processor.close()
+        self.product_image_storage.close()
+        await self.mongo_database.close()
+
+        for singleton in [
+            self.mongo_database,
+            self.product_image_storage,
+            self.image_processor,
+            self.metrics_cache,
+            self.product_items_cache,
+            self.category_ids_cache,
+            self.analytics,
+        ]:
+            type(singleton)._instance = None
@@ -0,0 +1,79 @@
+from fastapi import Depends, Request
+
+from app.application.analytics import OrderAnalytics
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from app.application.cache.product_items_cache import ProductItemsCache
+from app.application.file_storage.product_image_storage import ProductImageFileStorage
+from app.application.image_processing import ImageProcessor
+from app.application.repositories.category_repository import CategoryRepository
+from app.application.repositories.daily_sales_repository import DailySalesRepository
+from app.application.repositories.order_repository import OrderRepository
+from app.application.repositories.product_repository import ProductRepository
+from app.application.repositories.product_sales_repository import (
+    ProductSalesRepository,
+)
+from .container import Container
+
+
+async def get_container(request: Request) -> Container:
+    return request.app.state.container
+
+
+async def get_category_repository(
+    container: Container = Depends(get_container),
+) -> CategoryRepository:
+    return container.category_repository
+
+
+async def get_product_repository(
+    container: Container = Depends(get_container),
+) -> ProductRepository:
+    return container.product_repository
+
+
+async def get_order_repository(
+    container: Container = Depends(get_container),
+) -> OrderRepository:
+    return container.order_repository
+
+
+async def get_daily_sales_repository(
+    container: Container = Depends(get_container),
+) -> DailySalesRepository:
+    return container.daily_sales_repository
+
+
+async def get_product_sales_repository(
+    container: Container = Depends(get_container),
+) -> ProductSalesRepository:
+    return container.product_sales_repository
+
+
+async def get_image_file_storage(
+    container: Container = Depends(get_container),
+) -> ProductImageFileStorage:
+    return container.product_image_storage
+
+
+async def get_image_processor(
+    container: Container = Depends(get_container),
+) -> ImageProcessor:
+    return container.image_processor
+
+
+async def get_metrics_cache(
+    container: Container = Depends(get_container),
+) -> DashboardMetricsCache:
+    return container.metrics_cache
+
+
+async def get_product_items_cache(
+    container: Container = Depends(get_container),
+) -> ProductItemsCache:
+    return container.product_items_cache
+
+
+async def get_analytics(
+    container: Container = Depends(get_container),
+) -> OrderAnalytics:
+    return container.analytics
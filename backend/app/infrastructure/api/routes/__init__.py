@@ -1,6 +1,7 @@
 from .category_router import category_router
 from .dashboard_router import dashboard_router
 from .health_router import health_router
+from .metrics_router import metrics_router
 from .order_router import order_router
 from .product_router import product_router
 
@@ -8,6 +9,7 @@ __all__ = [
     "category_router",
     "dashboard_router",
     "health_router",
+    "metrics_router",
     "order_router",
     "product_router",
 ]
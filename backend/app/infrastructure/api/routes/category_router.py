@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status
 
 from app.application.repositories.category_repository import CategoryRepository
 from app.application.repositories.product_repository import ProductRepository
@@ -8,29 +9,19 @@ from app.application.use_cases.category.delete_category import DeleteCategoryUse
 from app.application.use_cases.category.get_all_categories import (
     GetAllCategoriesUseCase,
 )
+from app.application.use_cases.category.get_categories_page import (
+    GetCategoriesPageUseCase,
+)
 from app.application.use_cases.category.get_category_by_id import GetCategoryByIdUseCase
 from app.application.use_cases.category.update_category import UpdateCategoryUseCase
-from app.infrastructure.database.mongodb import MongoDatabase
-from app.infrastructure.repositories.mongodb.mongodb_category_repository import (
-    MongodbCategoryRepository,
-)
-from app.infrastructure.repositories.mongodb.mongodb_product_repository import (
-    MongodbProductRepository,
+from app.infrastructure.api.dependencies import (
+    get_category_repository,
+    get_product_repository,
 )
 
 
 category_router = APIRouter(prefix="/categories")
 
-mongo_db = MongoDatabase()
-
-
-def get_category_repository() -> CategoryRepository:
-    return MongodbCategoryRepository(mongo_db.get_database())
-
-
-def get_product_repository() -> ProductRepository:
-    return MongodbProductRepository(mongo_db.get_database())
-
 
 @category_router.post("", status_code=status.HTTP_201_CREATED)
 async def create_category(
@@ -44,11 +35,19 @@ async def create_category(
 
 @category_router.get("")
 async def get_categories(
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    after: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
     category_repository: CategoryRepository = Depends(get_category_repository),
 ):
-    use_case = GetAllCategoriesUseCase(category_repository)
+    if limit is None:
+        use_case = GetAllCategoriesUseCase(category_repository)
+
+        return await use_case.execute()
+
+    use_case = GetCategoriesPageUseCase(category_repository)
 
-    return await use_case.execute()
+    return await use_case.execute(limit, after, fields.split(",") if fields else None)
 
 
 @category_router.get("/{category_id}")
@@ -1,30 +1,85 @@
 from datetime import date
-from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from typing import Literal, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from fastapi import APIRouter, Depends, HTTPException, Query
 
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
 from app.application.repositories.order_repository import OrderRepository
+from app.application.schemas.dashboard import Granularity
 from app.application.use_cases.dashboard.get_metrics import GetMetricsUseCase
-from app.infrastructure.database.mongodb import MongoDatabase
-from app.infrastructure.repositories.mongodb.mongodb_order_repository import (
-    MongodbOrderRepository,
+from app.infrastructure.api.dependencies import (
+    get_metrics_cache,
+    get_order_repository,
 )
 
 
 dashboard_router = APIRouter(prefix="/dashboard")
 
-mongo_db = MongoDatabase()
-
-
-def get_order_repository() -> OrderRepository:
-    return MongodbOrderRepository(mongo_db.get_database())
+MAX_HOURLY_DAYS = 31
+MAX_PERIODS = 3660
 
 
 @dashboard_router.get("")
 async def get_metrics(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
+    top_products_limit: int = Query(5, ge=1, le=100),
+    granularity: Literal[Granularity, "auto"] = Query("day"),
+    timezone: str = Query("UTC"),
+    period_format: Literal["object", "columnar"] = Query("object"),
     order_repository: OrderRepository = Depends(get_order_repository),
+    metrics_cache: DashboardMetricsCache = Depends(get_metrics_cache),
+):
+    try:
+        ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=422, detail=f"Unknown timezone: {timezone}")
+
+    if granularity == "hour" and (
+        start_date is None
+        or end_date is None
+        or (end_date - start_date).days >= MAX_HOURLY_DAYS
+    ):
+        raise HTTPException(
+            status_code=422,
+            detail=f"Hourly granularity requires a date range of at most {MAX_HOURLY_DAYS} days",
+        )
+
+    if start_date is not None and (
+        count_periods(start_date, end_date or date.today(), granularity) > MAX_PERIODS
+    ):
+        raise HTTPException(
+            status_code=422,
+            detail=f"The date range covers more than {MAX_PERIODS} periods, "
+            "use a shorter range or a coarser granularity",
+        )
+
+    use_case = GetMetricsUseCase(order_repository, metrics_cache)
+
+    return await use_case.execute(
+        start_date, end_date, top_products_limit, granularity, timezone, period_format
+    )
+
+
+@dashboard_router.get("/cache")
+async def get_metrics_cache_stats(
+    metrics_cache: DashboardMetricsCache = Depends(get_metrics_cache),
 ):
-    use_case = GetMetricsUseCase(order_repository)
+    return metrics_cache.get_stats()
+
+
+def count_periods(
+    start_date: date, end_date: date, granularity: Literal[Granularity, "auto"]
+) -> int:
+    days = (end_date - start_date).days + 1
+
+    if granularity == "hour":
+        return days * 24
+    elif granularity == "day":
+        return days
+    elif granularity == "week":
+        return days // 7 + 1
 
-    return await use_case.execute(start_date, end_date)
+    return (
+        (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
+    )
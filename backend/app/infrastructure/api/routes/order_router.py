@@ -1,33 +1,43 @@
-from fastapi import APIRouter, Depends, status
-
+import zlib
+from datetime import date
+from typing import AsyncIterator, List, Literal, Optional
+from fastapi import APIRouter, Body, Depends, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from app.application.analytics import OrderAnalytics
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from app.application.cache.product_items_cache import ProductItemsCache
+from app.application.repositories.daily_sales_repository import DailySalesRepository
 from app.application.repositories.order_repository import OrderRepository
 from app.application.repositories.product_repository import ProductRepository
+from app.application.repositories.product_sales_repository import (
+    ProductSalesRepository,
+)
 from app.application.schemas.order import OrderCreateSchema, OrderUpdateSchema
 from app.application.use_cases.order.create_order import CreateOrderUseCase
+from app.application.use_cases.order.create_orders_batch import (
+    CreateOrdersBatchUseCase,
+)
 from app.application.use_cases.order.delete_order import DeleteOrderUseCase
+from app.application.use_cases.order.export_orders import ExportOrdersUseCase
 from app.application.use_cases.order.get_all_orders import GetallOrdersUseCase
+from app.application.use_cases.order.get_orders_page import GetOrdersPageUseCase
 from app.application.use_cases.order.get_order_by_id import GetOrderByIdUseCase
 from app.application.use_cases.order.update_order import UpdateOrderUseCase
-from app.infrastructure.database.mongodb import MongoDatabase
-from app.infrastructure.repositories.mongodb.mongodb_order_repository import (
-    MongodbOrderRepository,
-)
-from app.infrastructure.repositories.mongodb.mongodb_product_repository import (
-    MongodbProductRepository,
+from app.infrastructure.api.dependencies import (
+    get_analytics,
+    get_daily_sales_repository,
+    get_metrics_cache,
+    get_order_repository,
+    get_product_items_cache,
+    get_product_repository,
+    get_product_sales_repository,
 )
-
+from app.infrastructure.environment_configs import EnvironmentConfigs
 
 order_router = APIRouter(prefix="/orders")
 
-mongo_db = MongoDatabase()
-
-
-def get_order_repository() -> OrderRepository:
-    return MongodbOrderRepository(mongo_db.get_database())
-
-
-def get_product_repository() -> ProductRepository:
-    return MongodbProductRepository(mongo_db.get_database())
+env = EnvironmentConfigs()
 
 
 @order_router.post("", status_code=status.HTTP_201_CREATED)
@@ -35,19 +45,114 @@ async def create_order(
     order_data: OrderCreateSchema,
     order_repository: OrderRepository = Depends(get_order_repository),
     product_repository: ProductRepository = Depends(get_product_repository),
+    daily_sales_repository: DailySalesRepository = Depends(get_daily_sales_repository),
+    product_sales_repository: ProductSalesRepository = Depends(
+        get_product_sales_repository
+    ),
+    metrics_cache: DashboardMetricsCache = Depends(get_metrics_cache),
+    product_items_cache: ProductItemsCache = Depends(get_product_items_cache),
+    analytics: OrderAnalytics = Depends(get_analytics),
 ):
-    use_case = CreateOrderUseCase(order_repository, product_repository)
+    use_case = CreateOrderUseCase(
+        order_repository,
+        product_repository,
+        daily_sales_repository,
+        product_sales_repository,
+        metrics_cache,
+        product_items_cache,
+        analytics,
+    )
 
     return await use_case.execute(order_data)
 
 
+@order_router.post("/batch")
+async def create_orders_batch(
+    orders_data: List[OrderCreateSchema] = Body(
+        ..., min_length=1, max_length=env.orders_batch_max_size
+    ),
+    order_repository: OrderRepository = Depends(get_order_repository),
+    product_repository: ProductRepository = Depends(get_product_repository),
+    daily_sales_repository: DailySalesRepository = Depends(get_daily_sales_repository),
+    product_sales_repository: ProductSalesRepository = Depends(
+        get_product_sales_repository
+    ),
+    metrics_cache: DashboardMetricsCache = Depends(get_metrics_cache),
+    product_items_cache: ProductItemsCache = Depends(get_product_items_cache),
+    analytics: OrderAnalytics = Depends(get_analytics),
+):
+    use_case = CreateOrdersBatchUseCase(
+        order_repository,
+        product_repository,
+        daily_sales_repository,
+        product_sales_repository,
+        metrics_cache,
+        product_items_cache,
+        analytics,
+    )
+
+    return await use_case.execute(orders_data)
+
+
 @order_router.get("")
 async def get_orders(
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    after: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
+    sort_by: Literal["_id", "date"] = Query("_id"),
     order_repository: OrderRepository = Depends(get_order_repository),
 ):
-    use_case = GetallOrdersUseCase(order_repository)
+    if limit is None:
+        use_case = GetallOrdersUseCase(order_repository)
+
+        return ORJSONResponse(await use_case.execute())
+
+    use_case = GetOrdersPageUseCase(order_repository)
+
+    return await use_case.execute(
+        limit, after, fields.split(",") if fields else None, sort_by
+    )
+
+
+@order_router.get("/export")
+async def export_orders(
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    gzip: bool = Query(False),
+    order_repository: OrderRepository = Depends(get_order_repository),
+):
+    use_case = ExportOrdersUseCase(order_repository)
+
+    chunks = encode_chunks(use_case.execute(start_date, end_date, export_format))
+    headers = {"Content-Disposition": f'attachment; filename="orders.{export_format}"'}
+
+    if gzip:
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        chunks,
+        media_type="text/csv" if export_format == "csv" else "application/x-ndjson",
+        headers=headers,
+    )
+
+
+async def encode_chunks(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        yield chunk.encode()
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+
+    async for chunk in chunks:
+        compressed_chunk = compressor.compress(chunk)
+
+        if compressed_chunk:
+            yield compressed_chunk
 
-    return await use_case.execute()
+    yield compressor.flush()
 
 
 @order_router.get("/{order_id}")
@@ -66,8 +171,23 @@ async def update_order(
     order_data: OrderUpdateSchema,
     order_repository: OrderRepository = Depends(get_order_repository),
     product_repository: ProductRepository = Depends(get_product_repository),
+    daily_sales_repository: DailySalesRepository = Depends(get_daily_sales_repository),
+    product_sales_repository: ProductSalesRepository = Depends(
+        get_product_sales_repository
+    ),
+    metrics_cache: DashboardMetricsCache = Depends(get_metrics_cache),
+    product_items_cache: ProductItemsCache = Depends(get_product_items_cache),
+    analytics: OrderAnalytics = Depends(get_analytics),
 ):
-    use_case = UpdateOrderUseCase(order_repository, product_repository)
+    use_case = UpdateOrderUseCase(
+        order_repository,
+        product_repository,
+        daily_sales_repository,
+        product_sales_repository,
+        metrics_cache,
+        product_items_cache,
+        analytics,
+    )
 
     return await use_case.execute(order_id, order_data)
 
@@ -76,7 +196,19 @@ async def update_order(
 async def delete_order(
     order_id: str,
     order_repository: OrderRepository = Depends(get_order_repository),
+    daily_sales_repository: DailySalesRepository = Depends(get_daily_sales_repository),
+    product_sales_repository: ProductSalesRepository = Depends(
+        get_product_sales_repository
+    ),
+    metrics_cache: DashboardMetricsCache = Depends(get_metrics_cache),
+    analytics: OrderAnalytics = Depends(get_analytics),
 ):
-    use_case = DeleteOrderUseCase(order_repository)
+    use_case = DeleteOrderUseCase(
+        order_repository,
+        daily_sales_repository,
+        product_sales_repository,
+        metrics_cache,
+        analytics,
+    )
 
     await use_case.execute(order_id)
@@ -1,11 +1,28 @@
 import json
-from typing import Optional
-from fastapi import APIRouter, Depends, File, Form, UploadFile, status
+from typing import Literal, Optional
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    Query,
+    UploadFile,
+    status,
+)
 
+from app.application.analytics import OrderAnalytics
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from app.application.cache.product_items_cache import ProductItemsCache
 from app.application.file_storage.product_image_storage import ProductImageFileStorage
+from app.application.image_processing import ImageProcessor
 from app.application.repositories.category_repository import CategoryRepository
+from app.application.repositories.daily_sales_repository import DailySalesRepository
 from app.application.repositories.order_repository import OrderRepository
 from app.application.repositories.product_repository import ProductRepository
+from app.application.repositories.product_sales_repository import (
+    ProductSalesRepository,
+)
 from app.application.schemas.image_file import File as DomainFile
 from app.application.schemas.product import (
     ProductCreateSchema,
@@ -13,46 +30,38 @@ from app.application.schemas.product import (
 )
 from app.application.use_cases.product.create_product import CreateProductUseCase
 from app.application.use_cases.product.delete_product import DeleteProductUseCase
+from app.application.use_cases.product.generate_product_image_variants import (
+    GenerateProductImageVariantsUseCase,
+)
 from app.application.use_cases.product.get_all_products import GetAllProductsUseCase
+from app.application.use_cases.product.get_products_page import (
+    GetProductsPageUseCase,
+)
 from app.application.use_cases.product.get_product_by_id import GetProductByIdUseCase
+from app.application.use_cases.product.import_products import ImportProductsUseCase
 from app.application.use_cases.product.update_product import UpdateProductUseCase
-from app.infrastructure.database.mongodb import MongoDatabase
-from app.infrastructure.file_storage.s3.s3_product_image_storage import (
-    S3ProductImageFileStorage,
-)
-from app.infrastructure.repositories.mongodb.mongodb_category_repository import (
-    MongodbCategoryRepository,
+from app.infrastructure.api.dependencies import (
+    get_analytics,
+    get_category_repository,
+    get_daily_sales_repository,
+    get_image_file_storage,
+    get_image_processor,
+    get_metrics_cache,
+    get_order_repository,
+    get_product_items_cache,
+    get_product_repository,
+    get_product_sales_repository,
 )
-from app.infrastructure.repositories.mongodb.mongodb_order_repository import (
-    MongodbOrderRepository,
-)
-from app.infrastructure.repositories.mongodb.mongodb_product_repository import (
-    MongodbProductRepository,
-)
-
-product_router = APIRouter(prefix="/products")
-
-mongo_db = MongoDatabase()
+from app.infrastructure.environment_configs import EnvironmentConfigs
 
+env = EnvironmentConfigs()
 
-def get_product_repository() -> ProductRepository:
-    return MongodbProductRepository(mongo_db.get_database())
-
-
-def get_category_repository() -> CategoryRepository:
-    return MongodbCategoryRepository(mongo_db.get_database())
-
-
-def get_order_repository() -> OrderRepository:
-    return MongodbOrderRepository(mongo_db.get_database())
-
-
-def get_image_file_storage() -> ProductImageFileStorage:
-    return S3ProductImageFileStorage()
+product_router = APIRouter(prefix="/products")
 
 
 @product_router.post("", status_code=status.HTTP_201_CREATED)
 async def create_product(
+    background_tasks: BackgroundTasks,
     name: str = Form(...),
     description: str = Form(...),
     price: float = Form(...),
@@ -61,6 +70,7 @@ async def create_product(
     product_repository: ProductRepository = Depends(get_product_repository),
     category_repository: CategoryRepository = Depends(get_category_repository),
     image_file_storage: ProductImageFileStorage = Depends(get_image_file_storage),
+    image_processor: ImageProcessor = Depends(get_image_processor),
 ):
     use_case = CreateProductUseCase(
         product_repository, category_repository, image_file_storage
@@ -72,21 +82,78 @@ async def create_product(
         price=price,
         category_ids=json.loads(category_ids),
         image=DomainFile(
-            content=await image.read(),
+            content=image.file,
             content_type=image.content_type,
         ),
     )
 
-    return await use_case.execute(create_schema)
+    product = await use_case.execute(create_schema)
+
+    variants_use_case = GenerateProductImageVariantsUseCase(
+        product_repository, image_file_storage, image_processor
+    )
+    background_tasks.add_task(
+        variants_use_case.execute, product.id, product.image_version
+    )
+
+    return product
+
+
+@product_router.post("/import")
+async def import_products(
+    background_tasks: BackgroundTasks,
+    manifest: UploadFile = File(...),
+    images: UploadFile = File(...),
+    manifest_format: Literal["ndjson", "csv"] = Query("csv", alias="format"),
+    product_repository: ProductRepository = Depends(get_product_repository),
+    category_repository: CategoryRepository = Depends(get_category_repository),
+    image_file_storage: ProductImageFileStorage = Depends(get_image_file_storage),
+    image_processor: ImageProcessor = Depends(get_image_processor),
+):
+    use_case = ImportProductsUseCase(
+        product_repository,
+        category_repository,
+        image_file_storage,
+        env.product_import_concurrency,
+        env.product_import_max_image_size,
+    )
+
+    results = await use_case.execute(
+        DomainFile(content=manifest.file, content_type=manifest.content_type),
+        manifest_format,
+        DomainFile(content=images.file, content_type=images.content_type),
+    )
+
+    variants_use_case = GenerateProductImageVariantsUseCase(
+        product_repository, image_file_storage, image_processor
+    )
+
+    for result in results:
+        if result.success:
+            background_tasks.add_task(
+                variants_use_case.execute,
+                result.product.id,
+                result.product.image_version,
+            )
+
+    return results
 
 
 @product_router.get("")
 async def get_products(
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    after: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
     product_repository: ProductRepository = Depends(get_product_repository),
 ):
-    use_case = GetAllProductsUseCase(product_repository)
+    if limit is None:
+        use_case = GetAllProductsUseCase(product_repository)
+
+        return await use_case.execute()
 
-    return await use_case.execute()
+    use_case = GetProductsPageUseCase(product_repository)
+
+    return await use_case.execute(limit, after, fields.split(",") if fields else None)
 
 
 @product_router.get("/{product_id}")
@@ -102,6 +169,7 @@ async def get_product_by_id(
 @product_router.patch("/{product_id}")
 async def update_product(
     product_id: str,
+    background_tasks: BackgroundTasks,
     name: Optional[str] = Form(...),
     description: Optional[str] = Form(...),
     price: Optional[float] = Form(...),
@@ -110,9 +178,20 @@ async def update_product(
     product_repository: ProductRepository = Depends(get_product_repository),
     category_repository: CategoryRepository = Depends(get_category_repository),
     image_file_storage: ProductImageFileStorage = Depends(get_image_file_storage),
+    image_processor: ImageProcessor = Depends(get_image_processor),
+    product_sales_repository: ProductSalesRepository = Depends(
+        get_product_sales_repository
+    ),
+    metrics_cache: DashboardMetricsCache = Depends(get_metrics_cache),
+    product_items_cache: ProductItemsCache = Depends(get_product_items_cache),
 ):
     use_case = UpdateProductUseCase(
-        product_repository, category_repository, image_file_storage
+        product_repository,
+        category_repository,
+        image_file_storage,
+        product_sales_repository,
+        metrics_cache,
+        product_items_cache,
     )
 
     update_schema = ProductUpdateSchema(
@@ -121,13 +200,23 @@ async def update_product(
         price=price,
         category_ids=json.loads(category_ids) if category_ids else None,
         image=(
-            DomainFile(content=await image.read(), content_type=image.content_type)
+            DomainFile(content=image.file, content_type=image.content_type)
             if image
             else None
         ),
     )
 
-    return await use_case.execute(product_id, update_schema)
+    product = await use_case.execute(product_id, update_schema)
+
+    if image:
+        variants_use_case = GenerateProductImageVariantsUseCase(
+            product_repository, image_file_storage, image_processor
+        )
+        background_tasks.add_task(
+            variants_use_case.execute, product.id, product.image_version
+        )
+
+    return product
 
 
 @product_router.delete("/{product_id}")
@@ -135,10 +224,24 @@ async def delete_product(
     product_id: str,
     product_repository: ProductRepository = Depends(get_product_repository),
     order_repository: OrderRepository = Depends(get_order_repository),
+    daily_sales_repository: DailySalesRepository = Depends(get_daily_sales_repository),
+    product_sales_repository: ProductSalesRepository = Depends(
+        get_product_sales_repository
+    ),
     image_file_storage: ProductImageFileStorage = Depends(get_image_file_storage),
+    metrics_cache: DashboardMetricsCache = Depends(get_metrics_cache),
+    product_items_cache: ProductItemsCache = Depends(get_product_items_cache),
+    analytics: OrderAnalytics = Depends(get_analytics),
 ):
     use_case = DeleteProductUseCase(
-        product_repository, order_repository, image_file_storage
+        product_repository,
+        order_repository,
+        daily_sales_repository,
+        product_sales_repository,
+        image_file_storage,
+        metrics_cache,
+        product_items_cache,
+        analytics,
     )
 
     await use_case.execute(product_id)
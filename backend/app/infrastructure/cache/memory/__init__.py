@@ -0,0 +1,45 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from app.application.cache import BaseCache
+
+
+class MemoryCache(BaseCache):
+    def __init__(self, max_size: int, ttl_seconds: float):
+        super().__init__()
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self.entries.get(key)
+
+        if entry is None:
+            return
+
+        expires_at, value = entry
+
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return
+
+        self.entries.move_to_end(key)
+
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        self.entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self.entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self.entries.clear()
+
+    def get_stats(self) -> dict:
+        return {**super().get_stats(), "size": len(self.entries)}
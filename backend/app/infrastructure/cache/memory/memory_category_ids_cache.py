@@ -0,0 +1,23 @@
+from app.application.cache.category_ids_cache import CategoryIdsCache
+from app.infrastructure.environment_configs import EnvironmentConfigs
+from . import MemoryCache
+
+env = EnvironmentConfigs()
+
+
+class MemoryCategoryIdsCache(CategoryIdsCache, MemoryCache):
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(MemoryCategoryIdsCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            super().__init__(
+                max_size=1,
+                ttl_seconds=env.category_ids_cache_ttl_seconds,
+            )
+            self._initialized = True
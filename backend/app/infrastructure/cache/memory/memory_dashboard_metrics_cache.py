@@ -0,0 +1,23 @@
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from app.infrastructure.environment_configs import EnvironmentConfigs
+from . import MemoryCache
+
+env = EnvironmentConfigs()
+
+
+class MemoryDashboardMetricsCache(DashboardMetricsCache, MemoryCache):
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(MemoryDashboardMetricsCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            super().__init__(
+                max_size=env.dashboard_metrics_cache_max_size,
+                ttl_seconds=env.dashboard_metrics_cache_ttl_seconds,
+            )
+            self._initialized = True
@@ -0,0 +1,23 @@
+from app.application.cache.product_items_cache import ProductItemsCache
+from app.infrastructure.environment_configs import EnvironmentConfigs
+from . import MemoryCache
+
+env = EnvironmentConfigs()
+
+
+class MemoryProductItemsCache(ProductItemsCache, MemoryCache):
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(MemoryProductItemsCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            super().__init__(
+                max_size=env.product_items_cache_max_size,
+                ttl_seconds=env.product_items_cache_max_staleness_seconds,
+            )
+            self._initialized = True
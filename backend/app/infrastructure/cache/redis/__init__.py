@@ -0,0 +1,73 @@
+import json
+from time import monotonic
+from typing import Any, Optional
+from redis.asyncio import Redis
+
+from app.application.cache import BaseCache
+
+
+class RedisCache(BaseCache):
+    def __init__(
+        self,
+        redis_url: str,
+        namespace: str,
+        ttl_seconds: float,
+        generation_ttl_seconds: float,
+    ):
+        super().__init__()
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.generation_ttl_seconds = generation_ttl_seconds
+        self.generation: Optional[int] = None
+        self.generation_expires_at = 0.0
+        self.redis_client = Redis.from_url(redis_url)
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = await self.redis_client.get(await self.__get_redis_key(key))
+
+        if value is None:
+            return
+
+        return self.loads(value)
+
+    async def set(self, key: str, value: Any) -> None:
+        if self.generation is None:
+            await self.__get_redis_key(key)
+
+        await self.redis_client.set(
+            f"{self.namespace}:{self.generation}:{key}",
+            self.dumps(value),
+            px=int(self.ttl_seconds * 1000),
+        )
+
+    async def delete(self, key: str) -> None:
+        await self.redis_client.delete(await self.__get_redis_key(key))
+
+    async def clear(self) -> None:
+        self.__set_generation(await self.redis_client.incr(self.__get_generation_key()))
+
+    async def close(self) -> None:
+        await self.redis_client.aclose()
+
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value)
+
+    def loads(self, value: bytes) -> Any:
+        return json.loads(value)
+
+    async def __get_redis_key(self, key: str) -> str:
+        if self.generation is None or monotonic() >= self.generation_expires_at:
+            generation = await self.redis_client.get(self.__get_generation_key())
+            self.__set_generation(int(generation or 0))
+
+        return f"{self.namespace}:{self.generation}:{key}"
+
+    def __set_generation(self, generation: int) -> None:
+        if self.generation is not None and generation != self.generation:
+            self.version += 1
+
+        self.generation = generation
+        self.generation_expires_at = monotonic() + self.generation_ttl_seconds
+
+    def __get_generation_key(self) -> str:
+        return f"{self.namespace}:generation"
@@ -0,0 +1,34 @@
+from typing import Any
+
+from app.application.cache.dashboard_metrics_cache import DashboardMetricsCache
+from app.application.schemas.dashboard import DashboardMetricsSchema
+from app.infrastructure.environment_configs import EnvironmentConfigs
+from . import RedisCache
+
+env = EnvironmentConfigs()
+
+
+class RedisDashboardMetricsCache(DashboardMetricsCache, RedisCache):
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(RedisDashboardMetricsCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            super().__init__(
+                redis_url=env.redis_url,
+                namespace="dashboard_metrics",
+                ttl_seconds=env.dashboard_metrics_cache_ttl_seconds,
+                generation_ttl_seconds=env.redis_cache_generation_ttl_seconds,
+            )
+            self._initialized = True
+
+    def dumps(self, value: DashboardMetricsSchema) -> str:
+        return value.model_dump_json()
+
+    def loads(self, value: bytes) -> Any:
+        return DashboardMetricsSchema.model_validate_json(value)
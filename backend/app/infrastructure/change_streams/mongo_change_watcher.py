@@ -0,0 +1,179 @@
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import OperationFailure, PyMongoError
+
+from app.application.change_events import ChangeEvent, ChangeEventConsumer
+from app.infrastructure.environment_configs import EnvironmentConfigs
+
+logger = logging.getLogger(__name__)
+
+env = EnvironmentConfigs()
+
+WATCHED_COLLECTIONS = ["orders", "products", "categories"]
+DOCUMENT_OPERATIONS = ["insert", "update", "replace", "delete"]
+
+CHANGE_STREAMS_NOT_SUPPORTED = 40573
+CHANGE_STREAM_HISTORY_LOST = 286
+
+
+class MongoChangeWatcher:
+    def __init__(self, db: AsyncDatabase):
+        self.db = db
+        self.tokens_collection = self.db["change_stream_tokens"]
+        self.consumers: List[ChangeEventConsumer] = []
+        self.task: Optional[asyncio.Task] = None
+        self.saved_token: Optional[dict] = None
+
+    def register(self, consumer: ChangeEventConsumer) -> None:
+        self.consumers.append(consumer)
+
+    def start(self) -> None:
+        if env.change_stream_mode != "off" and self.task is None:
+            self.task = asyncio.create_task(self.__run())
+
+    async def stop(self) -> None:
+        if self.task is None:
+            return
+
+        self.task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self.task
+
+        self.task = None
+
+    async def __run(self) -> None:
+        mode = env.change_stream_mode
+
+        while True:
+            try:
+                if mode == "poll":
+                    await self.__poll()
+                else:
+                    await self.__watch()
+            except OperationFailure as error:
+                if error.code == CHANGE_STREAMS_NOT_SUPPORTED and mode == "auto":
+                    logger.warning("Change streams not supported, polling for changes")
+                    mode = "poll"
+                    continue
+
+                if error.code == CHANGE_STREAM_HISTORY_LOST:
+                    logger.warning("Change stream history lost, invalidating consumers")
+                    await self.__reset()
+                    continue
+
+                logger.warning("Change stream failed: %s", error)
+            except PyMongoError as error:
+                logger.warning("Change stream failed: %s", error)
+
+            await asyncio.sleep(env.change_stream_retry_seconds)
+
+    async def __watch(self) -> None:
+        token_document = await self.tokens_collection.find_one(
+            {"_id": env.change_stream_name}
+        )
+        self.saved_token = token_document["token"] if token_document else None
+
+        stream = await self.db.watch(
+            [{"$match": {"ns.coll": {"$in": WATCHED_COLLECTIONS}}}],
+            full_document="updateLookup",
+            resume_after=self.saved_token,
+            max_await_time_ms=env.change_stream_max_await_ms,
+        )
+
+        async with stream:
+            while stream.alive:
+                events = []
+                change = await stream.try_next()
+
+                while change is not None:
+                    events.append(self.__to_event(change))
+
+                    if len(events) >= env.change_stream_batch_size:
+                        break
+
+                    change = await stream.try_next()
+
+                if len(events) > 0:
+                    await self.__dispatch(events)
+                    await self.__save_token(stream.resume_token)
+
+    async def __poll(self) -> None:
+        collection_stats: Optional[Dict[str, Tuple[int, Optional[datetime]]]] = None
+
+        while True:
+            current_stats = {
+                collection: await self.__get_collection_stats(collection)
+                for collection in WATCHED_COLLECTIONS
+            }
+
+            if collection_stats is not None:
+                await self.__dispatch(
+                    [
+                        ChangeEvent(collection=collection, operation="invalidate")
+                        for collection in WATCHED_COLLECTIONS
+                        if current_stats[collection] != collection_stats[collection]
+                    ]
+                )
+
+            collection_stats = current_stats
+
+            await asyncio.sleep(env.change_stream_poll_seconds)
+
+    async def __get_collection_stats(
+        self, collection: str
+    ) -> Tuple[int, Optional[datetime]]:
+        count = await self.db[collection].estimated_document_count()
+        last_document = await self.db[collection].find_one(
+            {"updated_at": {"$exists": True}},
+            {"updated_at": 1},
+            sort=[("updated_at", -1)],
+        )
+
+        return count, last_document["updated_at"] if last_document else None
+
+    async def __reset(self) -> None:
+        await self.tokens_collection.delete_one({"_id": env.change_stream_name})
+        await self.__dispatch(
+            [
+                ChangeEvent(collection=collection, operation="invalidate")
+                for collection in WATCHED_COLLECTIONS
+            ]
+        )
+
+    async def __dispatch(self, events: List[ChangeEvent]) -> None:
+        if len(events) == 0:
+            return
+
+        for consumer in self.consumers:
+            try:
+                await consumer.handle(events)
+            except Exception:
+                logger.exception(
+                    "Change event consumer %s failed", type(consumer).__name__
+                )
+
+    async def __save_token(self, token: Optional[dict]) -> None:
+        if token is None or token == self.saved_token:
+            return
+
+        await self.tokens_collection.update_one(
+            {"_id": env.change_stream_name},
+            {"$set": {"token": token, "updated_at": datetime.now(timezone.utc)}},
+            upsert=True,
+        )
+        self.saved_token = token
+
+    def __to_event(self, change: dict) -> ChangeEvent:
+        operation = change["operationType"]
+
+        return ChangeEvent(
+            collection=change.get("ns", {}).get("coll"),
+            operation=operation if operation in DOCUMENT_OPERATIONS else "invalidate",
+            document_id=change.get("documentKey", {}).get("_id"),
+            document=change.get("fullDocument"),
+        )
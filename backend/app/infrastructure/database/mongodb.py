@@ -1,7 +1,8 @@
-from pymongo import MongoClient
-from pymongo.database import Database
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.infrastructure.environment_configs import EnvironmentConfigs
+from app.infrastructure.monitoring.mongo_command_listener import MongoCommandListener
 
 env = EnvironmentConfigs()
 
@@ -17,8 +18,20 @@ class MongoDatabase:
 
     def __init__(self):
         if not self._initialized:
-            self.value = MongoClient(env.mongo_uri)[env.mongo_db]
+            self.client = AsyncMongoClient(
+                env.mongo_uri,
+                maxPoolSize=env.mongo_max_pool_size,
+                minPoolSize=env.mongo_min_pool_size,
+                connectTimeoutMS=env.mongo_connect_timeout_ms,
+                serverSelectionTimeoutMS=env.mongo_server_selection_timeout_ms,
+                socketTimeoutMS=env.mongo_socket_timeout_ms,
+                event_listeners=[MongoCommandListener()],
+            )
+            self.value = self.client[env.mongo_db]
             self._initialized = True
 
-    def get_database(self) -> Database:
+    def get_database(self) -> AsyncDatabase:
         return self.value
+
+    async def close(self) -> None:
+        await self.client.close()
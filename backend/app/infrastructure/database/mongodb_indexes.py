@@ -0,0 +1,219 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from pymongo.asynchronous.database import AsyncDatabase
+
+
+@dataclass
+class IndexedQuery:
+    repository_method: str
+    filter: Dict[str, Any]
+    sort: Optional[List[Tuple[str, int]]] = None
+
+
+@dataclass
+class MongoIndex:
+    collection: str
+    name: str
+    keys: List[Tuple[str, int]]
+    queries: List[IndexedQuery] = field(default_factory=list)
+
+
+MONGO_INDEXES = [
+    MongoIndex(
+        collection="orders",
+        name="orders_date",
+        keys=[("date", 1), ("_id", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongodbOrderRepository.stream",
+                filter={"date": {"$gte": datetime(2000, 1, 1)}},
+                sort=[("date", 1)],
+            ),
+            IndexedQuery(
+                repository_method="MongodbOrderRepository.get_page",
+                filter={},
+                sort=[("date", 1), ("_id", 1)],
+            ),
+            IndexedQuery(
+                repository_method="MongodbDailySalesRepository.rebuild",
+                filter={"date": {"$gte": datetime(2000, 1, 1)}},
+                sort=[("date", 1)],
+            ),
+        ],
+    ),
+    MongoIndex(
+        collection="orders",
+        name="orders_date_total",
+        keys=[("date", 1), ("total", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongodbOrderRepository.get_metrics",
+                filter={
+                    "date": {
+                        "$gte": datetime(2000, 1, 1),
+                        "$lte": datetime(2000, 12, 31),
+                    }
+                },
+            ),
+        ],
+    ),
+    MongoIndex(
+        collection="orders",
+        name="orders_product_ids",
+        keys=[("product_ids", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongodbOrderRepository.get_by_product",
+                filter={"product_ids": {"$in": [""]}},
+            ),
+        ],
+    ),
+    MongoIndex(
+        collection="products",
+        name="products_category_ids",
+        keys=[("category_ids", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongodbProductRepository.get_by_category",
+                filter={"category_ids": {"$in": [""]}},
+            ),
+        ],
+    ),
+    MongoIndex(
+        collection="daily_sales",
+        name="daily_sales_date",
+        keys=[("date", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongodbOrderRepository.get_metrics",
+                filter={"date": {"$gte": datetime(2000, 1, 1)}},
+            ),
+        ],
+    ),
+    MongoIndex(
+        collection="product_sales",
+        name="product_sales_count",
+        keys=[("count", -1), ("_id", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongodbOrderRepository.get_metrics",
+                filter={"count": {"$gt": 0}},
+                sort=[("count", -1), ("_id", 1)],
+            ),
+        ],
+    ),
+    MongoIndex(
+        collection="product_sales",
+        name="product_sales_product_id",
+        keys=[("product_id", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongodbProductSalesRepository.rename_product",
+                filter={"product_id": ""},
+            ),
+        ],
+    ),
+    MongoIndex(
+        collection="product_daily_sales",
+        name="product_daily_sales_date",
+        keys=[("date", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongodbOrderRepository.get_metrics",
+                filter={"date": {"$gte": datetime(2000, 1, 1)}},
+            ),
+        ],
+    ),
+    MongoIndex(
+        collection="product_daily_sales",
+        name="product_daily_sales_product_id",
+        keys=[("product_id", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongodbProductSalesRepository.rename_product",
+                filter={"product_id": ""},
+            ),
+        ],
+    ),
+    MongoIndex(
+        collection="orders",
+        name="orders_updated_at",
+        keys=[("updated_at", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongoChangeWatcher.poll",
+                filter={"updated_at": {"$exists": True}},
+                sort=[("updated_at", -1)],
+            ),
+        ],
+    ),
+    MongoIndex(
+        collection="products",
+        name="products_updated_at",
+        keys=[("updated_at", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongoChangeWatcher.poll",
+                filter={"updated_at": {"$exists": True}},
+                sort=[("updated_at", -1)],
+            ),
+        ],
+    ),
+    MongoIndex(
+        collection="categories",
+        name="categories_updated_at",
+        keys=[("updated_at", 1)],
+        queries=[
+            IndexedQuery(
+                repository_method="MongoChangeWatcher.poll",
+                filter={"updated_at": {"$exists": True}},
+                sort=[("updated_at", -1)],
+            ),
+        ],
+    ),
+]
+
+
+async def create_indexes(db: AsyncDatabase) -> List[str]:
+    for mongo_index in MONGO_INDEXES:
+        await db[mongo_index.collection].create_index(
+            mongo_index.keys, name=mongo_index.name
+        )
+
+    return [mongo_index.name for mongo_index in MONGO_INDEXES]
+
+
+async def get_collection_scans(db: AsyncDatabase) -> List[str]:
+    collection_scans = []
+
+    for mongo_index in MONGO_INDEXES:
+        for query in mongo_index.queries:
+            find_command = {"find": mongo_index.collection, "filter": query.filter}
+
+            if query.sort:
+                find_command["sort"] = dict(query.sort)
+
+            explain = await db.command(
+                {"explain": find_command, "verbosity": "queryPlanner"}
+            )
+
+            if has_stage(explain["queryPlanner"]["winningPlan"], "COLLSCAN"):
+                collection_scans.append(
+                    f"{query.repository_method} ({mongo_index.collection})"
+                )
+
+    return collection_scans
+
+
+def has_stage(plan: Any, stage: str) -> bool:
+    if isinstance(plan, dict):
+        if plan.get("stage") == stage:
+            return True
+
+        return any(has_stage(value, stage) for value in plan.values())
+
+    if isinstance(plan, list):
+        return any(has_stage(value, stage) for value in plan)
+
+    return False
@@ -1,5 +1,6 @@
 import os
-from typing import Optional
+import socket
+from typing import List, Optional
 
 
 class EnvironmentConfigs:
@@ -17,6 +18,78 @@ class EnvironmentConfigs:
                 "MONGO_URI", "mongodb://dbuser:dbpassword@db:27017/"
             )
             self._mongo_db = os.environ.get("MONGO_DB", "db")
+            self._mongo_max_pool_size = int(
+                os.environ.get("MONGO_MAX_POOL_SIZE", "100")
+            )
+            self._mongo_min_pool_size = int(os.environ.get("MONGO_MIN_POOL_SIZE", "0"))
+            self._mongo_connect_timeout_ms = int(
+                os.environ.get("MONGO_CONNECT_TIMEOUT_MS", "5000")
+            )
+            self._mongo_server_selection_timeout_ms = int(
+                os.environ.get("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000")
+            )
+            self._mongo_socket_timeout_ms = int(
+                os.environ.get("MONGO_SOCKET_TIMEOUT_MS", "30000")
+            )
+            self._mongo_slow_query_ms = float(
+                os.environ.get("MONGO_SLOW_QUERY_MS", "100")
+            )
+            self._dashboard_metrics_source = os.environ.get(
+                "DASHBOARD_METRICS_SOURCE", "rollup"
+            )
+            self._dashboard_metrics_cache_backend = os.environ.get(
+                "DASHBOARD_METRICS_CACHE_BACKEND", "memory"
+            )
+            self._dashboard_metrics_cache_ttl_seconds = float(
+                os.environ.get("DASHBOARD_METRICS_CACHE_TTL_SECONDS", "30")
+            )
+            self._dashboard_metrics_cache_max_size = int(
+                os.environ.get("DASHBOARD_METRICS_CACHE_MAX_SIZE", "256")
+            )
+            self._analytics_refresh_seconds = float(
+                os.environ.get("ANALYTICS_REFRESH_SECONDS", "300")
+            )
+            self._analytics_load_batch_size = int(
+                os.environ.get("ANALYTICS_LOAD_BATCH_SIZE", "10000")
+            )
+            self._change_stream_mode = os.environ.get("CHANGE_STREAM_MODE", "auto")
+            self._change_stream_name = os.environ.get(
+                "CHANGE_STREAM_NAME", f"api-{socket.gethostname()}"
+            )
+            self._change_stream_batch_size = int(
+                os.environ.get("CHANGE_STREAM_BATCH_SIZE", "500")
+            )
+            self._change_stream_max_await_ms = int(
+                os.environ.get("CHANGE_STREAM_MAX_AWAIT_MS", "1000")
+            )
+            self._change_stream_poll_seconds = float(
+                os.environ.get("CHANGE_STREAM_POLL_SECONDS", "5")
+            )
+            self._change_stream_retry_seconds = float(
+                os.environ.get("CHANGE_STREAM_RETRY_SECONDS", "5")
+            )
+            self._category_ids_cache_ttl_seconds = float(
+                os.environ.get("CATEGORY_IDS_CACHE_TTL_SECONDS", "60")
+            )
+            self._product_items_cache_max_size = int(
+                os.environ.get("PRODUCT_ITEMS_CACHE_MAX_SIZE", "10000")
+            )
+            self._product_items_cache_max_staleness_seconds = float(
+                os.environ.get("PRODUCT_ITEMS_CACHE_MAX_STALENESS_SECONDS", "30")
+            )
+            self._redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+            self._redis_cache_generation_ttl_seconds = float(
+                os.environ.get("REDIS_CACHE_GENERATION_TTL_SECONDS", "1")
+            )
+            self._orders_batch_max_size = int(
+                os.environ.get("ORDERS_BATCH_MAX_SIZE", "1000")
+            )
+            self._product_import_concurrency = int(
+                os.environ.get("PRODUCT_IMPORT_CONCURRENCY", "8")
+            )
+            self._product_import_max_image_size = int(
+                os.environ.get("PRODUCT_IMPORT_MAX_IMAGE_SIZE", str(10 * 1024 * 1024))
+            )
             self._aws_access_key_id = os.environ.get("AWS_ACCESS_KEY_ID", "")
             self._aws_secret_access_key = os.environ.get("AWS_SECRET_ACCESS_KEY", "")
             self._region_name = os.environ.get("AWS_REGION", "us-east-1")
@@ -24,6 +97,31 @@ class EnvironmentConfigs:
             self._product_images_bucket_name = os.environ.get(
                 "PRODUCT_IMAGES_BUCKET_NAME", ""
             )
+            self._reports_bucket_name = os.environ.get(
+                "REPORTS_BUCKET_NAME", self._product_images_bucket_name
+            )
+            self._reports_concurrency = int(os.environ.get("REPORTS_CONCURRENCY", "4"))
+            self._daily_sales_rebuild_days = int(
+                os.environ.get("DAILY_SALES_REBUILD_DAYS", "3")
+            )
+            self._s3_max_concurrency = int(os.environ.get("S3_MAX_CONCURRENCY", "10"))
+            self._s3_multipart_part_size = int(
+                os.environ.get("S3_MULTIPART_PART_SIZE", str(8 * 1024 * 1024))
+            )
+            self._s3_multipart_concurrency = int(
+                os.environ.get("S3_MULTIPART_CONCURRENCY", "4")
+            )
+            self._file_storage_backend = os.environ.get("FILE_STORAGE_BACKEND", "s3")
+            self._image_thumbnail_sizes = [
+                int(size)
+                for size in os.environ.get("IMAGE_THUMBNAIL_SIZES", "128,512").split(
+                    ","
+                )
+            ]
+            self._image_webp_quality = int(os.environ.get("IMAGE_WEBP_QUALITY", "80"))
+            self._image_processing_workers = int(
+                os.environ.get("IMAGE_PROCESSING_WORKERS", "2")
+            )
 
             self._initialized = True
 
@@ -35,6 +133,110 @@ class EnvironmentConfigs:
     def mongo_db(self) -> str:
         return self._mongo_db
 
+    @property
+    def mongo_max_pool_size(self) -> int:
+        return self._mongo_max_pool_size
+
+    @property
+    def mongo_min_pool_size(self) -> int:
+        return self._mongo_min_pool_size
+
+    @property
+    def mongo_connect_timeout_ms(self) -> int:
+        return self._mongo_connect_timeout_ms
+
+    @property
+    def mongo_server_selection_timeout_ms(self) -> int:
+        return self._mongo_server_selection_timeout_ms
+
+    @property
+    def mongo_socket_timeout_ms(self) -> int:
+        return self._mongo_socket_timeout_ms
+
+    @property
+    def mongo_slow_query_ms(self) -> float:
+        return self._mongo_slow_query_ms
+
+    @property
+    def dashboard_metrics_source(self) -> str:
+        return self._dashboard_metrics_source
+
+    @property
+    def dashboard_metrics_cache_backend(self) -> str:
+        return self._dashboard_metrics_cache_backend
+
+    @property
+    def dashboard_metrics_cache_ttl_seconds(self) -> float:
+        return self._dashboard_metrics_cache_ttl_seconds
+
+    @property
+    def dashboard_metrics_cache_max_size(self) -> int:
+        return self._dashboard_metrics_cache_max_size
+
+    @property
+    def analytics_refresh_seconds(self) -> float:
+        return self._analytics_refresh_seconds
+
+    @property
+    def analytics_load_batch_size(self) -> int:
+        return self._analytics_load_batch_size
+
+    @property
+    def change_stream_mode(self) -> str:
+        return self._change_stream_mode
+
+    @property
+    def change_stream_name(self) -> str:
+        return self._change_stream_name
+
+    @property
+    def change_stream_batch_size(self) -> int:
+        return self._change_stream_batch_size
+
+    @property
+    def change_stream_max_await_ms(self) -> int:
+        return self._change_stream_max_await_ms
+
+    @property
+    def change_stream_poll_seconds(self) -> float:
+        return self._change_stream_poll_seconds
+
+    @property
+    def change_stream_retry_seconds(self) -> float:
+        return self._change_stream_retry_seconds
+
+    @property
+    def category_ids_cache_ttl_seconds(self) -> float:
+        return self._category_ids_cache_ttl_seconds
+
+    @property
+    def product_items_cache_max_size(self) -> int:
+        return self._product_items_cache_max_size
+
+    @property
+    def product_items_cache_max_staleness_seconds(self) -> float:
+        return self._product_items_cache_max_staleness_seconds
+
+    @property
+    def redis_url(self) -> str:
+        return self._redis_url
+
+    @property
+    def redis_cache_generation_ttl_seconds(self) -> float:
+        return self._redis_cache_generation_ttl_seconds
+
+    @property
+    def orders_batch_max_size(self) -> int:
+        return self._orders_batch_max_size
+
+    @property
+    def product_import_concurrency(self) -> int:
+        return self._product_import_concurrency
+
+    @property
+    def product_import_max_image_size(self) -> int:
+        return self._product_import_max_image_size
+
     @property
     def aws_access_key_id(self) -> str:
         return self._aws_access_key_id
@@ -54,3 +256,43 @@ class EnvironmentConfigs:
     @property
     def product_images_bucket_name(self) -> str:
         return self._product_images_bucket_name
+
+    @property
+    def reports_bucket_name(self) -> str:
+        return self._reports_bucket_name
+
+    @property
+    def reports_concurrency(self) -> int:
+        return self._reports_concurrency
+
+    @property
+    def daily_sales_rebuild_days(self) -> int:
+        return self._daily_sales_rebuild_days
+
+    @property
+    def s3_max_concurrency(self) -> int:
+        return self._s3_max_concurrency
+
+    @property
+    def s3_multipart_part_size(self) -> int:
+        return self._s3_multipart_part_size
+
+    @property
+    def s3_multipart_concurrency(self) -> int:
+        return self._s3_multipart_concurrency
+
+    @property
+    def file_storage_backend(self) -> str:
+        return self._file_storage_backend
+
+    @property
+    def image_thumbnail_sizes(self) -> List[int]:
+        return self._image_thumbnail_sizes
+
+    @property
+    def image_webp_quality(self) -> int:
+        return self._image_webp_quality
+
+    @property
+    def image_processing_workers(self) -> int:
+        return self._image_processing_workers
@@ -0,0 +1,24 @@
+from typing import Dict, Optional, Tuple
+
+from app.application.file_storage import BaseFileStorage
+from app.application.schemas.image_file import File
+
+
+class MemoryFileStorage(BaseFileStorage):
+    def __init__(self, bucket_name: str):
+        self.bucket_name = bucket_name
+        self.files: Dict[str, Tuple[bytes, Optional[str]]] = {}
+
+    async def put(self, key: str, file: File) -> str:
+        self.files[key] = (file.open().read(), file.content_type)
+
+        return f"memory://{self.bucket_name}/{key}"
+
+    async def get(self, key: str) -> bytes:
+        if key not in self.files:
+            raise KeyError(key)
+
+        return self.files[key][0]
+
+    async def delete(self, key: str):
+        self.files.pop(key, None)
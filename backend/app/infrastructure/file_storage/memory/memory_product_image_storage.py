@@ -0,0 +1,20 @@
+from app.application.file_storage.product_image_storage import ProductImageFileStorage
+from app.infrastructure.environment_configs import EnvironmentConfigs
+from . import MemoryFileStorage
+
+env = EnvironmentConfigs()
+
+
+class MemoryProductImageFileStorage(ProductImageFileStorage, MemoryFileStorage):
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(MemoryProductImageFileStorage, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            super().__init__(bucket_name=env.product_images_bucket_name)
+            self._initialized = True
@@ -0,0 +1,20 @@
+from app.application.file_storage.report_file_storage import ReportFileStorage
+from app.infrastructure.environment_configs import EnvironmentConfigs
+from . import MemoryFileStorage
+
+env = EnvironmentConfigs()
+
+
+class MemoryReportFileStorage(ReportFileStorage, MemoryFileStorage):
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(MemoryReportFileStorage, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            super().__init__(bucket_name=env.reports_bucket_name)
+            self._initialized = True
@@ -1,4 +1,10 @@
+import asyncio
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional
 
 from app.application.file_storage import BaseFileStorage
 from app.application.schemas.image_file import File
@@ -11,10 +17,22 @@ class S3FileStorage(BaseFileStorage):
     def __init__(
         self,
         bucket_name: str,
+        acl: Optional[str] = "public-read",
     ):
         self.bucket_name = bucket_name
+        self.acl = acl
         self.region_name = env.region_name
 
+        self.executor = ThreadPoolExecutor(
+            max_workers=env.s3_max_concurrency, thread_name_prefix="s3"
+        )
+
+        self.transfer_config = TransferConfig(
+            multipart_threshold=env.s3_multipart_part_size,
+            multipart_chunksize=env.s3_multipart_part_size,
+            max_concurrency=env.s3_multipart_concurrency,
+        )
+
         extra_args = {}
 
         if env.aws_local_endpoint:
@@ -25,16 +43,26 @@ class S3FileStorage(BaseFileStorage):
             aws_access_key_id=env.aws_access_key_id,
             aws_secret_access_key=env.aws_secret_access_key,
             region_name=env.region_name,
+            config=Config(max_pool_connections=env.s3_max_concurrency),
             **extra_args,
         )
 
     async def put(self, key: str, file: File) -> str:
-        self.s3_client.put_object(
+        extra_args = {}
+
+        if self.acl:
+            extra_args["ACL"] = self.acl
+
+        if file.content_type:
+            extra_args["ContentType"] = file.content_type
+
+        await self.__run(
+            self.s3_client.upload_fileobj,
+            Fileobj=file.open(),
             Bucket=self.bucket_name,
             Key=key,
-            Body=file.content,
-            ACL="public-read",
-            ContentType=file.content_type,
+            ExtraArgs=extra_args,
+            Config=self.transfer_config,
         )
 
         return self.__get_file_url(key)
@@ -45,5 +73,21 @@ class S3FileStorage(BaseFileStorage):
 
         return f"https://{self.bucket_name}.s3.{self.region_name}.amazonaws.com/{key}"
 
+    async def get(self, key: str) -> bytes:
+        response = await self.__run(
+            self.s3_client.get_object, Bucket=self.bucket_name, Key=key
+        )
+
+        return await self.__run(response["Body"].read)
+
     async def delete(self, key: str):
-        self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
+        await self.__run(self.s3_client.delete_object, Bucket=self.bucket_name, Key=key)
+
+    async def __run(self, function, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(function, **kwargs)
+        )
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+        self.s3_client.close()
@@ -7,5 +7,15 @@ env = EnvironmentConfigs()
 
 
 class S3ProductImageFileStorage(ProductImageFileStorage, S3FileStorage):
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(S3ProductImageFileStorage, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
     def __init__(self):
-        super().__init__(bucket_name=env.product_images_bucket_name)
+        if not self._initialized:
+            super().__init__(bucket_name=env.product_images_bucket_name)
+            self._initialized = True
@@ -0,0 +1,20 @@
+from app.application.file_storage.report_file_storage import ReportFileStorage
+from app.infrastructure.environment_configs import EnvironmentConfigs
+from . import S3FileStorage
+
+env = EnvironmentConfigs()
+
+
+class S3ReportFileStorage(ReportFileStorage, S3FileStorage):
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(S3ReportFileStorage, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            super().__init__(bucket_name=env.reports_bucket_name, acl=None)
+            self._initialized = True
@@ -0,0 +1,80 @@
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from app.application.image_processing import ImageProcessor
+from app.application.schemas.image_file import File
+from app.domain.exceptions.invalid_image_exception import InvalidImageException
+from app.infrastructure.environment_configs import EnvironmentConfigs
+
+env = EnvironmentConfigs()
+
+
+class PillowImageProcessor(ImageProcessor):
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(PillowImageProcessor, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            self.executor = ProcessPoolExecutor(
+                max_workers=env.image_processing_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            self._initialized = True
+
+    async def create_variants(self, content: bytes) -> Dict[str, File]:
+        try:
+            variants = await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                create_image_variants,
+                content,
+                env.image_thumbnail_sizes,
+                env.image_webp_quality,
+            )
+        except (
+            UnidentifiedImageError,
+            Image.DecompressionBombError,
+            OSError,
+        ) as error:
+            raise InvalidImageException(f"Image could not be processed: {error}")
+
+        return {
+            name: File(content=variant, content_type="image/webp")
+            for name, variant in variants.items()
+        }
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+
+
+def create_image_variants(
+    content: bytes, thumbnail_sizes: List[int], webp_quality: int
+) -> Dict[str, bytes]:
+    with Image.open(io.BytesIO(content)) as image:
+        image = ImageOps.exif_transpose(image)
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+        variants = {"webp": encode_webp(image, webp_quality)}
+
+        for size in thumbnail_sizes:
+            thumbnail = image.copy()
+            thumbnail.thumbnail((size, size), Image.Resampling.LANCZOS)
+            variants[f"thumbnail_{size}"] = encode_webp(thumbnail, webp_quality)
+
+        return variants
+
+
+def encode_webp(image: Image.Image, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="WEBP", quality=quality)
+
+    return buffer.getvalue()
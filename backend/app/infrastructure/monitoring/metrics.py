@@ -0,0 +1,40 @@
+from prometheus_client import Counter, Histogram
+
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route", "status"],
+)
+
+mongo_command_duration_seconds = Histogram(
+    "mongo_command_duration_seconds",
+    "MongoDB command latency by collection and command",
+    ["collection", "command", "status"],
+    buckets=(
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+    ),
+)
+
+mongo_command_documents_returned_total = Counter(
+    "mongo_command_documents_returned_total",
+    "Documents returned to the client by MongoDB commands",
+    ["collection", "command"],
+)
+
+mongo_command_documents_affected_total = Counter(
+    "mongo_command_documents_affected_total",
+    "Documents matched, inserted or deleted by MongoDB write commands",
+    ["collection", "command"],
+)
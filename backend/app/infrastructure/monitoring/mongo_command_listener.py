@@ -0,0 +1,125 @@
+import logging
+import sys
+from typing import Dict, Optional, Tuple
+from pymongo import monitoring
+
+from app.infrastructure.environment_configs import EnvironmentConfigs
+from .metrics import (
+    mongo_command_documents_affected_total,
+    mongo_command_documents_returned_total,
+    mongo_command_duration_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+env = EnvironmentConfigs()
+
+REPOSITORIES_MODULE = "app.infrastructure.repositories"
+
+
+class MongoCommandListener(monitoring.CommandListener):
+    def __init__(self):
+        self.slow_query_seconds = env.mongo_slow_query_ms / 1000
+        self.started_commands: Dict[int, Tuple[str, dict]] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self.started_commands[event.request_id] = (
+            self.__get_collection(event.command_name, event.command),
+            event.command,
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        collection, command = self.__pop_started(event.request_id)
+        duration = event.duration_micros / 1_000_000
+
+        mongo_command_duration_seconds.labels(
+            collection, event.command_name, "success"
+        ).observe(duration)
+
+        returned, affected = self.__count_documents(event.reply)
+
+        if returned:
+            mongo_command_documents_returned_total.labels(
+                collection, event.command_name
+            ).inc(returned)
+
+        if affected:
+            mongo_command_documents_affected_total.labels(
+                collection, event.command_name
+            ).inc(affected)
+
+        if duration >= self.slow_query_seconds:
+            self.__log_slow_query(collection, event.command_name, command, duration)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        collection, command = self.__pop_started(event.request_id)
+        duration = event.duration_micros / 1_000_000
+
+        mongo_command_duration_seconds.labels(
+            collection, event.command_name, "failure"
+        ).observe(duration)
+
+        if duration >= self.slow_query_seconds:
+            self.__log_slow_query(collection, event.command_name, command, duration)
+
+    def __pop_started(self, request_id: int) -> Tuple[str, Optional[dict]]:
+        return self.started_commands.pop(request_id, ("", None))
+
+    def __get_collection(self, command_name: str, command: dict) -> str:
+        if command_name == "getMore":
+            return command.get("collection", "")
+
+        collection = command.get(command_name)
+
+        return collection if isinstance(collection, str) else ""
+
+    def __count_documents(self, reply: dict) -> Tuple[int, int]:
+        cursor = reply.get("cursor")
+
+        if cursor is not None:
+            batch = cursor.get("firstBatch", cursor.get("nextBatch", []))
+            return len(batch), 0
+
+        return 0, reply.get("n", 0)
+
+    def __log_slow_query(
+        self,
+        collection: str,
+        command_name: str,
+        command: Optional[dict],
+        duration: float,
+    ) -> None:
+        logger.warning(
+            "Slow MongoDB command %s on %s took %.1fms (repository method: %s, filter: %s)",
+            command_name,
+            collection,
+            duration * 1000,
+            self.__get_repository_method(),
+            self.__get_filter(command_name, command),
+        )
+
+    def __get_repository_method(self) -> Optional[str]:
+        repository_method = None
+        frame = sys._getframe(1)
+
+        while frame is not None:
+            if frame.f_globals.get("__name__", "").startswith(REPOSITORIES_MODULE):
+                repository = frame.f_locals.get("self")
+                repository_method = (
+                    f"{type(repository).__name__}.{frame.f_code.co_name}"
+                    if repository is not None
+                    else frame.f_code.co_qualname
+                )
+
+            frame = frame.f_back
+
+        return repository_method
+
+    def __get_filter(self, command_name: str, command: Optional[dict]):
+        if command is None:
+            return None
+
+        if command_name == "aggregate":
+            return command.get("pipeline", [])[:1]
+
+        return command.get("filter", command.get("q"))
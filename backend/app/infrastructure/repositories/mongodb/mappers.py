@@ -0,0 +1,40 @@
+from typing import List
+
+from app.domain.entities.category import Category
+from app.domain.entities.order import Order
+from app.domain.entities.order_item import OrderItem
+from app.domain.entities.product import Product
+
+
+def to_order(db_order: dict) -> Order:
+    return Order(
+        db_order["_id"],
+        db_order["product_ids"],
+        db_order["total"],
+        db_order["date"],
+        to_order_items(db_order.get("items", ())),
+    )
+
+
+def to_order_items(db_items: List[dict]) -> List[OrderItem]:
+    return [
+        OrderItem(db_item["product_id"], db_item["price"], db_item["category_ids"])
+        for db_item in db_items
+    ]
+
+
+def to_product(db_product: dict) -> Product:
+    return Product(
+        db_product["_id"],
+        db_product["name"],
+        db_product["description"],
+        db_product["price"],
+        db_product["category_ids"],
+        db_product["image_url"],
+        db_product.get("image_variants", {}),
+        db_product.get("image_version", ""),
+    )
+
+
+def to_category(db_category: dict) -> Category:
+    return Category(db_category["_id"], db_category["name"])
@@ -1,76 +1,85 @@
-from typing import List, Optional
-from pymongo.database import Database
-from pymongo.operations import UpdateOne
+from datetime import datetime, timezone
+from typing import List, Optional, Set
+from pymongo.asynchronous.database import AsyncDatabase
 
+from app.application.cache.category_ids_cache import CategoryIdsCache
 from app.application.repositories.category_repository import CategoryRepository
+from app.application.schemas.page import PageSchema
 from app.domain.entities.category import Category
+from .mappers import to_category
+from .utils import find_page
 
 
 class MongodbCategoryRepository(CategoryRepository):
-    def __init__(self, db: Database):
+    def __init__(self, db: AsyncDatabase, category_ids_cache: CategoryIdsCache):
         self.db = db
         self.categories_collection = self.db["categories"]
+        self.category_ids_cache = category_ids_cache
 
     async def create(self, category: Category) -> Category:
         db_category = {
             "_id": category.id,
             "name": category.name,
+            "updated_at": datetime.now(timezone.utc),
         }
 
-        self.categories_collection.insert_one(db_category)
+        await self.categories_collection.insert_one(db_category)
+        await self.category_ids_cache.invalidate()
 
         return category
 
     async def get_by_id(self, category_id: str) -> Optional[Category]:
-        db_category = self.categories_collection.find_one({"_id": category_id})
+        db_category = await self.categories_collection.find_one({"_id": category_id})
 
         if db_category is None:
             return
 
-        return Category(
-            id=db_category["_id"],
-            name=db_category["name"],
-        )
+        return to_category(db_category)
 
     async def get_all(self) -> List[Category]:
         db_categories = self.categories_collection.find()
 
-        return [
-            Category(
-                id=db_category["_id"],
-                name=db_category["name"],
-            )
-            for db_category in db_categories
-        ]
+        return [to_category(db_category) async for db_category in db_categories]
+
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[str],
+        fields: Optional[List[str]],
+    ) -> PageSchema:
+        return await find_page(
+            self.categories_collection,
+            limit=limit,
+            after=after,
+            fields=fields,
+            allowed_fields=["name"],
+        )
 
     async def update(self, category: Category) -> Category:
         db_category = {
             "name": category.name,
+            "updated_at": datetime.now(timezone.utc),
         }
 
-        self.categories_collection.update_one(
+        await self.categories_collection.update_one(
             {"_id": category.id}, {"$set": db_category}
         )
+        await self.category_ids_cache.invalidate()
 
         return category
 
     async def delete(self, category_id: str) -> None:
-        db_category_products = self.db["products"].find(
-            {"category_id": {"$in": [category_id]}}
-        )
+        await self.categories_collection.delete_one({"_id": category_id})
+        await self.category_ids_cache.invalidate()
 
-        operations = []
-
-        for product in db_category_products:
-            product.category_ids.remove(category_id)
-            operations.append(UpdateOne({"_id": product["_id"]}, {"$set": product}))
-
-        if len(operations) > 0:
-            self.db["products"].bulk_write(operations)
+    async def get_existing_ids(self, category_ids: List[str]) -> Set[str]:
+        all_category_ids = await self.category_ids_cache.get_or_set(
+            self.category_ids_cache.get_key(), self.__get_all_ids
+        )
 
-        self.categories_collection.delete_one({"_id": category_id})
+        return all_category_ids.intersection(category_ids)
 
-    async def get_existing_ids(self, category_ids: List[str]) -> List[str]:
-        db_categories = self.categories_collection.find({"_id": {"$in": category_ids}})
+    async def __get_all_ids(self) -> Set[str]:
+        db_categories = self.categories_collection.find({}, {"_id": 1})
 
-        return [db_category["_id"] for db_category in db_categories]
+        return {db_category["_id"] async for db_category in db_categories}
@@ -0,0 +1,316 @@
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from pymongo import ReplaceOne, UpdateOne
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.application.repositories.daily_sales_repository import DailySalesRepository
+from app.domain.entities.order import Order
+from app.domain.entities.product import Product
+from .utils import get_date_filter, get_day_start
+
+REBUILD_BATCH_DAYS = 31
+
+
+class MongodbDailySalesRepository(DailySalesRepository):
+    def __init__(self, db: AsyncDatabase):
+        self.db = db
+        self.daily_sales_collection = self.db["daily_sales"]
+        self.products_collection = self.db["products"]
+        self.orders_collection = self.db["orders"]
+
+    async def add_order(self, order: Order) -> None:
+        await self.__apply_orders([order], 1)
+
+    async def add_orders(self, orders: List[Order]) -> None:
+        await self.__apply_orders(orders, 1)
+
+    async def remove_order(self, order: Order) -> None:
+        await self.__apply_orders([order], -1)
+
+    async def remove_product(self, product: Product) -> None:
+        category_revenue = await self.__get_category_revenue(product)
+
+        if len(category_revenue) > 0:
+            await self.daily_sales_collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": day_id},
+                        {
+                            "$inc": {
+                                f"category_revenue.{category_id}": -revenue
+                                for category_id, revenue in day_revenue.items()
+                            }
+                        },
+                    )
+                    for day_id, day_revenue in category_revenue.items()
+                ],
+                ordered=False,
+            )
+
+        removed_revenue = {
+            "$ifNull": [
+                {"$getField": {"field": product.id, "input": "$product_revenue"}},
+                {
+                    "$multiply": [
+                        product.price,
+                        {
+                            "$ifNull": [
+                                {
+                                    "$getField": {
+                                        "field": product.id,
+                                        "input": "$product_counts",
+                                    }
+                                },
+                                0,
+                            ]
+                        },
+                    ]
+                },
+            ]
+        }
+
+        await self.daily_sales_collection.update_many(
+            {f"product_counts.{product.id}": {"$exists": True}},
+            [
+                {"$set": {"revenue": {"$subtract": ["$revenue", removed_revenue]}}},
+                {
+                    "$unset": [
+                        f"product_counts.{product.id}",
+                        f"product_revenue.{product.id}",
+                    ]
+                },
+            ],
+        )
+
+    async def rebuild(
+        self, start_date: Optional[date], end_date: Optional[date]
+    ) -> int:
+        date_filter = get_date_filter(start_date, end_date)
+        products = await self.__get_products({})
+
+        rebuilt_days = []
+        day_rows = []
+        day_row = None
+
+        db_orders = self.orders_collection.find(
+            date_filter, {"date": 1, "total": 1, "product_ids": 1, "items": 1}
+        ).sort("date", 1)
+
+        async for db_order in db_orders:
+            day_start = get_day_start(db_order["date"])
+
+            if day_row is None or day_row["date"] != day_start:
+                if day_row is not None:
+                    day_rows.append(day_row)
+
+                if len(day_rows) >= REBUILD_BATCH_DAYS:
+                    rebuilt_days.extend(await self.__replace_rows(day_rows))
+                    day_rows = []
+
+                day_row = self.__empty_row(day_start)
+
+            self.__accumulate(
+                day_row,
+                db_order["total"],
+                db_order["product_ids"],
+                db_order.get("items")
+                or self.__get_items(db_order["product_ids"], products),
+                1,
+            )
+
+        if day_row is not None:
+            day_rows.append(day_row)
+
+        rebuilt_days.extend(await self.__replace_rows(day_rows))
+
+        await self.daily_sales_collection.delete_many(
+            {**date_filter, "_id": {"$nin": rebuilt_days}}
+        )
+
+        return len(rebuilt_days)
+
+    async def __apply_orders(self, orders: List[Order], sign: int) -> None:
+        if len(orders) == 0:
+            return
+
+        legacy_product_ids = list(
+            {id for order in orders if not order.items for id in order.product_ids}
+        )
+        products = (
+            await self.__get_products({"_id": {"$in": legacy_product_ids}})
+            if len(legacy_product_ids) > 0
+            else {}
+        )
+
+        day_rows = {}
+
+        for order in orders:
+            day_start = get_day_start(order.date)
+            day_row = day_rows.setdefault(day_start, {})
+            items = (
+                [
+                    {
+                        "product_id": item.product_id,
+                        "price": item.price,
+                        "category_ids": item.category_ids,
+                    }
+                    for item in order.items
+                ]
+                if order.items
+                else self.__get_items(order.product_ids, products)
+            )
+            self.__accumulate(day_row, order.total, order.product_ids, items, sign)
+
+        operations = [
+            UpdateOne(
+                {"_id": day_start.strftime("%Y-%m-%d")},
+                {
+                    "$inc": {
+                        "order_count": day_row["order_count"],
+                        "revenue": day_row["revenue"],
+                        **{
+                            f"product_counts.{product_id}": count
+                            for product_id, count in day_row["product_counts"].items()
+                        },
+                        **{
+                            f"product_revenue.{product_id}": revenue
+                            for product_id, revenue in day_row[
+                                "product_revenue"
+                            ].items()
+                        },
+                        **{
+                            f"category_revenue.{category_id}": revenue
+                            for category_id, revenue in day_row[
+                                "category_revenue"
+                            ].items()
+                        },
+                    },
+                    "$setOnInsert": {"date": day_start},
+                },
+                upsert=True,
+            )
+            for day_start, day_row in day_rows.items()
+        ]
+
+        await self.daily_sales_collection.bulk_write(operations, ordered=False)
+
+    async def __get_category_revenue(
+        self, product: Product
+    ) -> Dict[str, Dict[str, float]]:
+        day_id = {"$dateToString": {"format": "%Y-%m-%d", "date": "$date"}}
+
+        item_revenue_cursor = await self.orders_collection.aggregate(
+            [
+                {"$match": {"product_ids": product.id, "items.product_id": product.id}},
+                {"$unwind": "$items"},
+                {"$match": {"items.product_id": product.id}},
+                {"$unwind": "$items.category_ids"},
+                {
+                    "$group": {
+                        "_id": {"day": day_id, "category_id": "$items.category_ids"},
+                        "revenue": {"$sum": "$items.price"},
+                    }
+                },
+            ]
+        )
+        legacy_count_cursor = await self.orders_collection.aggregate(
+            [
+                {
+                    "$match": {
+                        "product_ids": product.id,
+                        "$or": [{"items": {"$exists": False}}, {"items": []}],
+                    }
+                },
+                {"$unwind": "$product_ids"},
+                {"$match": {"product_ids": product.id}},
+                {"$group": {"_id": day_id, "count": {"$sum": 1}}},
+            ]
+        )
+
+        category_revenue: Dict[str, Dict[str, float]] = {}
+
+        async for db_revenue in item_revenue_cursor:
+            day_revenue = category_revenue.setdefault(db_revenue["_id"]["day"], {})
+            category_id = db_revenue["_id"]["category_id"]
+            day_revenue[category_id] = (
+                day_revenue.get(category_id, 0) + db_revenue["revenue"]
+            )
+
+        async for db_count in legacy_count_cursor:
+            day_revenue = category_revenue.setdefault(db_count["_id"], {})
+
+            for category_id in product.category_ids:
+                day_revenue[category_id] = (
+                    day_revenue.get(category_id, 0) + product.price * db_count["count"]
+                )
+
+        return category_revenue
+
+    async def __get_products(self, filter_query: dict) -> Dict[str, dict]:
+        db_products = self.products_collection.find(
+            filter_query, {"price": 1, "category_ids": 1}
+        )
+
+        return {db_product["_id"]: db_product async for db_product in db_products}
+
+    async def __replace_rows(self, day_rows: List[dict]) -> List[str]:
+        if len(day_rows) == 0:
+            return []
+
+        await self.daily_sales_collection.bulk_write(
+            [
+                ReplaceOne({"_id": day_row["_id"]}, day_row, upsert=True)
+                for day_row in day_rows
+            ],
+            ordered=False,
+        )
+
+        return [day_row["_id"] for day_row in day_rows]
+
+    def __empty_row(self, day_start: datetime) -> dict:
+        return {
+            "_id": day_start.strftime("%Y-%m-%d"),
+            "date": day_start,
+        }
+
+    def __get_items(
+        self, product_ids: List[str], products: Dict[str, dict]
+    ) -> List[dict]:
+        return [
+            {
+                "product_id": product_id,
+                "price": products[product_id]["price"],
+                "category_ids": products[product_id]["category_ids"],
+            }
+            for product_id in product_ids
+            if product_id in products
+        ]
+
+    def __accumulate(
+        self,
+        row: dict,
+        total: float,
+        product_ids: List[str],
+        items: List[dict],
+        sign: int,
+    ) -> None:
+        row["order_count"] = row.get("order_count", 0) + sign
+        row["revenue"] = row.get("revenue", 0) + sign * total
+
+        product_counts = row.setdefault("product_counts", {})
+        product_revenue = row.setdefault("product_revenue", {})
+        category_revenue = row.setdefault("category_revenue", {})
+
+        for product_id in product_ids:
+            product_counts[product_id] = product_counts.get(product_id, 0) + sign
+
+        for item in items:
+            product_id = item["product_id"]
+            product_revenue[product_id] = (
+                product_revenue.get(product_id, 0) + sign * item["price"]
+            )
+
+            for category_id in item["category_ids"]:
+                category_revenue[category_id] = (
+                    category_revenue.get(category_id, 0) + sign * item["price"]
+                )
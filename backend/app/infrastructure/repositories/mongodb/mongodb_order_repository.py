@@ -1,17 +1,36 @@
-from datetime import date, datetime
-from typing import List, Optional
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, List, Optional
 from pymongo import UpdateOne
-from pymongo.database import Database
+from pymongo.errors import BulkWriteError
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.application.repositories.order_repository import OrderRepository
-from app.application.schemas.dashboard import DashboardMetricsSchema
+from app.application.schemas.page import PageSchema
+from app.application.schemas.dashboard import (
+    PERIOD_FORMATS,
+    DashboardMetricsSchema,
+    Granularity,
+)
 from app.domain.entities.order import Order
+from app.domain.entities.order_item import OrderItem
+from app.infrastructure.analytics.numpy_order_analytics import NumpyOrderAnalytics
+from app.infrastructure.environment_configs import EnvironmentConfigs
+from .mappers import to_order
+from .utils import find_page, get_date_bounds, get_date_filter
+
+env = EnvironmentConfigs()
 
 
 class MongodbOrderRepository(OrderRepository):
-    def __init__(self, db: Database):
+    def __init__(self, db: AsyncDatabase, metrics_source: Optional[str] = None):
         self.db = db
+        self.metrics_source = metrics_source or env.dashboard_metrics_source
+        self.analytics = NumpyOrderAnalytics()
         self.orders_collection = self.db["orders"]
+        self.daily_sales_collection = self.db["daily_sales"]
+        self.product_sales_collection = self.db["product_sales"]
+        self.product_daily_sales_collection = self.db["product_daily_sales"]
 
     async def create(self, order: Order) -> Order:
         db_order = {
@@ -19,46 +38,78 @@ class MongodbOrderRepository(OrderRepository):
             "total": order.total,
             "date": order.date,
             "product_ids": order.product_ids,
+            "items": self.__to_db_items(order.items),
+            "updated_at": datetime.now(timezone.utc),
         }
 
-        self.orders_collection.insert_one(db_order)
+        await self.orders_collection.insert_one(db_order)
 
         return order
 
+    async def bulk_create(self, orders: List[Order]) -> Dict[str, str]:
+        db_orders = [
+            {
+                "_id": order.id,
+                "total": order.total,
+                "date": order.date,
+                "product_ids": order.product_ids,
+                "items": self.__to_db_items(order.items),
+                "updated_at": datetime.now(timezone.utc),
+            }
+            for order in orders
+        ]
+
+        errors = {}
+
+        try:
+            await self.orders_collection.insert_many(db_orders, ordered=False)
+        except BulkWriteError as error:
+            errors = {
+                orders[write_error["index"]].id: write_error["errmsg"]
+                for write_error in error.details["writeErrors"]
+            }
+
+        return errors
+
     async def get_by_id(self, order_id: str) -> Optional[Order]:
-        db_order = self.orders_collection.find_one({"_id": order_id})
+        db_order = await self.orders_collection.find_one({"_id": order_id})
 
         if db_order is None:
             return
 
-        return Order(
-            id=db_order["_id"],
-            total=db_order["total"],
-            date=db_order["date"],
-            product_ids=db_order["product_ids"],
-        )
+        return to_order(db_order)
 
     async def get_all(self) -> List[Order]:
         db_orders = self.orders_collection.find()
 
-        return [
-            Order(
-                id=db_order["_id"],
-                total=db_order["total"],
-                date=db_order["date"],
-                product_ids=db_order["product_ids"],
-            )
-            for db_order in db_orders
-        ]
+        return [to_order(db_order) async for db_order in db_orders]
+
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[str],
+        fields: Optional[List[str]],
+        sort_by: str,
+    ) -> PageSchema:
+        return await find_page(
+            self.orders_collection,
+            limit=limit,
+            after=after,
+            fields=fields,
+            allowed_fields=["total", "date", "product_ids", "items"],
+            sort_by=sort_by,
+        )
 
     async def update(self, order: Order) -> Order:
         db_order = {
             "total": order.total,
             "date": order.date,
             "product_ids": order.product_ids,
+            "items": self.__to_db_items(order.items),
+            "updated_at": datetime.now(timezone.utc),
         }
 
-        self.orders_collection.update_one({"_id": order.id}, {"$set": db_order})
+        await self.orders_collection.update_one({"_id": order.id}, {"$set": db_order})
 
         return order
 
@@ -71,166 +122,366 @@ class MongodbOrderRepository(OrderRepository):
                         "total": order.total,
                         "date": order.date,
                         "product_ids": order.product_ids,
+                        "items": self.__to_db_items(order.items),
+                        "updated_at": datetime.now(timezone.utc),
                     }
                 },
             )
             for order in orders
         ]
 
-        self.orders_collection.bulk_write(operations)
+        await self.orders_collection.bulk_write(operations)
 
         return orders
 
     async def delete(self, order_id: str) -> None:
-        self.orders_collection.delete_one({"_id": order_id})
+        await self.orders_collection.delete_one({"_id": order_id})
+
+    async def remove_product(self, product_id: str, price: float) -> int:
+        product_count = {
+            "$size": {
+                "$filter": {
+                    "input": "$product_ids",
+                    "cond": {"$eq": ["$$this", product_id]},
+                }
+            }
+        }
+
+        removed_total = {
+            "$cond": [
+                {"$gt": [{"$size": {"$ifNull": ["$items", []]}}, 0]},
+                {
+                    "$sum": {
+                        "$map": {
+                            "input": {
+                                "$filter": {
+                                    "input": "$items",
+                                    "cond": {"$eq": ["$$this.product_id", product_id]},
+                                }
+                            },
+                            "in": "$$this.price",
+                        }
+                    }
+                },
+                {"$multiply": [price, product_count]},
+            ]
+        }
+
+        result = await self.orders_collection.update_many(
+            {"product_ids": product_id},
+            [
+                {
+                    "$set": {
+                        "product_ids": {
+                            "$filter": {
+                                "input": "$product_ids",
+                                "cond": {"$ne": ["$$this", product_id]},
+                            }
+                        },
+                        "items": {
+                            "$filter": {
+                                "input": {"$ifNull": ["$items", []]},
+                                "cond": {"$ne": ["$$this.product_id", product_id]},
+                            }
+                        },
+                        "total": {
+                            "$round": [
+                                {"$subtract": ["$total", removed_total]},
+                                2,
+                            ]
+                        },
+                        "updated_at": datetime.now(timezone.utc),
+                    }
+                }
+            ],
+        )
+
+        return result.modified_count
 
     async def get_by_product(self, product_id: str) -> List[Order]:
         db_orders = self.orders_collection.find({"product_ids": {"$in": [product_id]}})
 
-        return [
-            Order(
-                id=db_order["_id"],
-                total=db_order["total"],
-                date=db_order["date"],
-                product_ids=db_order["product_ids"],
-            )
-            for db_order in db_orders
-        ]
+        return [to_order(db_order) async for db_order in db_orders]
+
+    async def stream(
+        self, start_date: Optional[date], end_date: Optional[date]
+    ) -> AsyncIterator[Order]:
+        db_orders = self.orders_collection.find(
+            get_date_filter(start_date, end_date),
+            batch_size=1000,
+            allow_disk_use=True,
+        ).sort("date", 1)
+
+        async for db_order in db_orders:
+            yield to_order(db_order)
 
     async def get_metrics(
         self,
         start_date: Optional[date],
         end_date: Optional[date],
+        top_products_limit: int,
+        granularity: Granularity,
+        time_zone: str,
     ) -> DashboardMetricsSchema:
-        filter_query = {}
+        if self.metrics_source == "numpy":
+            start_datetime, end_datetime = get_date_bounds(
+                start_date, end_date, time_zone
+            )
 
-        start_datetime = (
-            datetime.combine(start_date, datetime.min.time()) if start_date else None
-        )
-        end_datetime = (
-            datetime.combine(end_date, datetime.max.time()) if end_date else None
+            return await self.analytics.get_metrics(
+                self.db,
+                start_datetime,
+                end_datetime,
+                top_products_limit,
+                granularity,
+                time_zone,
+            )
+
+        filter_query = get_date_filter(start_date, end_date, time_zone)
+
+        if (
+            self.metrics_source == "facet"
+            or granularity == "hour"
+            or time_zone != "UTC"
+        ):
+            return await self.__get_metrics_from_orders(
+                filter_query, top_products_limit, granularity, time_zone
+            )
+
+        return await self.__get_metrics_from_daily_sales(
+            filter_query, top_products_limit, granularity
         )
 
-        if start_datetime and end_datetime:
-            filter_query = {"date": {"$gte": start_datetime, "$lte": end_datetime}}
-        elif start_datetime:
-            filter_query = {"date": {"$gte": start_datetime}}
-        elif end_datetime:
-            filter_query = {"date": {"$lte": end_datetime}}
+    async def __get_metrics_from_daily_sales(
+        self, filter_query: dict, top_products_limit: int, granularity: Granularity
+    ) -> DashboardMetricsSchema:
+        daily_sales_cursor = self.daily_sales_collection.find(
+            {**filter_query, "order_count": {"$gt": 0}}
+        ).sort("_id", 1)
 
-        total_orders = self.orders_collection.count_documents(filter_query)
+        total_orders = 0
+        total_revenue = 0
+        orders_by_period = {}
+        category_revenue = Counter()
 
-        pipeline_revenue = [
-            {"$match": filter_query},
+        async for day_row in daily_sales_cursor:
+            total_orders += day_row["order_count"]
+            total_revenue += day_row["revenue"]
+            period = orders_by_period.setdefault(
+                self.__get_period_key(day_row["date"], granularity),
+                {"count": 0, "revenue": 0},
+            )
+            period["count"] += day_row["order_count"]
+            period["revenue"] += day_row["revenue"]
+            category_revenue.update(day_row.get("category_revenue", {}))
+
+        average_order_value = total_revenue / total_orders if total_orders else 0
+
+        top_products = await self.__get_top_products(filter_query, top_products_limit)
+
+        category_names = await self.__get_names("categories", list(category_revenue))
+        revenue_by_category = [
             {
-                "$group": {
-                    "_id": None,
-                    "total_revenue": {"$sum": "$total"},
-                    "avg_order": {"$avg": "$total"},
-                }
-            },
+                "_id": category_id,
+                "category_id": category_id,
+                "category_name": category_names[category_id],
+                "revenue": revenue,
+            }
+            for category_id, revenue in category_revenue.most_common()
+            if category_id in category_names
         ]
-        revenue_results = self.orders_collection.aggregate(pipeline_revenue).to_list(1)
-        total_revenue = 0
-        average_order_value = 0
 
-        if revenue_results:
-            total_revenue = revenue_results[0].get("total_revenue", 0)
-            average_order_value = revenue_results[0].get("avg_order", 0)
+        return DashboardMetricsSchema(
+            total_orders=total_orders,
+            average_order_value=average_order_value,
+            total_revenue=total_revenue,
+            granularity=granularity,
+            orders_by_period=orders_by_period,
+            top_products=top_products,
+            revenue_by_category=revenue_by_category,
+        )
+
+    async def __get_top_products(self, filter_query: dict, limit: int) -> List[dict]:
+        if not filter_query:
+            product_sales = (
+                self.product_sales_collection.find({"count": {"$gt": 0}})
+                .sort([("count", -1), ("_id", 1)])
+                .limit(limit)
+            )
+        else:
+            product_sales = await self.product_daily_sales_collection.aggregate(
+                [
+                    {"$match": filter_query},
+                    {
+                        "$group": {
+                            "_id": "$product_id",
+                            "product_name": {"$first": "$product_name"},
+                            "count": {"$sum": "$count"},
+                        }
+                    },
+                    {"$match": {"count": {"$gt": 0}}},
+                    {"$sort": {"count": -1, "_id": 1}},
+                    {"$limit": limit},
+                ]
+            )
 
-        pipeline_by_period = [
-            {"$match": filter_query},
+        return [
             {
-                "$group": {
-                    "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$date"}},
-                    "count": {"$sum": 1},
-                    "revenue": {"$sum": "$total"},
-                }
-            },
-            {"$sort": {"_id": 1}},
+                "_id": product_sale["_id"],
+                "product_id": product_sale["_id"],
+                "product_name": product_sale["product_name"],
+                "count": product_sale["count"],
+            }
+            async for product_sale in product_sales
         ]
-        orders_by_period_results = self.orders_collection.aggregate(
-            pipeline_by_period
-        ).to_list(None)
-        orders_by_period = {
-            item["_id"]: {"count": item["count"], "revenue": item["revenue"]}
-            for item in orders_by_period_results
+
+    def __get_period_key(self, day_start: datetime, granularity: Granularity) -> str:
+        if granularity == "week":
+            day_start -= timedelta(days=day_start.weekday())
+
+        return day_start.strftime(PERIOD_FORMATS[granularity])
+
+    async def __get_metrics_from_orders(
+        self,
+        filter_query: dict,
+        top_products_limit: int,
+        granularity: Granularity,
+        time_zone: str,
+    ) -> DashboardMetricsSchema:
+        period_start = {
+            "date": "$date",
+            "unit": granularity,
+            "timezone": time_zone,
         }
 
-        pipeline_top_products = [
-            {"$match": filter_query},
-            {"$unwind": "$product_ids"},
-            {"$group": {"_id": "$product_ids", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-            {"$limit": 5},
-            {
-                "$lookup": {
-                    "from": "products",
-                    "localField": "_id",
-                    "foreignField": "_id",
-                    "as": "product_info",
-                }
-            },
-            {"$unwind": "$product_info"},
-            {
-                "$project": {
-                    "product_name": "$product_info.name",
-                    "product_id": "$_id",
-                    "count": 1,
-                }
-            },
-        ]
-        top_products = self.orders_collection.aggregate(pipeline_top_products).to_list(
-            None
-        )
+        if granularity == "week":
+            period_start["startOfWeek"] = "monday"
 
-        pipeline_revenue_by_category = [
+        pipeline = [
             {"$match": filter_query},
-            {"$unwind": "$product_ids"},
-            {
-                "$lookup": {
-                    "from": "products",
-                    "localField": "product_ids",
-                    "foreignField": "_id",
-                    "as": "product",
-                }
-            },
-            {"$unwind": "$product"},
-            {"$unwind": "$product.category_ids"},
-            {
-                "$group": {
-                    "_id": "$product.category_ids",
-                    "revenue": {"$sum": "$product.price"},
-                }
-            },
             {
-                "$lookup": {
-                    "from": "categories",
-                    "localField": "_id",
-                    "foreignField": "_id",
-                    "as": "category",
+                "$facet": {
+                    "totals": [
+                        {
+                            "$group": {
+                                "_id": None,
+                                "total_orders": {"$sum": 1},
+                                "total_revenue": {"$sum": "$total"},
+                                "avg_order": {"$avg": "$total"},
+                            }
+                        },
+                    ],
+                    "orders_by_period": [
+                        {
+                            "$group": {
+                                "_id": {
+                                    "$dateToString": {
+                                        "format": PERIOD_FORMATS[granularity],
+                                        "date": {"$dateTrunc": period_start},
+                                        "timezone": time_zone,
+                                    }
+                                },
+                                "count": {"$sum": 1},
+                                "revenue": {"$sum": "$total"},
+                            }
+                        },
+                        {"$sort": {"_id": 1}},
+                    ],
+                    "top_products": [
+                        {"$unwind": "$product_ids"},
+                        {"$group": {"_id": "$product_ids", "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1, "_id": 1}},
+                        {"$limit": top_products_limit},
+                        {
+                            "$lookup": {
+                                "from": "products",
+                                "localField": "_id",
+                                "foreignField": "_id",
+                                "as": "product_info",
+                            }
+                        },
+                        {"$unwind": "$product_info"},
+                        {
+                            "$project": {
+                                "product_name": "$product_info.name",
+                                "product_id": "$_id",
+                                "count": 1,
+                            }
+                        },
+                    ],
+                    "revenue_by_category": [
+                        {"$unwind": "$items"},
+                        {"$unwind": "$items.category_ids"},
+                        {
+                            "$group": {
+                                "_id": "$items.category_ids",
+                                "revenue": {"$sum": "$items.price"},
+                            }
+                        },
+                        {
+                            "$lookup": {
+                                "from": "categories",
+                                "localField": "_id",
+                                "foreignField": "_id",
+                                "as": "category",
+                            }
+                        },
+                        {"$unwind": "$category"},
+                        {
+                            "$project": {
+                                "category_name": "$category.name",
+                                "category_id": "$_id",
+                                "revenue": 1,
+                            }
+                        },
+                        {"$sort": {"revenue": -1}},
+                    ],
                 }
             },
-            {"$unwind": "$category"},
-            {
-                "$project": {
-                    "category_name": "$category.name",
-                    "category_id": "$_id",
-                    "revenue": 1,
-                }
-            },
-            {"$sort": {"revenue": -1}},
         ]
 
-        revenue_by_category = self.orders_collection.aggregate(
-            pipeline_revenue_by_category
-        ).to_list(None)
+        metrics_cursor = await self.orders_collection.aggregate(pipeline)
+        metrics_results = await metrics_cursor.to_list(1)
+        metrics = metrics_results[0]
+
+        total_orders = 0
+        total_revenue = 0
+        average_order_value = 0
+
+        if metrics["totals"]:
+            total_orders = metrics["totals"][0].get("total_orders", 0)
+            total_revenue = metrics["totals"][0].get("total_revenue", 0)
+            average_order_value = metrics["totals"][0].get("avg_order", 0)
+
+        orders_by_period = {
+            item["_id"]: {"count": item["count"], "revenue": item["revenue"]}
+            for item in metrics["orders_by_period"]
+        }
 
         return DashboardMetricsSchema(
             total_orders=total_orders,
             average_order_value=average_order_value,
             total_revenue=total_revenue,
+            granularity=granularity,
             orders_by_period=orders_by_period,
-            top_products=top_products,
-            revenue_by_category=revenue_by_category,
+            top_products=metrics["top_products"],
+            revenue_by_category=metrics["revenue_by_category"],
         )
+
+    def __to_db_items(self, items: List[OrderItem]) -> List[dict]:
+        return [
+            {
+                "product_id": item.product_id,
+                "price": item.price,
+                "category_ids": item.category_ids,
+            }
+            for item in items
+        ]
+
+    async def __get_names(self, collection_name: str, ids: List[str]) -> Dict[str, str]:
+        db_documents = self.db[collection_name].find({"_id": {"$in": ids}}, {"name": 1})
+
+        return {
+            db_document["_id"]: db_document["name"]
+            async for db_document in db_documents
+        }
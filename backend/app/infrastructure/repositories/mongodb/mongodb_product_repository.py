@@ -1,59 +1,77 @@
-from typing import List, Optional, Tuple
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 from pymongo import UpdateOne
-from pymongo.database import Database
+from pymongo.errors import BulkWriteError
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.application.repositories.product_repository import ProductRepository
+from app.application.schemas.page import PageSchema
+from app.domain.entities.order_item import OrderItem
 from app.domain.entities.product import Product
+from .mappers import to_product
+from .utils import find_page
 
 
 class MongodbProductRepository(ProductRepository):
-    def __init__(self, db: Database):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.products_collection = self.db["products"]
 
     async def create(self, product: Product) -> Product:
-        db_product = {
-            "_id": product.id,
-            "name": product.name,
-            "description": product.description,
-            "price": product.price,
-            "category_ids": product.category_ids,
-            "image_url": product.image_url,
-        }
-
-        self.products_collection.insert_one(db_product)
+        await self.products_collection.insert_one(self.__to_db_product(product))
 
         return product
 
+    async def bulk_create(self, products: List[Product]) -> Dict[str, str]:
+        errors = {}
+
+        try:
+            await self.products_collection.insert_many(
+                [self.__to_db_product(product) for product in products],
+                ordered=False,
+            )
+        except BulkWriteError as error:
+            errors = {
+                products[write_error["index"]].id: write_error["errmsg"]
+                for write_error in error.details["writeErrors"]
+            }
+
+        return errors
+
     async def get_by_id(self, product_id: str) -> Optional[Product]:
-        db_product = self.products_collection.find_one({"_id": product_id})
+        db_product = await self.products_collection.find_one({"_id": product_id})
 
         if db_product is None:
             return
 
-        return Product(
-            id=db_product["_id"],
-            name=db_product["name"],
-            description=db_product["description"],
-            price=db_product["price"],
-            category_ids=db_product["category_ids"],
-            image_url=db_product["image_url"],
-        )
+        return to_product(db_product)
 
     async def get_all(self) -> List[Product]:
         db_products = self.products_collection.find()
 
-        return [
-            Product(
-                id=db_product["_id"],
-                name=db_product["name"],
-                description=db_product["description"],
-                price=db_product["price"],
-                category_ids=db_product["category_ids"],
-                image_url=db_product["image_url"],
-            )
-            for db_product in db_products
-        ]
+        return [to_product(db_product) async for db_product in db_products]
+
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[str],
+        fields: Optional[List[str]],
+    ) -> PageSchema:
+        return await find_page(
+            self.products_collection,
+            limit=limit,
+            after=after,
+            fields=fields,
+            allowed_fields=[
+                "name",
+                "description",
+                "price",
+                "category_ids",
+                "image_url",
+                "image_variants",
+                "image_version",
+            ],
+        )
 
     async def update(self, product: Product) -> Product:
         db_product = {
@@ -62,12 +80,32 @@ class MongodbProductRepository(ProductRepository):
             "price": product.price,
             "category_ids": product.category_ids,
             "image_url": product.image_url,
+            "image_variants": product.image_variants,
+            "image_version": product.image_version,
+            "updated_at": datetime.now(timezone.utc),
         }
 
-        self.products_collection.update_one({"_id": product.id}, {"$set": db_product})
+        await self.products_collection.update_one(
+            {"_id": product.id}, {"$set": db_product}
+        )
 
         return product
 
+    async def update_image_variants(
+        self, product_id: str, image_version: str, image_variants: Dict[str, str]
+    ) -> bool:
+        result = await self.products_collection.update_one(
+            {"_id": product_id, "image_version": image_version},
+            {
+                "$set": {
+                    "image_variants": image_variants,
+                    "updated_at": datetime.now(timezone.utc),
+                }
+            },
+        )
+
+        return result.matched_count > 0
+
     async def bulk_update(self, products: List[Product]) -> List[Product]:
         operations = []
 
@@ -80,48 +118,61 @@ class MongodbProductRepository(ProductRepository):
                 "price": product.price,
                 "category_ids": product.category_ids,
                 "image_url": product.image_url,
+                "image_variants": product.image_variants,
+                "image_version": product.image_version,
+                "updated_at": datetime.now(timezone.utc),
             }
 
             operations.append(UpdateOne({"_id": product_id}, {"$set": db_product}))
 
-        self.products_collection.bulk_write(operations)
+        await self.products_collection.bulk_write(operations)
 
         return products
 
     async def delete(self, product_id: str) -> None:
-        db_product_orders = self.db["orders"].find(
-            {"product_ids": {"$in": [product_id]}}
+        await self.products_collection.delete_one({"_id": product_id})
+
+    async def remove_category(self, category_id: str) -> int:
+        result = await self.products_collection.update_many(
+            {"category_ids": category_id},
+            {
+                "$pull": {"category_ids": category_id},
+                "$set": {"updated_at": datetime.now(timezone.utc)},
+            },
         )
 
-        operations = []
-
-        for order in db_product_orders:
-            order.product_ids.remove(product_id)
-            operations.append(UpdateOne({"_id": order["_id"]}, {"$set": order}))
-
-        if len(operations) > 0:
-            self.db["orders"].bulk_write(operations)
-
-        self.products_collection.delete_one({"_id": product_id})
+        return result.modified_count
 
     async def get_by_category(self, category_id: str) -> List[Product]:
         db_products = self.products_collection.find(
             {"category_ids": {"$in": [category_id]}}
         )
 
+        return [to_product(db_product) async for db_product in db_products]
+
+    async def get_order_items(self, product_ids: List[str]) -> List[OrderItem]:
+        db_products = self.products_collection.find(
+            {"_id": {"$in": product_ids}}, {"price": 1, "category_ids": 1}
+        )
+
         return [
-            Product(
-                id=db_product["_id"],
-                name=db_product["name"],
-                description=db_product["description"],
+            OrderItem(
+                product_id=db_product["_id"],
                 price=db_product["price"],
                 category_ids=db_product["category_ids"],
-                image_url=db_product["image_url"],
             )
-            for db_product in db_products
+            async for db_product in db_products
         ]
 
-    async def get_prices(self, product_ids: List[str]) -> List[Tuple[str, float]]:
-        db_products = self.products_collection.find({"_id": {"$in": product_ids}})
-
-        return [(db_product["_id"], db_product["price"]) for db_product in db_products]
+    def __to_db_product(self, product: Product) -> dict:
+        return {
+            "_id": product.id,
+            "name": product.name,
+            "description": product.description,
+            "price": product.price,
+            "category_ids": product.category_ids,
+            "image_url": product.image_url,
+            "image_variants": product.image_variants,
+            "image_version": product.image_version,
+            "updated_at": datetime.now(timezone.utc),
+        }
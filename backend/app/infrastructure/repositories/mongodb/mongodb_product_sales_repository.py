@@ -0,0 +1,234 @@
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from pymongo import DeleteOne, UpdateOne
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.application.repositories.product_sales_repository import (
+    ProductSalesRepository,
+)
+from app.domain.entities.order import Order
+from .utils import get_date_filter, get_day_start
+
+
+class MongodbProductSalesRepository(ProductSalesRepository):
+    def __init__(self, db: AsyncDatabase):
+        self.db = db
+        self.product_sales_collection = self.db["product_sales"]
+        self.product_daily_sales_collection = self.db["product_daily_sales"]
+        self.products_collection = self.db["products"]
+        self.orders_collection = self.db["orders"]
+
+    async def add_order(self, order: Order) -> None:
+        await self.__apply_orders([order], 1)
+
+    async def add_orders(self, orders: List[Order]) -> None:
+        await self.__apply_orders(orders, 1)
+
+    async def remove_order(self, order: Order) -> None:
+        await self.__apply_orders([order], -1)
+
+    async def rename_product(self, product_id: str, product_name: str) -> None:
+        for collection in [
+            self.product_sales_collection,
+            self.product_daily_sales_collection,
+        ]:
+            await collection.update_many(
+                {"product_id": product_id}, {"$set": {"product_name": product_name}}
+            )
+
+    async def remove_product(self, product_id: str) -> None:
+        await self.product_sales_collection.delete_many({"product_id": product_id})
+        await self.product_daily_sales_collection.delete_many(
+            {"product_id": product_id}
+        )
+
+    async def rebuild(
+        self, start_date: Optional[date], end_date: Optional[date]
+    ) -> int:
+        date_filter = get_date_filter(start_date, end_date)
+        product_names = await self.__get_product_names({})
+
+        rebuilt_days = []
+        count_deltas = Counter()
+        day_start = None
+        day_counts = Counter()
+
+        db_orders = self.orders_collection.find(
+            date_filter, {"date": 1, "product_ids": 1}
+        ).sort("date", 1)
+
+        async for db_order in db_orders:
+            order_day_start = get_day_start(db_order["date"])
+
+            if order_day_start != day_start:
+                if day_start is not None:
+                    count_deltas.update(
+                        await self.__replace_day_rows(
+                            day_start, day_counts, product_names
+                        )
+                    )
+                    rebuilt_days.append(day_start)
+
+                day_start = order_day_start
+                day_counts = Counter()
+
+            day_counts.update(
+                product_id
+                for product_id in db_order["product_ids"]
+                if product_id in product_names
+            )
+
+        if day_start is not None:
+            count_deltas.update(
+                await self.__replace_day_rows(day_start, day_counts, product_names)
+            )
+            rebuilt_days.append(day_start)
+
+        count_deltas.update(
+            await self.__remove_day_rows(
+                {"$and": [date_filter, {"date": {"$nin": rebuilt_days}}]}
+            )
+        )
+
+        increments = [
+            self.__increment(
+                product_id,
+                count,
+                {"product_id": product_id, "product_name": product_names[product_id]},
+            )
+            for product_id, count in count_deltas.items()
+            if count != 0 and product_id in product_names
+        ]
+
+        if len(increments) > 0:
+            await self.product_sales_collection.bulk_write(increments, ordered=False)
+
+        return await self.product_sales_collection.count_documents({})
+
+    async def __apply_orders(self, orders: List[Order], sign: int) -> None:
+        if len(orders) == 0:
+            return
+
+        product_names = await self.__get_product_names(
+            {"_id": {"$in": list({id for order in orders for id in order.product_ids})}}
+        )
+
+        counts = Counter()
+        daily_counts = Counter()
+
+        for order in orders:
+            day_start = get_day_start(order.date)
+
+            for product_id in order.product_ids:
+                if product_id in product_names:
+                    counts[product_id] += sign
+                    daily_counts[(product_id, day_start)] += sign
+
+        if len(counts) == 0:
+            return
+
+        await self.product_sales_collection.bulk_write(
+            [
+                self.__increment(
+                    product_id,
+                    count,
+                    {
+                        "product_id": product_id,
+                        "product_name": product_names[product_id],
+                    },
+                )
+                for product_id, count in counts.items()
+            ],
+            ordered=False,
+        )
+        await self.product_daily_sales_collection.bulk_write(
+            [
+                self.__increment(
+                    self.__get_day_row_id(product_id, day_start),
+                    count,
+                    {
+                        "product_id": product_id,
+                        "product_name": product_names[product_id],
+                        "date": day_start,
+                    },
+                )
+                for (product_id, day_start), count in daily_counts.items()
+            ],
+            ordered=False,
+        )
+
+    async def __replace_day_rows(
+        self,
+        day_start: datetime,
+        day_counts: Counter,
+        product_names: Dict[str, str],
+    ) -> Counter:
+        stored_counts = await self.__get_stored_counts({"date": day_start})
+        operations = [
+            UpdateOne(
+                {"_id": self.__get_day_row_id(product_id, day_start)},
+                {
+                    "$set": {"count": count},
+                    "$setOnInsert": {
+                        "product_id": product_id,
+                        "product_name": product_names[product_id],
+                        "date": day_start,
+                    },
+                },
+                upsert=True,
+            )
+            for product_id, count in day_counts.items()
+            if stored_counts.get(product_id) != count
+        ] + [
+            DeleteOne({"_id": self.__get_day_row_id(product_id, day_start)})
+            for product_id in stored_counts
+            if product_id not in day_counts
+        ]
+
+        if len(operations) > 0:
+            await self.product_daily_sales_collection.bulk_write(
+                operations, ordered=False
+            )
+
+        count_deltas = Counter(day_counts)
+        count_deltas.subtract(stored_counts)
+
+        return count_deltas
+
+    async def __remove_day_rows(self, filter_query: dict) -> Counter:
+        stored_counts = await self.__get_stored_counts(filter_query)
+
+        await self.product_daily_sales_collection.delete_many(filter_query)
+
+        count_deltas = Counter()
+        count_deltas.subtract(stored_counts)
+
+        return count_deltas
+
+    async def __get_stored_counts(self, filter_query: dict) -> Counter:
+        stored_counts = Counter()
+
+        async for db_row in self.product_daily_sales_collection.find(
+            filter_query, {"product_id": 1, "count": 1}
+        ):
+            stored_counts[db_row["product_id"]] += db_row["count"]
+
+        return stored_counts
+
+    async def __get_product_names(self, filter_query: dict) -> Dict[str, str]:
+        db_products = self.products_collection.find(filter_query, {"name": 1})
+
+        return {
+            db_product["_id"]: db_product["name"] async for db_product in db_products
+        }
+
+    def __increment(self, row_id: str, count: int, row: dict) -> UpdateOne:
+        return UpdateOne(
+            {"_id": row_id},
+            {"$inc": {"count": count}, "$setOnInsert": row},
+            upsert=True,
+        )
+
+    def __get_day_row_id(self, product_id: str, day_start: datetime) -> str:
+        return f"{product_id}:{day_start.strftime('%Y-%m-%d')}"
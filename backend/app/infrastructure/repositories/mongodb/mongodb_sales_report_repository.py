@@ -0,0 +1,71 @@
+from datetime import date, datetime, timezone
+from typing import Dict, List
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.application.repositories.sales_report_repository import (
+    SalesReportRepository,
+)
+from app.application.schemas.sales_report import SalesSummarySchema
+from .utils import get_date_filter
+
+
+class MongodbSalesReportRepository(SalesReportRepository):
+    def __init__(self, db: AsyncDatabase):
+        self.db = db
+        self.orders_collection = self.db["orders"]
+        self.report_partitions_collection = self.db["report_partitions"]
+
+    async def get_daily_summaries(
+        self, start_date: date, end_date: date
+    ) -> List[SalesSummarySchema]:
+        pipeline = [
+            {"$match": get_date_filter(start_date, end_date)},
+            {
+                "$group": {
+                    "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$date"}},
+                    "order_count": {"$sum": 1},
+                    "units_sold": {"$sum": {"$size": "$product_ids"}},
+                    "revenue": {"$sum": "$total"},
+                }
+            },
+            {"$sort": {"_id": 1}},
+        ]
+
+        summaries_cursor = await self.orders_collection.aggregate(pipeline)
+
+        return [
+            SalesSummarySchema(
+                period=date.fromisoformat(db_summary["_id"]),
+                order_count=db_summary["order_count"],
+                units_sold=db_summary["units_sold"],
+                revenue=db_summary["revenue"],
+            )
+            async for db_summary in summaries_cursor
+        ]
+
+    async def get_completed_partitions(
+        self, partition_ids: List[str]
+    ) -> Dict[str, List[SalesSummarySchema]]:
+        db_partitions = self.report_partitions_collection.find(
+            {"_id": {"$in": partition_ids}}
+        )
+
+        return {
+            db_partition["_id"]: [
+                SalesSummarySchema(**db_summary)
+                for db_summary in db_partition["summaries"]
+            ]
+            async for db_partition in db_partitions
+        }
+
+    async def complete_partition(
+        self, partition_id: str, summaries: List[SalesSummarySchema]
+    ) -> None:
+        await self.report_partitions_collection.replace_one(
+            {"_id": partition_id},
+            {
+                "summaries": [summary.model_dump(mode="json") for summary in summaries],
+                "completed_at": datetime.now(timezone.utc),
+            },
+            upsert=True,
+        )
@@ -0,0 +1,150 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime, timezone
+from typing import Any, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+from bson import json_util
+from bson.errors import BSONError
+from pymongo.asynchronous.collection import AsyncCollection
+
+from app.application.schemas.page import PageSchema
+from app.domain.exceptions.invalid_cursor_exception import InvalidCursorException
+
+
+def get_date_filter(
+    start_date: Optional[date], end_date: Optional[date], time_zone: str = "UTC"
+) -> dict:
+    start_datetime, end_datetime = get_date_bounds(start_date, end_date, time_zone)
+
+    if start_datetime and end_datetime:
+        return {"date": {"$gte": start_datetime, "$lte": end_datetime}}
+    elif start_datetime:
+        return {"date": {"$gte": start_datetime}}
+    elif end_datetime:
+        return {"date": {"$lte": end_datetime}}
+
+    return {}
+
+
+def get_date_bounds(
+    start_date: Optional[date], end_date: Optional[date], time_zone: str = "UTC"
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    start_datetime = (
+        to_utc(datetime.combine(start_date, datetime.min.time()), time_zone)
+        if start_date
+        else None
+    )
+    end_datetime = (
+        to_utc(datetime.combine(end_date, datetime.max.time()), time_zone)
+        if end_date
+        else None
+    )
+
+    return start_datetime, end_datetime
+
+
+def to_utc(value: datetime, time_zone: str) -> datetime:
+    if time_zone == "UTC":
+        return value
+
+    return (
+        value.replace(tzinfo=ZoneInfo(time_zone))
+        .astimezone(timezone.utc)
+        .replace(tzinfo=None)
+    )
+
+
+def get_day_start(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return datetime.combine(value.date(), datetime.min.time())
+
+
+async def find_page(
+    collection: AsyncCollection,
+    limit: int,
+    after: Optional[str],
+    fields: Optional[List[str]],
+    allowed_fields: List[str],
+    sort_by: str = "_id",
+) -> PageSchema:
+    filter_query = {}
+
+    if after:
+        last_id, last_value = decode_cursor(after, sort_by)
+
+        if sort_by == "_id":
+            filter_query = {"_id": {"$gt": last_id}}
+        else:
+            filter_query = {
+                "$or": [
+                    {sort_by: {"$gt": last_value}},
+                    {sort_by: last_value, "_id": {"$gt": last_id}},
+                ]
+            }
+
+    projected_fields = [
+        field for field in fields or allowed_fields if field in allowed_fields
+    ]
+    projection = {field: 1 for field in projected_fields}
+    projection[sort_by] = 1
+
+    sort = [("_id", 1)] if sort_by == "_id" else [(sort_by, 1), ("_id", 1)]
+
+    db_documents = (
+        await collection.find(filter_query, projection)
+        .sort(sort)
+        .limit(limit + 1)
+        .to_list(None)
+    )
+
+    next_cursor = None
+
+    if len(db_documents) > limit:
+        db_documents = db_documents[:limit]
+        last_document = db_documents[-1]
+        next_cursor = encode_cursor(
+            last_document["_id"], last_document[sort_by], sort_by
+        )
+
+    return PageSchema(
+        items=[
+            {
+                "id": db_document["_id"],
+                **{
+                    field: db_document[field]
+                    for field in projected_fields
+                    if field in db_document
+                },
+            }
+            for db_document in db_documents
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+def encode_cursor(last_id: Any, last_value: Any, sort_by: str) -> str:
+    return urlsafe_b64encode(
+        json_util.dumps(
+            {"sort_by": sort_by, "_id": last_id, "value": last_value}
+        ).encode()
+    ).decode()
+
+
+def decode_cursor(cursor: str, sort_by: str) -> Tuple[Any, Any]:
+    try:
+        last_values = json_util.loads(urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError, BSONError) as error:
+        raise InvalidCursorException("Invalid cursor") from error
+
+    if (
+        not isinstance(last_values, dict)
+        or "_id" not in last_values
+        or "value" not in last_values
+    ):
+        raise InvalidCursorException("Invalid cursor")
+
+    if last_values.get("sort_by") != sort_by:
+        raise InvalidCursorException(f"Cursor was not created for sort_by={sort_by}")
+
+    return last_values["_id"], last_values["value"]
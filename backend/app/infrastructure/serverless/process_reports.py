@@ -1,4 +1,115 @@
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+from time import perf_counter
+from typing import Optional
+from pymongo import AsyncMongoClient
+
+from app.application.file_storage.report_file_storage import ReportFileStorage
+from app.application.use_cases.dashboard.rebuild_daily_sales import (
+    RebuildDailySalesUseCase,
+)
+from app.application.use_cases.report.generate_sales_reports import (
+    GenerateSalesReportsUseCase,
+)
+from app.infrastructure.environment_configs import EnvironmentConfigs
+from app.infrastructure.file_storage.memory.memory_report_storage import (
+    MemoryReportFileStorage,
+)
+from app.infrastructure.file_storage.s3.s3_report_storage import S3ReportFileStorage
+from app.infrastructure.repositories.mongodb.mongodb_daily_sales_repository import (
+    MongodbDailySalesRepository,
+)
+from app.infrastructure.repositories.mongodb.mongodb_product_sales_repository import (
+    MongodbProductSalesRepository,
+)
+from app.infrastructure.repositories.mongodb.mongodb_sales_report_repository import (
+    MongodbSalesReportRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+env = EnvironmentConfigs()
+
+
 def process_reports(event, context):
-    # Logic here
+    event = event or {}
+    start_date = parse_date(event.get("start_date"))
+    end_date = parse_date(event.get("end_date"))
+
+    last_date = datetime.now(timezone.utc).date() - timedelta(days=1)
+    rebuild_start_date = start_date
+    rebuild_end_date = min(end_date or last_date, last_date)
+
+    if start_date is None and end_date is None:
+        rebuild_start_date = last_date - timedelta(
+            days=env.daily_sales_rebuild_days - 1
+        )
+
+    started_at = perf_counter()
+    rebuilt_days = (
+        asyncio.run(rebuild_daily_sales(rebuild_start_date, rebuild_end_date))
+        if rebuild_start_date is None or rebuild_start_date <= rebuild_end_date
+        else 0
+    )
+    rebuild_seconds = perf_counter() - started_at
+
+    reports = asyncio.run(
+        generate_sales_reports(start_date, end_date, bool(event.get("force")))
+    )
+    reports["stages"]["rebuild_daily_sales"] = round(rebuild_seconds, 3)
+
+    for stage, seconds in reports["stages"].items():
+        logger.info("process_reports stage %s took %.3fs", stage, seconds)
+
+    return {
+        "statusCode": 200,
+        "body": {"rebuilt_days": rebuilt_days, **reports},
+    }
+
+
+async def rebuild_daily_sales(
+    start_date: Optional[date], end_date: Optional[date]
+) -> int:
+    client = AsyncMongoClient(env.mongo_uri)
+
+    try:
+        db = client[env.mongo_db]
+        use_case = RebuildDailySalesUseCase(
+            MongodbDailySalesRepository(db), MongodbProductSalesRepository(db)
+        )
+
+        return await use_case.execute(start_date, end_date)
+    finally:
+        await client.close()
+
+
+async def generate_sales_reports(
+    start_date: Optional[date], end_date: Optional[date], force: bool = False
+) -> dict:
+    end_date = end_date or datetime.now(timezone.utc).date() - timedelta(days=1)
+    start_date = start_date or end_date.replace(month=1, day=1)
+
+    client = AsyncMongoClient(env.mongo_uri)
+
+    try:
+        use_case = GenerateSalesReportsUseCase(
+            MongodbSalesReportRepository(client[env.mongo_db]),
+            get_report_storage(),
+            env.reports_concurrency,
+        )
+
+        return await use_case.execute(start_date, end_date, force)
+    finally:
+        await client.close()
+
+
+def get_report_storage() -> ReportFileStorage:
+    if env.file_storage_backend == "memory":
+        return MemoryReportFileStorage()
+
+    return S3ReportFileStorage()
+
 
-    return {"statusCode": 200}
+def parse_date(value: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(value) if value else None
@@ -1,10 +1,65 @@
+import asyncio
+import io
+import json
+import os
 import typer
 import random
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
+from statistics import median, quantiles
+from time import perf_counter
+from typing import List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
 from faker import Faker
-from pymongo import MongoClient
-from bson.objectid import ObjectId
+from PIL import Image
+from fastapi.responses import ORJSONResponse
+from pymongo import AsyncMongoClient, MongoClient
 
+from app.application.schemas.image_file import File
+from app.application.schemas.order import OrderCreateSchema
+from app.application.use_cases.dashboard.rebuild_daily_sales import (
+    RebuildDailySalesUseCase,
+)
+from app.application.use_cases.order.backfill_order_items import (
+    BackfillOrderItemsUseCase,
+)
+from app.application.use_cases.order.create_order import CreateOrderUseCase
+from app.application.use_cases.order.delete_order import DeleteOrderUseCase
+from app.application.use_cases.product.delete_product import DeleteProductUseCase
+from app.application.use_cases.product.generate_product_image_variants import (
+    GenerateProductImageVariantsUseCase,
+)
+from app.infrastructure.analytics.numpy_order_analytics import NumpyOrderAnalytics
+from app.infrastructure.api import Api
+from app.infrastructure.api.container import Container
+from app.infrastructure.database.mongodb_indexes import (
+    MONGO_INDEXES,
+    create_indexes,
+    get_collection_scans,
+)
 from app.infrastructure.environment_configs import EnvironmentConfigs
+from app.infrastructure.repositories.mongodb.mappers import to_order
+from app.infrastructure.repositories.mongodb.mongodb_daily_sales_repository import (
+    MongodbDailySalesRepository,
+)
+from app.infrastructure.repositories.mongodb.mongodb_order_repository import (
+    MongodbOrderRepository,
+)
+from app.infrastructure.repositories.mongodb.mongodb_product_repository import (
+    MongodbProductRepository,
+)
+from app.infrastructure.repositories.mongodb.mongodb_product_sales_repository import (
+    MongodbProductSalesRepository,
+)
+from app.infrastructure.serverless.process_reports import (
+    generate_sales_reports,
+    parse_date,
+    rebuild_daily_sales,
+)
 
 fake = Faker()
 app = typer.Typer()
@@ -16,62 +71,963 @@ categories_collection = db["categories"]
 products_collection = db["products"]
 orders_collection = db["orders"]
 
+MONTH_SEASONALITY = [0.8, 0.7, 0.85, 0.9, 1.0, 0.95, 0.9, 1.0, 1.05, 1.15, 1.6, 2.0]
+WEEKDAY_SEASONALITY = [0.9, 0.9, 0.95, 1.0, 1.2, 1.4, 1.1]
 
-def generate_categories(n=5):
+worker_state = {}
+
+
+def generate_id(rng: random.Random) -> str:
+    return "%024x" % rng.getrandbits(96)
+
+
+def generate_categories(n=5, rng=random, database=db):
     categories = []
     for _ in range(n):
-        category = {"_id": str(ObjectId()), "name": fake.word().capitalize()}
+        category = {"_id": generate_id(rng), "name": fake.word().capitalize()}
         categories.append(category)
-    categories_collection.insert_many(categories)
+    database["categories"].insert_many(categories)
     return categories
 
 
-def generate_products(n=20, categories=[]):
+def generate_products(n=20, categories=[], rng=random, database=db):
     products = []
     for _ in range(n):
-        category_ids = random.sample(
-            [c["_id"] for c in categories], k=random.randint(1, 2)
-        )
+        category_ids = rng.sample([c["_id"] for c in categories], k=rng.randint(1, 2))
         product = {
-            "_id": str(ObjectId()),
+            "_id": generate_id(rng),
             "name": fake.word().capitalize(),
             "description": fake.sentence(),
-            "price": round(random.uniform(5, 500), 2),
+            "price": round(rng.uniform(5, 500), 2),
             "category_ids": category_ids,
             "image_url": fake.image_url(),
         }
         products.append(product)
-    products_collection.insert_many(products)
+    database["products"].insert_many(products)
     return products
 
 
-def generate_orders(n=10, products=[]):
+def init_orders_worker(products, seed, start_date, zipf_exponent, database_name):
+    popularity = [1 / (rank**zipf_exponent) for rank in range(1, len(products) + 1)]
+    days = [start_date + timedelta(days=offset) for offset in range(365)]
+    seasonality = [
+        MONTH_SEASONALITY[day.month - 1] * WEEKDAY_SEASONALITY[day.weekday()]
+        for day in days
+    ]
+
+    worker_state["database"] = MongoClient(env.mongo_uri)[database_name]
+    worker_state["products"] = products
+    worker_state["product_weights"] = list(accumulate(popularity))
+    worker_state["days"] = days
+    worker_state["day_weights"] = list(accumulate(seasonality))
+    worker_state["seed"] = seed
+
+
+def generate_orders_batch(batch_index, batch_size):
+    rng = random.Random(f"{worker_state['seed']}-orders-{batch_index}")
+    products = worker_state["products"]
+
     orders = []
-    for _ in range(n):
-        selected_products = random.sample(products, k=random.randint(1, 5))
-        product_ids = [p["_id"] for p in selected_products]
-        total = sum(p["price"] for p in selected_products)
+    for _ in range(batch_size):
+        products_len = min(rng.randint(1, 5), len(products))
+        selected_products = {}
+
+        while len(selected_products) < products_len:
+            product = rng.choices(
+                products, cum_weights=worker_state["product_weights"]
+            )[0]
+            selected_products[product["_id"]] = product
+
+        day = rng.choices(
+            worker_state["days"], cum_weights=worker_state["day_weights"]
+        )[0]
         order = {
-            "_id": str(ObjectId()),
-            "date": fake.date_time_between(start_date="-1y", end_date="now"),
-            "product_ids": product_ids,
-            "total": round(total, 2),
+            "_id": generate_id(rng),
+            "date": day
+            + timedelta(hours=rng.triangular(8, 23, 19), seconds=rng.randint(0, 59)),
+            "product_ids": list(selected_products),
+            "total": round(sum(p["price"] for p in selected_products.values()), 2),
+            "items": [
+                {
+                    "product_id": p["_id"],
+                    "price": p["price"],
+                    "category_ids": p["category_ids"],
+                }
+                for p in selected_products.values()
+            ],
         }
         orders.append(order)
-    orders_collection.insert_many(orders)
-    return orders
+
+    worker_state["database"]["orders"].insert_many(orders, ordered=False)
+
+    return batch_size
+
+
+def generate_orders(
+    n=10,
+    products=[],
+    batch_size=10000,
+    workers=1,
+    seed=None,
+    database_name=env.mongo_db,
+):
+    popular_products = random.Random(f"{seed}-popularity").sample(
+        [
+            {"_id": p["_id"], "price": p["price"], "category_ids": p["category_ids"]}
+            for p in products
+        ],
+        k=len(products),
+    )
+    start_date = datetime.combine(date.today() - timedelta(days=364), time.min)
+
+    batch_sizes = [min(batch_size, n - offset) for offset in range(0, n, batch_size)]
+
+    inserted = 0
+    started_at = perf_counter()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_orders_worker,
+        initargs=(popular_products, seed, start_date, 1.1, database_name),
+    ) as executor:
+        for batch_inserted in executor.map(
+            generate_orders_batch, range(len(batch_sizes)), batch_sizes
+        ):
+            inserted += batch_inserted
+            elapsed = perf_counter() - started_at
+            typer.echo(
+                f"Inserted {inserted}/{n} orders ({inserted / elapsed:.0f} docs/sec)"
+            )
+
+    return inserted
 
 
 @app.command()
-def populate_db(categories: int = 5, products: int = 20, orders: int = 10):
+def populate_db(
+    categories: int = 5,
+    products: int = 20,
+    orders: int = 10,
+    batch_size: int = 10000,
+    workers: int = os.cpu_count() or 1,
+    seed: Optional[int] = None,
+):
+    if seed is None:
+        seed = random.randrange(2**32)
+
+    Faker.seed(seed)
+    rng = random.Random(seed)
+
+    typer.echo(f"Using seed {seed}")
+
     typer.echo("Generating categories...")
-    cats = generate_categories(categories)
+    cats = generate_categories(categories, rng)
     typer.echo("Generating products...")
-    prods = generate_products(products, cats)
+    prods = generate_products(products, cats, rng)
     typer.echo("Generating orders...")
-    generate_orders(orders, prods)
+    generate_orders(orders, prods, batch_size, workers, seed)
+    typer.echo("Rebuilding daily sales...")
+    asyncio.run(rebuild_daily_sales(None, None))
     typer.echo("Database successfully populated!")
 
 
+@app.command()
+def rebuild_daily_sales_rollup(
+    start_date: Optional[str] = None, end_date: Optional[str] = None
+):
+    rebuilt_days = asyncio.run(
+        rebuild_daily_sales(
+            start_date=parse_date(start_date),
+            end_date=parse_date(end_date),
+        )
+    )
+    typer.echo(f"Daily sales rebuilt for {rebuilt_days} days!")
+
+
+@app.command()
+def generate_reports(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    force: bool = False,
+):
+    reports = asyncio.run(
+        generate_sales_reports(
+            start_date=parse_date(start_date),
+            end_date=parse_date(end_date),
+            force=force,
+        )
+    )
+
+    for partition_id, status in reports["partitions"].items():
+        typer.echo(f"{partition_id} {status}")
+
+    for summary_key in reports["summaries"]:
+        typer.echo(f"{summary_key} generated")
+
+    for stage, seconds in reports["stages"].items():
+        typer.echo(f"{stage}: {seconds:.3f}s")
+
+
+@app.command()
+def backfill_order_items(batch_size: int = 1000):
+    async def run():
+        async_client = AsyncMongoClient(env.mongo_uri)
+
+        try:
+            async_db = async_client[env.mongo_db]
+            use_case = BackfillOrderItemsUseCase(
+                MongodbOrderRepository(async_db),
+                MongodbProductRepository(async_db),
+                batch_size,
+            )
+
+            return await use_case.execute()
+        finally:
+            await async_client.close()
+
+    backfilled_orders = asyncio.run(run())
+    typer.echo(f"Backfilled line items for {backfilled_orders} orders!")
+
+
+@app.command()
+def create_db_indexes():
+    async def run():
+        async_client = AsyncMongoClient(env.mongo_uri)
+
+        try:
+            await create_indexes(async_client[env.mongo_db])
+        finally:
+            await async_client.close()
+
+    asyncio.run(run())
+
+    for mongo_index in MONGO_INDEXES:
+        typer.echo(f"{mongo_index.collection}.{mongo_index.name} {mongo_index.keys}")
+
+        for query in mongo_index.queries:
+            typer.echo(f"  serves {query.repository_method}")
+
+    typer.echo("Indexes successfully created!")
+
+
+@app.command()
+def check_db_indexes():
+    async def run():
+        async_client = AsyncMongoClient(env.mongo_uri)
+
+        try:
+            return await get_collection_scans(async_client[env.mongo_db])
+        finally:
+            await async_client.close()
+
+    collection_scans = asyncio.run(run())
+
+    for collection_scan in collection_scans:
+        typer.echo(f"COLLSCAN: {collection_scan}", err=True)
+
+    if len(collection_scans) > 0:
+        raise typer.Exit(code=1)
+
+    typer.echo("All indexed queries use an index!")
+
+
+@app.command()
+def benchmark_dashboard(
+    runs: int = 20,
+    granularity: str = "day",
+    top_products_limit: int = 5,
+    seed: Optional[int] = None,
+    orders: List[int] = typer.Option([]),
+    categories: int = 20,
+    products: int = 2000,
+    batch_size: int = 10000,
+    workers: int = os.cpu_count() or 1,
+):
+    if seed is None:
+        seed = random.randrange(2**32)
+
+    typer.echo(f"Using seed {seed}")
+
+    if len(orders) == 0:
+        mismatches = compare_dashboard_sources(
+            env.mongo_db, runs, granularity, top_products_limit, seed
+        )
+    else:
+        database_name = f"{env.mongo_db}_benchmark"
+        mismatches = []
+
+        for orders_count in orders:
+            typer.echo(f"Seeding {orders_count} orders into {database_name}...")
+            seed_benchmark_database(
+                database_name,
+                categories,
+                products,
+                orders_count,
+                batch_size,
+                workers,
+                seed,
+            )
+            mismatches += compare_dashboard_sources(
+                database_name, runs, granularity, top_products_limit, seed
+            )
+
+        client.drop_database(database_name)
+
+    for start_date, end_date in mismatches:
+        typer.echo(f"MISMATCH: {start_date} - {end_date}", err=True)
+
+    if len(mismatches) > 0:
+        raise typer.Exit(code=1)
+
+
+def seed_benchmark_database(
+    database_name: str,
+    categories: int,
+    products: int,
+    orders: int,
+    batch_size: int,
+    workers: int,
+    seed: int,
+):
+    client.drop_database(database_name)
+    database = client[database_name]
+
+    Faker.seed(seed)
+    rng = random.Random(seed)
+
+    cats = generate_categories(categories, rng, database)
+    prods = generate_products(products, cats, rng, database)
+    generate_orders(orders, prods, batch_size, workers, seed, database_name)
+
+    async def run():
+        async_client = AsyncMongoClient(env.mongo_uri)
+
+        try:
+            async_db = async_client[database_name]
+            await create_indexes(async_db)
+            await RebuildDailySalesUseCase(
+                MongodbDailySalesRepository(async_db),
+                MongodbProductSalesRepository(async_db),
+            ).execute(None, None)
+        finally:
+            await async_client.close()
+
+    asyncio.run(run())
+
+
+def compare_dashboard_sources(
+    database_name: str,
+    runs: int,
+    granularity: str,
+    top_products_limit: int,
+    seed: int,
+) -> List[Tuple[date, date]]:
+    database_orders = client[database_name]["orders"]
+    first_order = database_orders.find_one({}, {"date": 1}, sort=[("date", 1)])
+    last_order = database_orders.find_one({}, {"date": 1}, sort=[("date", -1)])
+
+    if first_order is None:
+        typer.echo("No orders to benchmark!", err=True)
+        raise typer.Exit(code=1)
+
+    rng = random.Random(seed)
+    first_date = first_order["date"].date()
+    span_days = (last_order["date"].date() - first_date).days
+
+    date_ranges = []
+
+    for _ in range(runs):
+        start_date = first_date + timedelta(days=rng.randint(0, span_days))
+        end_date = start_date + timedelta(
+            days=rng.randint(0, (first_date - start_date).days + span_days)
+        )
+        date_ranges.append((start_date, end_date))
+
+    async def run():
+        async_client = AsyncMongoClient(env.mongo_uri)
+
+        try:
+            async_db = async_client[database_name]
+            orders_count = await async_db["orders"].estimated_document_count()
+
+            started_at = perf_counter()
+            await NumpyOrderAnalytics().load(async_db)
+            typer.echo(
+                f"{orders_count} orders, numpy: loaded in "
+                f"{perf_counter() - started_at:.2f}s"
+            )
+
+            results = {}
+
+            for source in ["facet", "rollup", "numpy"]:
+                order_repository = MongodbOrderRepository(async_db, source)
+                durations = []
+                results[source] = []
+
+                for start_date, end_date in date_ranges:
+                    started_at = perf_counter()
+                    metrics = await order_repository.get_metrics(
+                        start_date, end_date, top_products_limit, granularity, "UTC"
+                    )
+                    durations.append((perf_counter() - started_at) * 1000)
+                    results[source].append(
+                        (metrics.total_orders, round(metrics.total_revenue, 2))
+                    )
+
+                p95 = quantiles(durations, n=20)[-1] if len(durations) > 1 else 0
+                typer.echo(
+                    f"{orders_count} orders, {source}: "
+                    f"median {median(durations):.1f} ms, p95 {p95:.1f} ms"
+                )
+
+            return [
+                date_range
+                for date_range, facet, numpy in zip(
+                    date_ranges, results["facet"], results["numpy"]
+                )
+                if facet != numpy
+            ]
+        finally:
+            await NumpyOrderAnalytics().close()
+            NumpyOrderAnalytics._instance = None
+            await async_client.close()
+
+    return asyncio.run(run())
+
+
+@app.command()
+def benchmark_orders(runs: int = 3):
+    async def load_and_serialize(order_repository: MongodbOrderRepository):
+        started_at = perf_counter()
+        orders = await order_repository.get_all()
+        loaded_at = perf_counter()
+        body = ORJSONResponse(orders).body
+
+        return (
+            len(orders),
+            len(body),
+            loaded_at - started_at,
+            perf_counter() - loaded_at,
+        )
+
+    async def run():
+        async_client = AsyncMongoClient(env.mongo_uri)
+
+        try:
+            order_repository = MongodbOrderRepository(async_client[env.mongo_db])
+            load_durations = []
+            serialize_durations = []
+
+            for _ in range(runs):
+                orders_count, body_size, load_duration, serialize_duration = (
+                    await load_and_serialize(order_repository)
+                )
+                load_durations.append(load_duration)
+                serialize_durations.append(serialize_duration)
+
+            tracemalloc.start()
+            await load_and_serialize(order_repository)
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            typer.echo(
+                f"{orders_count} orders, {body_size / 1e6:.1f} MB response: "
+                f"load median {median(load_durations):.2f}s, "
+                f"serialize median {median(serialize_durations):.2f}s, "
+                f"peak memory {peak_memory / 1e6:.1f} MB"
+            )
+        finally:
+            await async_client.close()
+
+    asyncio.run(run())
+
+
+@app.command()
+def benchmark_order_create(
+    cart_sizes: List[int] = typer.Option([1, 5, 50], "--cart-size"),
+    orders: int = 1000,
+    concurrency: int = 16,
+    seed: Optional[int] = None,
+):
+    product_ids = [
+        db_product["_id"] for db_product in products_collection.find({}, {"_id": 1})
+    ]
+
+    if len(product_ids) < max(cart_sizes):
+        typer.echo(f"At least {max(cart_sizes)} products are needed!", err=True)
+        raise typer.Exit(code=1)
+
+    rng = random.Random(seed)
+
+    async def run():
+        container = Container()
+
+        try:
+            create_use_case = CreateOrderUseCase(
+                container.order_repository,
+                container.product_repository,
+                container.daily_sales_repository,
+                container.product_sales_repository,
+                container.metrics_cache,
+                container.product_items_cache,
+                container.analytics,
+            )
+            delete_use_case = DeleteOrderUseCase(
+                container.order_repository,
+                container.daily_sales_repository,
+                container.product_sales_repository,
+                container.metrics_cache,
+                container.analytics,
+            )
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def create(cart: List[str]):
+                async with semaphore:
+                    started_at = perf_counter()
+                    order = await create_use_case.execute(
+                        OrderCreateSchema(product_ids=cart)
+                    )
+
+                    return order.id, (perf_counter() - started_at) * 1000
+
+            for cart_size in cart_sizes:
+                carts = [rng.sample(product_ids, k=cart_size) for _ in range(orders)]
+                stats = container.product_items_cache.get_stats()
+
+                started_at = perf_counter()
+                results = await asyncio.gather(*(create(cart) for cart in carts))
+                elapsed = perf_counter() - started_at
+
+                durations = [duration for _, duration in results]
+                cache_stats = container.product_items_cache.get_stats()
+
+                typer.echo(
+                    f"{cart_size} items: {orders / elapsed:.0f} orders/sec, "
+                    f"median {median(durations):.1f} ms, "
+                    f"p99 {get_p99(durations):.1f} ms, "
+                    f"cache hits {cache_stats['hits'] - stats['hits']}, "
+                    f"misses {cache_stats['misses'] - stats['misses']}"
+                )
+
+                for order_id, _ in results:
+                    await delete_use_case.execute(order_id)
+        finally:
+            await container.close()
+
+    asyncio.run(run())
+
+
+@app.command()
+def benchmark_load(
+    base_url: str = "http://localhost:8000",
+    requests: int = 2000,
+    concurrency: int = 32,
+    dashboard_share: float = 0.1,
+    write_share: float = 0.1,
+    seed: Optional[int] = None,
+):
+    first_order = orders_collection.find_one({}, {"date": 1}, sort=[("date", 1)])
+    last_order = orders_collection.find_one({}, {"date": 1}, sort=[("date", -1)])
+    product_ids = [
+        db_product["_id"] for db_product in products_collection.find({}, {"_id": 1})
+    ]
+
+    if first_order is None or len(product_ids) == 0:
+        typer.echo("No orders to benchmark!", err=True)
+        raise typer.Exit(code=1)
+
+    rng = random.Random(seed)
+    first_date = first_order["date"].date()
+    span_days = (last_order["date"].date() - first_date).days
+    order_ids = [
+        db_order["_id"]
+        for db_order in orders_collection.aggregate(
+            [{"$sample": {"size": 1000}}, {"$project": {"_id": 1}}]
+        )
+    ]
+
+    plan = []
+
+    for _ in range(requests):
+        roll = rng.random()
+
+        if roll < dashboard_share:
+            start_date = first_date + timedelta(days=rng.randint(0, span_days))
+            end_date = start_date + timedelta(
+                days=rng.randint(0, (first_date - start_date).days + span_days)
+            )
+            plan.append(
+                (
+                    "dashboard",
+                    "GET",
+                    f"/dashboard?start_date={start_date}&end_date={end_date}",
+                    None,
+                )
+            )
+        elif roll < dashboard_share + write_share:
+            order_product_ids = rng.sample(
+                product_ids, k=rng.randint(1, min(5, len(product_ids)))
+            )
+            plan.append(
+                (
+                    "create order",
+                    "POST",
+                    "/orders",
+                    json.dumps({"product_ids": order_product_ids}).encode(),
+                )
+            )
+        else:
+            plan.append(
+                rng.choice(
+                    [
+                        ("get order", "GET", f"/orders/{rng.choice(order_ids)}", None),
+                        ("orders page", "GET", "/orders?limit=50", None),
+                        ("products page", "GET", "/products?limit=50", None),
+                    ]
+                )
+            )
+
+    def send(request):
+        kind, method, path, body = request
+        http_request = Request(
+            base_url + path,
+            data=body,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        started_at = perf_counter()
+
+        try:
+            with urlopen(http_request) as response:
+                response.read()
+        except (HTTPError, URLError):
+            return kind, None
+
+        return kind, (perf_counter() - started_at) * 1000
+
+    started_at = perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(send, plan))
+
+    elapsed = perf_counter() - started_at
+    durations = {}
+    errors = 0
+
+    for kind, duration in results:
+        if duration is None:
+            errors += 1
+        else:
+            durations.setdefault(kind, []).append(duration)
+
+    for kind, kind_durations in sorted(durations.items()):
+        typer.echo(
+            f"{kind}: {len(kind_durations)} requests, "
+            f"median {median(kind_durations):.1f} ms, "
+            f"p99 {get_p99(kind_durations):.1f} ms"
+        )
+
+    all_durations = [duration for _, duration in results if duration is not None]
+
+    if len(all_durations) == 0:
+        typer.echo(f"All {errors} requests failed!", err=True)
+        raise typer.Exit(code=1)
+
+    typer.echo(
+        f"all: {len(results) / elapsed:.0f} requests/sec, "
+        f"p99 {get_p99(all_durations):.1f} ms, {errors} errors"
+    )
+
+
+@app.command()
+def benchmark_overhead(
+    paths: List[str] = typer.Option(["/health", "/dashboard/cache"], "--path"),
+    requests: int = 3000,
+    warmup: int = 200,
+):
+    api = Api().app
+
+    async def send_request(path: str) -> int:
+        route, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": route,
+            "raw_path": route.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [(b"host", b"benchmark")],
+            "client": ("127.0.0.1", 0),
+            "server": ("benchmark", 80),
+        }
+        response = {}
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+
+        await api(scope, receive, send)
+
+        return response["status"]
+
+    async def run():
+        async with api.router.lifespan_context(api):
+            for path in paths:
+                for _ in range(warmup):
+                    await send_request(path)
+
+                durations = []
+                statuses = Counter()
+
+                for _ in range(requests):
+                    started_at = perf_counter()
+                    statuses[await send_request(path)] += 1
+                    durations.append((perf_counter() - started_at) * 1e6)
+
+                typer.echo(
+                    f"{path}: median {median(durations):.0f} us, "
+                    f"p99 {get_p99(durations):.0f} us, "
+                    f"statuses {dict(statuses)}"
+                )
+
+    asyncio.run(run())
+
+
+@app.command()
+def benchmark_product_delete(
+    orders: int = 100000,
+    batch_size: int = 10000,
+    image_size: int = 1024 * 1024,
+    seed: Optional[int] = None,
+):
+    products = list(
+        products_collection.find({}, {"price": 1, "category_ids": 1}).limit(100)
+    )
+    category_ids = [
+        db_category["_id"] for db_category in categories_collection.find({}, {"_id": 1})
+    ]
+
+    if len(products) == 0 or len(category_ids) == 0:
+        typer.echo("No products to benchmark!", err=True)
+        raise typer.Exit(code=1)
+
+    rng = random.Random(seed)
+    start_date = datetime.combine(date.today() - timedelta(days=364), time.min)
+    product = {
+        "_id": generate_id(rng),
+        "name": "Benchmark product",
+        "description": fake.sentence(),
+        "price": round(rng.uniform(5, 500), 2),
+        "category_ids": rng.sample(category_ids, k=min(2, len(category_ids))),
+        "image_url": None,
+        "image_version": generate_id(rng),
+    }
+
+    async def run():
+        container = Container()
+
+        try:
+            async_db = container.mongo_database.get_database()
+            product["image_url"] = await container.product_image_storage.put(
+                product["_id"], File(generate_image(image_size, rng), "image/png")
+            )
+            await async_db["products"].insert_one(product)
+            await GenerateProductImageVariantsUseCase(
+                container.product_repository,
+                container.product_image_storage,
+                container.image_processor,
+            ).execute(product["_id"], product["image_version"])
+
+            for offset in range(0, orders, batch_size):
+                db_orders = []
+
+                for _ in range(min(batch_size, orders - offset)):
+                    order_products = [product] + rng.sample(
+                        products, k=rng.randint(0, min(4, len(products)))
+                    )
+                    db_orders.append(
+                        {
+                            "_id": generate_id(rng),
+                            "date": start_date
+                            + timedelta(seconds=rng.randint(0, 365 * 86400 - 1)),
+                            "product_ids": [p["_id"] for p in order_products],
+                            "total": round(sum(p["price"] for p in order_products), 2),
+                            "items": [
+                                {
+                                    "product_id": p["_id"],
+                                    "price": p["price"],
+                                    "category_ids": p["category_ids"],
+                                }
+                                for p in order_products
+                            ],
+                        }
+                    )
+
+                await async_db["orders"].insert_many(db_orders, ordered=False)
+                await container.daily_sales_repository.add_orders(
+                    [to_order(db_order) for db_order in db_orders]
+                )
+                await container.product_sales_repository.add_orders(
+                    [to_order(db_order) for db_order in db_orders]
+                )
+                typer.echo(f"Inserted {offset + len(db_orders)}/{orders} orders")
+
+            use_case = DeleteProductUseCase(
+                container.product_repository,
+                container.order_repository,
+                container.daily_sales_repository,
+                container.product_sales_repository,
+                container.product_image_storage,
+                container.metrics_cache,
+                container.product_items_cache,
+                container.analytics,
+            )
+
+            started_at = perf_counter()
+            await use_case.execute(product["_id"])
+            duration = perf_counter() - started_at
+
+            remaining_orders = await async_db["orders"].count_documents(
+                {"product_ids": product["_id"]}
+            )
+
+            typer.echo(
+                f"Deleted a product referenced by {orders} orders in "
+                f"{duration:.3f}s, {remaining_orders} orders still reference it"
+            )
+
+            return remaining_orders
+        finally:
+            await container.close()
+
+    if asyncio.run(run()) > 0:
+        raise typer.Exit(code=1)
+
+
+def generate_image(size: int, rng: random.Random) -> bytes:
+    side = max(1, int((size / 3) ** 0.5))
+    image = Image.frombytes("RGB", (side, side), rng.randbytes(side * side * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=0)
+
+    return buffer.getvalue()
+
+
+@app.command()
+def benchmark_product_create(
+    base_url: str = "http://localhost:8000",
+    products: int = 200,
+    concurrency: int = 16,
+    image_size: int = 1024 * 1024,
+    cleanup: bool = True,
+    seed: Optional[int] = None,
+):
+    category_ids = [
+        db_category["_id"] for db_category in categories_collection.find({}, {"_id": 1})
+    ]
+
+    if len(category_ids) == 0:
+        typer.echo("No categories to benchmark!", err=True)
+        raise typer.Exit(code=1)
+
+    rng = random.Random(seed)
+    images = [generate_image(image_size, rng) for _ in range(min(products, 8))]
+    bodies = [
+        encode_multipart(
+            {
+                "name": fake.word().capitalize(),
+                "description": fake.sentence(),
+                "price": str(round(rng.uniform(5, 500), 2)),
+                "category_ids": json.dumps(
+                    rng.sample(category_ids, k=min(2, len(category_ids)))
+                ),
+            },
+            ("image", "image.png", "image/png", images[index % len(images)]),
+        )
+        for index in range(products)
+    ]
+
+    def create(body):
+        content, content_type = body
+        request = Request(
+            f"{base_url}/products",
+            data=content,
+            method="POST",
+            headers={"Content-Type": content_type},
+        )
+        started_at = perf_counter()
+
+        try:
+            with urlopen(request) as response:
+                product_id = json.loads(response.read())["id"]
+        except (HTTPError, URLError):
+            return None, None
+
+        return product_id, (perf_counter() - started_at) * 1000
+
+    started_at = perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(create, bodies))
+
+    elapsed = perf_counter() - started_at
+    durations = [duration for _, duration in results if duration is not None]
+    product_ids = [product_id for product_id, _ in results if product_id is not None]
+
+    def delete(product_id):
+        request = Request(f"{base_url}/products/{product_id}", method="DELETE")
+
+        try:
+            urlopen(request).close()
+        except (HTTPError, URLError):
+            typer.echo(f"Could not delete product {product_id}", err=True)
+
+    if cleanup:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(delete, product_ids))
+
+    if len(durations) == 0:
+        typer.echo(f"All {products} requests failed!", err=True)
+        raise typer.Exit(code=1)
+
+    typer.echo(
+        f"{len(durations)} products with {image_size / 1e6:.1f} MB images: "
+        f"{len(durations) / elapsed:.1f} products/sec, "
+        f"median {median(durations):.1f} ms, p99 {get_p99(durations):.1f} ms, "
+        f"{products - len(durations)} errors"
+    )
+
+
+def encode_multipart(fields: dict, file: tuple) -> Tuple[bytes, str]:
+    boundary = f"benchmark{random.getrandbits(64):016x}"
+    field_name, file_name, content_type, content = file
+    parts = [
+        (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"'
+            f"\r\n\r\n{value}\r\n"
+        ).encode()
+        for name, value in fields.items()
+    ]
+    parts.append(
+        (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{field_name}"; '
+            f'filename="{file_name}"\r\nContent-Type: {content_type}\r\n\r\n'
+        ).encode()
+        + content
+        + f"\r\n--{boundary}--\r\n".encode()
+    )
+
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+def get_p99(values: List[float]) -> float:
+    return quantiles(values, n=100)[-1] if len(values) > 1 else values[0]
+
+
 if __name__ == "__main__":
     app()
@@ -5,8 +5,9 @@ export interface Product {
   price: number;
   category_ids: string[];
   image_url: string;
+  image_variants: Record<string, string>;
 }
 
-export type CreateProductProps = Omit<Product, "id" | "image_url">;
+export type CreateProductProps = Omit<Product, "id" | "image_url" | "image_variants">;
 
 export type UpdateProductProps = Partial<CreateProductProps>;